@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Benchmark the vectorized DCA safety-order ladder against a per-bot loop.
+
+Generates synthetic bot configurations and computes what
+get_dca_capital_requirements needs (worst-case funds, deviation and average
+entry per bot, optionally the full ladder) both ways the tool can:
+
+- loop:  one bot at a time in plain Python
+- numpy: all bots on one (bots x orders) NumPy grid
+
+Both paths are checked against a reference loop and against each other,
+then timed end to end, including converting results back to Python lists.
+"speedup" is loop ms / numpy ms. The tool uses the NumPy path from
+VECTORIZE_MIN_ORDERS safety orders in total (printed below); the "tool"
+column shows which path it takes for each fleet size.
+No API credentials are required.
+
+Usage:
+    python scripts/benchmark_dca_ladder.py [bots ...]
+
+Examples:
+    python scripts/benchmark_dca_ladder.py
+    python scripts/benchmark_dca_ladder.py 100 1000 10000
+"""
+
+import random
+import sys
+import time
+from functools import partial
+from pathlib import Path
+
+# Add project to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from threecommas_mcp.utils.dca_ladder import (
+    VECTORIZE_MIN_ORDERS,
+    _loop_requirements,
+    _vectorized_requirements,
+)
+
+
+def make_bots(count: int, seed: int = 42) -> list[dict]:
+    """Generate synthetic bot configurations with realistic parameter ranges."""
+    rnd = random.Random(seed)
+    return [
+        {
+            "id": i,
+            "strategy": "short" if rnd.random() < 0.2 else "long",
+            "base_order_volume": str(rnd.choice([10, 20, 50, 100])),
+            "safety_order_volume": str(rnd.choice([10, 20, 50, 100, 200])),
+            "martingale_volume_coefficient": str(round(rnd.uniform(1.0, 2.0), 2)),
+            "martingale_step_coefficient": str(round(rnd.uniform(1.0, 1.5), 2)),
+            "safety_order_step_percentage": str(round(rnd.uniform(0.5, 3.0), 2)),
+            "max_safety_orders": rnd.randint(0, 25),
+            "max_active_deals": rnd.randint(1, 5),
+        }
+        for i in range(count)
+    ]
+
+
+def reference_ladders(bots: list[dict]) -> list[list[tuple[float, float, float]]]:
+    """Reference implementation: full ladder bot by bot.
+
+    Each ladder entry is (deviation percent, cumulative funds, average entry).
+    """
+    ladders = []
+    for bot in bots:
+        base = float(bot["base_order_volume"])
+        volume = float(bot["safety_order_volume"])
+        mvc = float(bot["martingale_volume_coefficient"])
+        msc = float(bot["martingale_step_coefficient"])
+        step = float(bot["safety_order_step_percentage"])
+        direction = 1.0 if bot["strategy"] == "short" else -1.0
+        funds, amount, deviation, step_size = base, base, 0.0, step
+        ladder = []
+        for _ in range(int(bot["max_safety_orders"])):
+            deviation += step_size
+            price = 1.0 + direction * deviation / 100.0
+            funds += volume
+            amount += volume / price if price > 0 else 0.0
+            ladder.append((deviation, funds, funds / amount))
+            volume *= mvc
+            step_size *= msc
+        ladders.append(ladder)
+    return ladders
+
+
+def check(bots: list[dict]) -> None:
+    """Assert both tool paths match the reference ladders and each other."""
+    expected = reference_ladders(bots)
+    loop = _loop_requirements(bots, include_ladder=True)
+    numpy = _vectorized_requirements(bots, include_ladder=True)
+    assert loop.per_deal == numpy.per_deal
+    assert loop.max_deviation == numpy.max_deviation
+    assert loop.worst_average == numpy.worst_average
+    for result in (loop, numpy):
+        assert result.ladders is not None
+        deviation, _, _, funds, average = result.ladders
+        for i, ladder in enumerate(expected):
+            actual = zip(deviation[i], funds[i], average[i])
+            for row_a, row_b in zip(ladder, actual):
+                for a, b in zip(row_a, row_b):
+                    assert abs(a - b) <= 1e-6 * max(1.0, abs(a)), (a, b)
+
+
+def bench(func, bots: list[dict], repeat: int = 5) -> float:
+    """Return the best wall time of several runs in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(bots)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(sizes: list[int]) -> None:
+    print(f"Tool uses NumPy from {VECTORIZE_MIN_ORDERS} safety orders in total")
+    print(
+        f"{'bots':>8} {'orders':>8} {'loop ms':>9} {'numpy ms':>9} {'speedup':>8} "
+        f"{'ladder loop':>12} {'ladder numpy':>13} {'speedup':>8} {'tool':>6}"
+    )
+    for size in sizes:
+        bots = make_bots(size)
+        check(bots)
+        orders = sum(bot["max_safety_orders"] for bot in bots)
+        timings = [
+            bench(partial(path, include_ladder=include_ladder), bots)
+            for include_ladder in (False, True)
+            for path in (_loop_requirements, _vectorized_requirements)
+        ]
+        loop_ms, numpy_ms, ladder_loop_ms, ladder_numpy_ms = timings
+        tool = "numpy" if orders >= VECTORIZE_MIN_ORDERS else "loop"
+        print(
+            f"{size:>8} {orders:>8} {loop_ms:>9.2f} {numpy_ms:>9.2f} "
+            f"{loop_ms / numpy_ms:>7.2f}x {ladder_loop_ms:>12.2f} "
+            f"{ladder_numpy_ms:>13.2f} {ladder_loop_ms / ladder_numpy_ms:>7.2f}x "
+            f"{tool:>6}"
+        )
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]] or [10, 30, 100, 1000, 5000]
+    main(args)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Benchmark small-call latency while large market_pairs responses are handled.
+
+Starts a local stand-in for the 3Commas API whose market_pairs endpoint
+returns a large pair list, then runs the MCP server in-process with two
+kinds of concurrent clients:
+
+- large: get_all_market_pairs in a loop (decode and filter of megabytes)
+- small: get_dca_bot_list in a loop (a few hundred bytes)
+
+The same load runs with each execution policy for response decoding and
+filtering:
+
+- inline:  everything on the event loop (3COMMAS_OFFLOAD_BYTES=0)
+- thread:  large responses decoded and filtered in a thread pool
+- process: large responses decoded and filtered in a process pool
+
+Reports small-call p50/p99/max latency and throughput and completed large
+calls per policy. No API credentials are required; requests never leave
+localhost.
+
+Usage:
+    python scripts/benchmark_offload.py [pairs] [seconds] [small_clients] [large_clients]
+
+Examples:
+    python scripts/benchmark_offload.py
+    python scripts/benchmark_offload.py 100000 10 20 2
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add project to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# Point the client at the stand-in server before anything reads the environment
+os.environ.setdefault("3COMMAS_API_KEY", "benchmark-key-" + "0" * 32)
+os.environ.setdefault("3COMMAS_SECRET_KEY", "benchmark-secret-" + "0" * 32)
+# The stand-in is local; keep the client's rate limiter out of the picture
+os.environ.setdefault("3COMMAS_RATE_LIMIT_GLOBAL", "1000000")
+
+from fastmcp import Client
+
+from threecommas_mcp.server import mcp
+from threecommas_mcp.utils.env import get_offload_threshold
+from threecommas_mcp.utils.offload import _execution_policy
+
+BOTS = [{"id": 5000 + i, "name": f"Bot {i}", "is_enabled": True} for i in range(5)]
+
+
+def market_pairs(count: int) -> dict:
+    return {
+        "pairs": [
+            {
+                "pair": f"USDT_C{i}",
+                "market_code": "binance",
+                "min_lot_size": "0.0001",
+                "max_lot_size": None,
+                "lot_step": "0.0001",
+                "min_price": "0.00000001",
+                "price_step": "0.00000001",
+                "min_total": "10",
+            }
+            for i in range(count)
+        ]
+    }
+
+
+class StandInAPI:
+    """Keep-alive HTTP/1.1 stand-in serving pre-encoded responses."""
+
+    def __init__(self, pairs: int, latency: float) -> None:
+        self.latency = latency
+        self.market_pairs = json.dumps(market_pairs(pairs)).encode()
+        self.bots = json.dumps(BOTS).encode()
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                request_line = (await reader.readline()).decode()
+                if not request_line:
+                    break
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                path = request_line.split(" ")[1].split("?")[0]
+                await asyncio.sleep(self.latency)
+                payload = (
+                    self.market_pairs if path.endswith("market_pairs") else self.bots
+                )
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(payload)}\r\n\r\n".encode()
+                    + payload
+                )
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+async def run(
+    client: Client, seconds: float, small_clients: int, large_clients: int
+) -> tuple[list[float], list[float]]:
+    small: list[float] = []
+    large: list[float] = []
+    deadline = time.perf_counter() + seconds
+
+    async def loop(tool: str, arguments: dict, latencies: list[float]) -> None:
+        # At least one call each, so a zero-second run warms everything up
+        while True:
+            start = time.perf_counter()
+            result = await client.call_tool(tool, arguments)
+            if "error" in (result.structured_content or {}):
+                raise RuntimeError(f"{tool} failed: {result.structured_content}")
+            latencies.append((time.perf_counter() - start) * 1000)
+            if time.perf_counter() >= deadline:
+                break
+
+    await asyncio.gather(
+        *(loop("get_all_market_pairs", {}, large) for _ in range(large_clients)),
+        *(
+            loop("get_dca_bot_list", {"limit": 5 + i % 10}, small)
+            for i in range(small_clients)
+        ),
+    )
+    return small, large
+
+
+async def main(pairs: int, seconds: float, small_clients: int, large_clients: int):
+    api = StandInAPI(pairs, latency=0.002)
+    listener = await asyncio.start_server(api.handle, "127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    os.environ["3COMMAS_API_BASE_URL"] = f"http://127.0.0.1:{port}/public/api"
+    threshold = str(get_offload_threshold())
+
+    print(
+        f"market_pairs response {len(api.market_pairs) / 1e6:.1f} MB "
+        f"({pairs} pairs), {small_clients} small and {large_clients} large "
+        f"clients, {seconds:.0f} s per policy, offload from {threshold} bytes"
+    )
+    print(
+        f"{'policy':>8} {'small p50':>10} {'small p99':>10} {'small max':>10} "
+        f"{'small/s':>8} {'large':>6} {'large p50':>10}"
+    )
+    policies = [("inline", "0", "thread"), ("thread", threshold, "thread")]
+    policies.append(("process", threshold, "process"))
+    async with Client(mcp) as client:
+        for name, offload_bytes, pool in policies:
+            os.environ["3COMMAS_OFFLOAD_BYTES"] = offload_bytes
+            os.environ["3COMMAS_OFFLOAD_POOL"] = pool
+            await _execution_policy.shutdown()
+            _execution_policy.configure()
+            # Start the pool and warm the connections outside the measurement
+            await run(client, 0, 1, 1)
+
+            small, large = await run(client, seconds, small_clients, large_clients)
+            print(
+                f"{name:>8} {percentile(small, 0.5):>8.1f}ms "
+                f"{percentile(small, 0.99):>8.1f}ms {max(small):>8.1f}ms "
+                f"{len(small) / seconds:>8.1f} {len(large):>6} "
+                f"{percentile(large, 0.5):>8.1f}ms"
+            )
+        await _execution_policy.shutdown()
+
+    listener.close()
+    await listener.wait_closed()
+
+
+if __name__ == "__main__":
+    pair_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+    small_count = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+    large_count = int(sys.argv[4]) if len(sys.argv) > 4 else 2
+    asyncio.run(main(pair_count, duration, small_count, large_count))
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark SmartTrade fan-out against a local rate-limited stand-in server.
+
+Starts a local HTTP server that answers /public/api/v2/smart_trades/{id}
+like 3Commas and enforces the SmartTrades limit (40 requests per 10 second
+sliding window, HTTP 429 beyond it). The same set of detail requests is then
+sent through the real API client in three ways:
+
+- burst:  fan_out, sending full bursts at window boundaries
+- paced:  one request every window/limit seconds (evenly spread)
+- gather: asyncio.gather with only the client's own limiter check
+
+Reports wall time, successful responses, 429 rejections and throughput.
+No API credentials are required; requests never leave localhost.
+
+Usage:
+    python scripts/benchmark_smart_trades.py [requests] [latency_ms]
+
+Examples:
+    python scripts/benchmark_smart_trades.py
+    python scripts/benchmark_smart_trades.py 200 100
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+# Add project to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# Point the client at the stand-in server before anything reads the environment
+os.environ.setdefault("3COMMAS_API_KEY", "benchmark-key-" + "0" * 32)
+os.environ.setdefault("3COMMAS_SECRET_KEY", "benchmark-secret-" + "0" * 32)
+
+from threecommas_mcp.api.burst import APICall, fan_out
+from threecommas_mcp.api.client import api_request
+from threecommas_mcp.utils.env import get_rate_limits
+
+LIMIT = get_rate_limits()["smart_trades"]["requests"]
+WINDOW = get_rate_limits()["smart_trades"]["window"]
+
+
+class StandInServer:
+    """Minimal HTTP/1.1 server enforcing a sliding-window request limit."""
+
+    def __init__(self, limit: int, window: float, latency: float) -> None:
+        self.limit = limit
+        self.window = window
+        self.latency = latency
+        self.arrivals: deque[float] = deque()
+        self.accepted = 0
+        self.rejected = 0
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        request_line = (await reader.readline()).decode()
+        while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+            pass
+
+        now = time.monotonic()
+        while self.arrivals and self.arrivals[0] <= now - self.window:
+            self.arrivals.popleft()
+        if len(self.arrivals) >= self.limit:
+            self.rejected += 1
+            status, body = "429 Too Many Requests", {"error": "rate_limit_exceeded"}
+        else:
+            self.arrivals.append(now)
+            self.accepted += 1
+            await asyncio.sleep(self.latency)
+            path = request_line.split(" ")[1].split("?")[0]
+            status, body = "200 OK", {"id": path.rsplit("/", 1)[-1], "status": "ok"}
+
+        payload = json.dumps(body).encode()
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode()
+            + payload
+        )
+        await writer.drain()
+        writer.close()
+
+
+async def run_burst(calls: list[APICall]) -> list[dict]:
+    return await fan_out(calls)
+
+
+async def run_paced(calls: list[APICall]) -> list[dict]:
+    interval = WINDOW / LIMIT
+    tasks = []
+    for call in calls:
+        tasks.append(asyncio.ensure_future(api_request(call.path, method="GET")))
+        await asyncio.sleep(interval)
+    return list(await asyncio.gather(*tasks))
+
+
+async def run_gather(calls: list[APICall]) -> list[dict]:
+    return list(
+        await asyncio.gather(*(api_request(call.path, method="GET") for call in calls))
+    )
+
+
+async def main(count: int, latency: float) -> None:
+    modes = [("burst", run_burst), ("paced", run_paced), ("gather", run_gather)]
+    calls = [APICall(f"v2/smart_trades/{1000000 + i}") for i in range(count)]
+    print(
+        f"{count} requests, limit {LIMIT}/{WINDOW}s, "
+        f"{latency * 1000:.0f} ms server latency"
+    )
+    print(f"{'mode':>8} {'seconds':>9} {'ok':>6} {'429':>6} {'req/s':>8}")
+
+    for i, (name, runner) in enumerate(modes):
+        if i:
+            # Let both the client limiter and the server window drain
+            await asyncio.sleep(WINDOW + 0.5)
+        server = StandInServer(LIMIT, WINDOW, latency)
+        listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        os.environ["3COMMAS_API_BASE_URL"] = f"http://127.0.0.1:{port}/public/api"
+
+        start = time.perf_counter()
+        results = await runner(calls)
+        elapsed = time.perf_counter() - start
+        listener.close()
+        await listener.wait_closed()
+
+        ok = sum(1 for r in results if "error" not in r)
+        print(
+            f"{name:>8} {elapsed:>9.2f} {ok:>6} {server.rejected:>6} "
+            f"{ok / elapsed:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    latency_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 50
+    asyncio.run(main(requests, latency_ms / 1000))
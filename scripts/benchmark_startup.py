@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark MCP server cold start.
+
+Two measurements, each in fresh Python processes:
+
+- Import time: runs `python -X importtime -c "import threecommas_mcp.server"`
+  and reports the total plus the slowest modules by cumulative time.
+- Time to first tools/list: launches the server over stdio the way an MCP
+  client does and times from process start until the tool listing arrives.
+
+Both run twice: once with an empty data directory (no tool manifest yet, so
+every tool module is imported) and once with the manifest written by the
+first start (tool modules are imported on first call). No API credentials
+are required; nothing is sent to 3Commas.
+
+Usage:
+    python scripts/benchmark_startup.py [runs] [top_modules]
+
+Examples:
+    python scripts/benchmark_startup.py
+    python scripts/benchmark_startup.py 10 25
+"""
+
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from fastmcp import Client
+from fastmcp.client.transports import StdioTransport
+
+project_root = Path(__file__).parent.parent
+
+
+def import_times(env: dict[str, str]) -> list[tuple[int, str]]:
+    """Cumulative import time in microseconds per module, for one cold import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import threecommas_mcp.server"],
+        cwd=project_root,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        times.append((int(cumulative), module.strip()))
+    return times
+
+
+async def first_list_tools(env: dict[str, str]) -> tuple[float, int]:
+    """Seconds from launching the stdio server to its first tools/list reply."""
+    transport = StdioTransport(
+        command=sys.executable,
+        args=["-m", "threecommas_mcp.server", "--transport", "stdio"],
+        env=env,
+        cwd=str(project_root),
+        keep_alive=False,
+        log_file=Path(os.devnull),
+    )
+    start = time.perf_counter()
+    async with Client(transport) as client:
+        tools = await client.list_tools()
+        elapsed = time.perf_counter() - start
+    return elapsed, len(tools)
+
+
+def run_case(
+    label: str, env: dict[str, str], runs: int, top: int, remove: Path | None = None
+) -> None:
+    """Measure import and launch times; remove is deleted before every start."""
+    print(f"\n{label}")
+    print("-" * len(label))
+
+    totals = []
+    slowest: dict[str, list[int]] = {}
+    for _ in range(runs):
+        if remove is not None:
+            remove.unlink(missing_ok=True)
+        times = import_times(env)
+        totals.append(next(t for t, m in times if m == "threecommas_mcp.server"))
+        for cumulative, module in times:
+            slowest.setdefault(module, []).append(cumulative)
+    print(
+        f"import threecommas_mcp.server: median {statistics.median(totals) / 1000:.0f} ms"
+        f"  (min {min(totals) / 1000:.0f}, max {max(totals) / 1000:.0f})"
+    )
+
+    ranked = sorted(
+        ((statistics.median(t), m) for m, t in slowest.items() if m.count(".") <= 1),
+        reverse=True,
+    )
+    print(f"Slowest top-level imports (median cumulative ms, top {top}):")
+    for cumulative, module in ranked[:top]:
+        print(f"  {cumulative / 1000:8.1f}  {module}")
+    ours = sorted(
+        ((statistics.median(t), m) for m, t in slowest.items() if "threecommas" in m),
+        reverse=True,
+    )
+    print("threecommas_mcp modules:")
+    for cumulative, module in ours[:top]:
+        print(f"  {cumulative / 1000:8.1f}  {module}")
+
+    latencies = []
+    tool_count = 0
+    for _ in range(runs):
+        if remove is not None:
+            remove.unlink(missing_ok=True)
+        elapsed, tool_count = asyncio.run(first_list_tools(env))
+        latencies.append(elapsed)
+    print(
+        f"Launch to first tools/list ({tool_count} tools): "
+        f"median {statistics.median(latencies) * 1000:.0f} ms"
+        f"  (min {min(latencies) * 1000:.0f}, max {max(latencies) * 1000:.0f})"
+    )
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    top = int(sys.argv[2]) if len(sys.argv) > 2 else 15
+
+    print("3Commas MCP Startup Benchmark")
+    print("=" * 60)
+    print(f"Python {sys.version.split()[0]}, {runs} runs per measurement")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        env = {
+            **os.environ,
+            "3COMMAS_DATA_DIR": data_dir,
+            "PYTHONPATH": str(project_root),
+        }
+        manifest = Path(data_dir) / "tool_manifest.json"
+        run_case("Without tool manifest (first start)", env, runs, top, manifest)
+        # The last start above wrote the manifest; later starts load tools lazily
+        run_case("With tool manifest (later starts)", env, runs, top)
+
+
+if __name__ == "__main__":
+    main()
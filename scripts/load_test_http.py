@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Load test the streamable HTTP transport with many concurrent MCP clients.
+
+Starts a local stand-in for the 3Commas API and serves the MCP server over
+streamable HTTP in-process (uvicorn). Each simulated client opens its own
+MCP session and polls a mix of read-only tools:
+
+- get_connected_exchanges_and_wallets  (per-session unchanged markers)
+- screen_pairs                         (shared blacklist pair set)
+- search_strategies                    (shared strategy catalog)
+- get_dca_bot_list                     (plain API pass-through)
+
+Reports per-tool latency percentiles, overall throughput, and how many
+requests reached the stand-in API, showing that caches, the connection pool
+and the rate limiter are shared by all sessions. The stand-in answers HTTP
+429 beyond the global limit, so any 429 means the shared limiter overshot.
+No API credentials are required; requests never leave localhost.
+
+Usage:
+    python scripts/load_test_http.py [clients] [rounds] [latency_ms]
+
+Examples:
+    python scripts/load_test_http.py
+    python scripts/load_test_http.py 50 5 100
+"""
+
+import asyncio
+import json
+import os
+import socket
+import sys
+import time
+from collections import Counter, deque
+from pathlib import Path
+
+# Add project to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# Point the client at the stand-in server before anything reads the environment
+os.environ.setdefault("3COMMAS_API_KEY", "loadtest-key-" + "0" * 32)
+os.environ.setdefault("3COMMAS_SECRET_KEY", "loadtest-secret-" + "0" * 32)
+
+import uvicorn
+from fastmcp import Client
+
+from threecommas_mcp.server import mcp
+from threecommas_mcp.utils.env import get_rate_limits
+
+LIMIT = get_rate_limits()["global"]["requests"]
+WINDOW = get_rate_limits()["global"]["window"]
+
+ACCOUNTS = [
+    {"id": 1000 + i, "name": f"Account {i}", "market_code": "binance"}
+    for i in range(5)
+]
+STRATEGIES = {
+    name: {"name": name.upper(), "options": {"time": {"values": ["5m", "1h", "1d"]}}}
+    for name in ("rsi", "macd", "cci", "tv_custom_signal", "nonstop")
+}
+BLACKLIST = {"pairs": ["USDT_LUNA", "USDT_FTT", "BTC_DOGE"]}
+BOTS = [{"id": 5000 + i, "name": f"Bot {i}", "is_enabled": True} for i in range(10)]
+
+# Tool calls each client makes per round
+CALLS = [
+    ("get_connected_exchanges_and_wallets", {}),
+    ("screen_pairs", {"pairs": ["USDT_BTC", "USDT_LUNA", "ETH/USDT", "BTC_DOGE"]}),
+    ("search_strategies", {"query": "rsi 1h"}),
+    ("get_dca_bot_list", {"limit": 10}),
+]
+
+
+class StandInAPI:
+    """Keep-alive HTTP/1.1 stand-in for the 3Commas API with a global limit."""
+
+    def __init__(self, limit: int, window: float, latency: float) -> None:
+        self.limit = limit
+        self.window = window
+        self.latency = latency
+        self.arrivals: deque[float] = deque()
+        self.paths: Counter[str] = Counter()
+        self.connections = 0
+        self.rejected = 0
+
+    def body(self, path: str) -> object:
+        if path.endswith("ver1/accounts"):
+            return ACCOUNTS
+        if path.endswith("ver1/bots/strategy_list"):
+            return STRATEGIES
+        if path.endswith("ver1/bots/pairs_black_list"):
+            return BLACKLIST
+        if path.endswith("ver1/bots"):
+            return BOTS
+        return {"status": "ok"}
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        try:
+            while True:
+                request_line = (await reader.readline()).decode()
+                if not request_line:
+                    break
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+
+                path = request_line.split(" ")[1].split("?")[0]
+                self.paths[path.split("/public/api/")[-1]] += 1
+                now = time.monotonic()
+                while self.arrivals and self.arrivals[0] <= now - self.window:
+                    self.arrivals.popleft()
+                if len(self.arrivals) >= self.limit:
+                    self.rejected += 1
+                    status, body = "429 Too Many Requests", {"error": "rate_limit"}
+                else:
+                    self.arrivals.append(now)
+                    await asyncio.sleep(self.latency)
+                    status, body = "200 OK", self.body(path)
+
+                payload = json.dumps(body).encode()
+                writer.write(
+                    f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload
+                )
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return int(s.getsockname()[1])
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+async def simulated_client(
+    url: str, rounds: int, latencies: dict[str, list[float]], outcomes: Counter[str]
+) -> None:
+    async with Client(url) as client:
+        for _ in range(rounds):
+            for tool, args in CALLS:
+                start = time.perf_counter()
+                result = await client.call_tool(tool, args, raise_on_error=False)
+                latencies[tool].append(time.perf_counter() - start)
+                data = result.structured_content or {}
+                if "error" in data:
+                    outcomes["error"] += 1
+                elif data.get("unchanged"):
+                    outcomes["unchanged"] += 1
+                else:
+                    outcomes["ok"] += 1
+
+
+async def main(clients: int, rounds: int, latency: float) -> None:
+    api = StandInAPI(LIMIT, WINDOW, latency)
+    listener = await asyncio.start_server(api.handle, "127.0.0.1", 0)
+    api_port = listener.sockets[0].getsockname()[1]
+    os.environ["3COMMAS_API_BASE_URL"] = f"http://127.0.0.1:{api_port}/public/api"
+
+    port = free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(
+            mcp.http_app(), host="127.0.0.1", port=port, log_level="warning"
+        )
+    )
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    url = f"http://127.0.0.1:{port}/mcp"
+    print(
+        f"{clients} clients x {rounds} rounds x {len(CALLS)} tools, "
+        f"limit {LIMIT}/{WINDOW}s, {latency * 1000:.0f} ms API latency"
+    )
+    latencies: dict[str, list[float]] = {tool: [] for tool, _ in CALLS}
+    outcomes: Counter[str] = Counter()
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(simulated_client(url, rounds, latencies, outcomes) for _ in range(clients))
+    )
+    elapsed = time.perf_counter() - start
+
+    server.should_exit = True
+    await serving
+    listener.close()
+    await listener.wait_closed()
+
+    print(f"\n{'tool':>36} {'calls':>6} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for tool, values in latencies.items():
+        print(
+            f"{tool:>36} {len(values):>6} {percentile(values, 0.5) * 1000:>8.1f} "
+            f"{percentile(values, 0.95) * 1000:>8.1f} {max(values) * 1000:>8.1f}"
+        )
+
+    total = sum(len(values) for values in latencies.values())
+    print(
+        f"\n{total} tool calls in {elapsed:.2f}s ({total / elapsed:.1f} calls/s): "
+        f"{outcomes['ok']} full, {outcomes['unchanged']} unchanged, "
+        f"{outcomes['error']} errors"
+    )
+    print(
+        f"API: {sum(api.paths.values())} requests over {api.connections} "
+        f"connections, {api.rejected} rejected with 429"
+    )
+    for path, count in api.paths.most_common():
+        print(f"  {count:>6}  {path}")
+
+
+if __name__ == "__main__":
+    client_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    round_count = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    latency_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 50
+    asyncio.run(main(client_count, round_count, latency_ms / 1000))
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Summarize spans written by 3COMMAS_TRACE=jsonl.
+
+Prints, per span name, the count and p50/p95/max duration and the share of
+its parent's time, then the span tree of the slowest traces. Use it to see
+whether a slow tool call spent its time in validation, the rate limiter,
+signing, the HTTP exchange, JSON decode or a filter stage.
+
+Usage:
+    python scripts/summarize_traces.py [trace_file] [slowest]
+
+Examples:
+    python scripts/summarize_traces.py
+    python scripts/summarize_traces.py ~/.cache/threecommas-mcp/traces.jsonl 5
+"""
+
+import json
+import os
+import sys
+from collections import defaultdict
+from typing import Any
+
+DEFAULT_FILE = os.path.join(
+    os.path.expanduser(os.getenv("3COMMAS_DATA_DIR", "~/.cache/threecommas-mcp")),
+    "traces.jsonl",
+)
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def load(path: str) -> list[dict[str, Any]]:
+    spans = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                spans.append(json.loads(line))
+    return spans
+
+
+def print_tree(
+    span: dict[str, Any], children: dict[str, list[dict[str, Any]]], depth: int = 0
+) -> None:
+    attributes = " ".join(f"{k}={v}" for k, v in span["attributes"].items())
+    label = "  " * depth + span["name"]
+    print(f"  {label:<34} {span['duration_ms']:>10.2f} ms  {attributes}")
+    for child in sorted(children[span["span_id"]], key=lambda s: s["start"]):
+        print_tree(child, children, depth + 1)
+
+
+def main() -> None:
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_FILE
+    slowest = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    spans = load(path)
+    by_id = {span["span_id"]: span for span in spans}
+    children: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for span in spans:
+        if span["parent_id"] in by_id:
+            children[span["parent_id"]].append(span)
+
+    durations: dict[str, list[float]] = defaultdict(list)
+    shares: dict[str, list[float]] = defaultdict(list)
+    for span in spans:
+        durations[span["name"]].append(span["duration_ms"])
+        parent = by_id.get(span["parent_id"])
+        if parent is not None and parent["duration_ms"] > 0:
+            shares[span["name"]].append(span["duration_ms"] / parent["duration_ms"])
+
+    roots = [span for span in spans if span["parent_id"] not in by_id]
+    print(f"{len(spans)} spans in {len(roots)} traces from {path}\n")
+    print(
+        f"{'span':>24} {'count':>7} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} {'of parent':>10}"
+    )
+    for name, values in sorted(durations.items(), key=lambda item: -sum(item[1])):
+        share = shares.get(name)
+        share_text = f"{sum(share) / len(share):>9.0%}" if share else f"{'-':>9}"
+        print(
+            f"{name:>24} {len(values):>7} {percentile(values, 0.5):>9.2f} "
+            f"{percentile(values, 0.95):>9.2f} {max(values):>9.2f} {share_text:>10}"
+        )
+
+    for root in sorted(roots, key=lambda s: -s["duration_ms"])[:slowest]:
+        print(f"\nTrace {root['trace_id']}")
+        print_tree(root, children)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""Tests for the batch tool."""
+
+import asyncio
+
+from threecommas_mcp.tools import batch as batch_tool
+from threecommas_mcp.utils.metrics import _metrics
+
+
+def test_batch_rejects_tools_that_write_state():
+    result = asyncio.run(batch_tool.batch([{"tool": "get_dca_bot_changes"}]))
+
+    assert result["results"][0]["error"].startswith("Unknown or non read-only tool")
+
+
+def test_batched_calls_are_measured_per_tool(monkeypatch):
+    async def read_tool(fail: bool = False):
+        return {"error": "bad request"} if fail else {"value": 1}
+
+    monkeypatch.setitem(batch_tool.READ_ONLY_TOOLS, "read_tool", read_tool)
+    _metrics.reset()
+
+    asyncio.run(
+        batch_tool.batch(
+            [{"tool": "read_tool"}, {"tool": "read_tool", "args": {"fail": True}}]
+        )
+    )
+
+    metrics = _metrics.group("tool")["read_tool"]
+    assert metrics["tool_calls_total"] == 2
+    assert metrics["tool_errors_total"] == 1
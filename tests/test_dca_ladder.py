@@ -0,0 +1,59 @@
+"""Tests for the DCA capital-requirement calculator."""
+
+import random
+
+from threecommas_mcp.utils import dca_ladder
+from threecommas_mcp.utils.dca_ladder import capital_requirements
+
+
+def _bots(count: int) -> list[dict]:
+    rnd = random.Random(7)
+    return [
+        {
+            "id": i,
+            "strategy": "short" if rnd.random() < 0.2 else "long",
+            "pairs": [rnd.choice(["USDT_BTC", "BTC_ETH"])],
+            "base_order_volume": str(rnd.choice([10, 20, 50])),
+            "safety_order_volume": str(rnd.choice([10, 20, 50, 100])),
+            "martingale_volume_coefficient": str(round(rnd.uniform(0.0, 2.0), 2)),
+            "martingale_step_coefficient": str(round(rnd.uniform(0.0, 1.5), 2)),
+            "safety_order_step_percentage": str(round(rnd.uniform(0.5, 9.0), 2)),
+            "max_safety_orders": rnd.randint(-1, 25),
+            "max_active_deals": rnd.choice([None, 0, 1, 3]),
+        }
+        for i in range(count)
+    ]
+
+
+def test_loop_and_vectorized_paths_agree(monkeypatch):
+    bots = _bots(200)
+    for include_ladder in (False, True):
+        monkeypatch.setattr(dca_ladder, "VECTORIZE_MIN_ORDERS", 0)
+        vectorized = capital_requirements(bots, include_ladder)
+        monkeypatch.setattr(dca_ladder, "VECTORIZE_MIN_ORDERS", 10**9)
+        assert capital_requirements(bots, include_ladder) == vectorized
+
+
+def test_requirements_of_a_flat_ladder():
+    bot = {
+        "id": 1,
+        "pairs": ["USDT_BTC"],
+        "base_order_volume": "10",
+        "safety_order_volume": "20",
+        "safety_order_step_percentage": "1",
+        "max_safety_orders": 2,
+        "max_active_deals": 3,
+    }
+    result = capital_requirements([bot])
+    (entry,) = result["requirements"]
+    assert entry["funds_per_deal"] == 50.0
+    assert entry["funds_all_concurrent_deals"] == 150.0
+    assert entry["max_price_deviation_percent"] == 2.0
+    assert result["totals_by_quote"] == [
+        {
+            "quote": "USDT",
+            "bots": 1,
+            "funds_per_deal": 50.0,
+            "funds_all_concurrent_deals": 150.0,
+        }
+    ]
@@ -0,0 +1,71 @@
+"""Tests for the local deals history store."""
+
+import asyncio
+
+from threecommas_mcp.store import deals_history
+from threecommas_mcp.store.deals_history import SCOPE_STATUSES, DealsHistoryStore
+
+
+def stand_in_api(monkeypatch, deals):
+    """Serve ver1/deals pages and per-deal refetches from a dict of deals."""
+    refetched = []
+
+    async def api_request(path, params=None, method="GET"):
+        scope = params.get("scope")
+        rows = sorted(
+            (
+                dict(deal)
+                for deal in deals.values()
+                if (scope is None or deal["status"] in SCOPE_STATUSES[scope])
+                and deal["created_at"] >= params.get("from", "")
+            ),
+            key=lambda deal: deal["created_at"],
+        )
+        offset = int(params["offset"])
+        return {"data": rows[offset : offset + int(params["limit"])]}
+
+    async def fan_out(calls):
+        ids = [int(call.path.split("/")[2]) for call in calls]
+        refetched.extend(ids)
+        return [dict(deals[i]) if i in deals else {"error": "not found"} for i in ids]
+
+    monkeypatch.setattr(deals_history, "api_request", api_request)
+    monkeypatch.setattr(deals_history, "fan_out", fan_out)
+    return refetched
+
+
+def test_finished_deals_are_refetched_on_the_next_sync(monkeypatch):
+    deals = {
+        1: {"id": 1, "status": "bought", "created_at": "2026-01-01"},
+        2: {"id": 2, "status": "completed", "created_at": "2026-01-02"},
+    }
+    refetched = stand_in_api(monkeypatch, deals)
+    store = DealsHistoryStore(":memory:")
+
+    first = asyncio.run(store.sync(scope="finished"))
+    assert first.refreshed == 0
+    assert store.query(scope="finished")[0] == 1
+    assert store.unfinished_ids() == [1]
+
+    # Deal 1 finishes before the resume point of the next scoped sync
+    deals[1]["status"] = "completed"
+    second = asyncio.run(store.sync(scope="finished"))
+
+    assert second.refreshed == 1
+    assert refetched == [1]
+    assert store.unfinished_ids() == []
+    assert store.query(scope="finished")[0] == 2
+
+
+def test_failed_refetch_stays_unfinished(monkeypatch):
+    deals = {1: {"id": 1, "status": "bought", "created_at": "2026-01-01"}}
+    stand_in_api(monkeypatch, deals)
+    store = DealsHistoryStore(":memory:")
+    asyncio.run(store.sync())
+
+    # Neither active nor refetchable: retried on the next sync
+    del deals[1]
+    result = asyncio.run(store.sync())
+
+    assert result.refreshed == 0
+    assert store.unfinished_ids() == [1]
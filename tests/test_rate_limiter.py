@@ -0,0 +1,55 @@
+"""Tests for the shared API rate limiter."""
+
+import asyncio
+
+from threecommas_mcp.utils.decorators import RateLimiter
+
+
+def limiter(monkeypatch, requests):
+    monkeypatch.setenv("3COMMAS_RATE_LIMIT_GLOBAL", str(requests))
+    return RateLimiter()
+
+
+def test_acquired_slots_count_until_released(monkeypatch):
+    rate_limiter = limiter(monkeypatch, 2)
+
+    async def run():
+        await rate_limiter.acquire()
+        await rate_limiter.acquire()
+
+    asyncio.run(run())
+    assert rate_limiter.available_slots() == 0
+    assert not rate_limiter.can_make_request()
+
+    # A sent request keeps its slot for the window; an unsent one frees it
+    rate_limiter.release(sent=True)
+    assert rate_limiter.available_slots() == 0
+    rate_limiter.release(sent=False)
+    assert rate_limiter.available_slots() == 1
+
+
+def test_concurrent_acquires_never_exceed_the_limit(monkeypatch):
+    rate_limiter = limiter(monkeypatch, 3)
+
+    async def run():
+        tasks = [asyncio.create_task(rate_limiter.acquire()) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        admitted = sum(task.done() for task in tasks)
+        assert rate_limiter.available_slots() == 0
+
+        # Slots held by unsent requests are handed on to waiting tasks
+        rate_limiter.release(sent=False)
+        rate_limiter.release(sent=False)
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+        return admitted
+
+    assert asyncio.run(run()) == 3
+    assert rate_limiter.available_slots() == 0
+
+
+def test_release_never_goes_below_zero(monkeypatch):
+    rate_limiter = limiter(monkeypatch, 2)
+
+    rate_limiter.release(sent=False)
+
+    assert rate_limiter.available_slots() == 2
@@ -0,0 +1,40 @@
+"""Tests for the reference data resources."""
+
+import asyncio
+
+from threecommas_mcp.store import reference
+from threecommas_mcp.store.reference import BLACKLIST_URI, ReferenceData
+
+
+def test_blacklist_resource_keeps_pairs(monkeypatch):
+    calls = []
+
+    async def api_request(path, params=None, method="GET"):
+        calls.append(path)
+        return {"pairs": ["USDT_BTC", "USDT_ETH"]}
+
+    monkeypatch.setattr(reference, "api_request", api_request)
+    monkeypatch.setenv("3COMMAS_REFERENCE_REFRESH_INTERVAL", "0")
+    data = ReferenceData({BLACKLIST_URI: reference._load_blacklist})
+
+    content = asyncio.run(data.read(BLACKLIST_URI))
+
+    assert content["pairs"] == ["USDT_BTC", "USDT_ETH"]
+    assert calls == ["ver1/bots/pairs_black_list"]
+
+
+def test_reads_keep_cached_content_when_refreshing_is_off(monkeypatch):
+    calls = []
+
+    async def load():
+        calls.append(1)
+        return {"markets": len(calls)}
+
+    monkeypatch.setenv("3COMMAS_REFERENCE_REFRESH_INTERVAL", "0")
+    data = ReferenceData({"threecommas://markets": load})
+
+    async def read_twice():
+        return [await data.read("threecommas://markets") for _ in range(2)]
+
+    assert asyncio.run(read_twice()) == [{"markets": 1}, {"markets": 1}]
+    assert len(calls) == 1
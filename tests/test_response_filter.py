@@ -0,0 +1,22 @@
+"""Tests for the response filters."""
+
+from threecommas_mcp.utils.response_filter import filter_response
+
+
+def test_display_filter_keeps_empty_violations():
+    response = {
+        "results": [
+            {"index": 0, "status": "valid", "valid": True, "violations": []},
+            {"index": 1, "status": "missing_limits", "note": None},
+        ]
+    }
+
+    results = filter_response(response, "display")["results"]
+
+    assert results[0] == {
+        "index": 0,
+        "status": "valid",
+        "valid": True,
+        "violations": [],
+    }
+    assert results[1] == {"index": 1, "status": "missing_limits"}
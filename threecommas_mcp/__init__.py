@@ -1,12 +1,21 @@
 """3Commas Model Context Protocol (MCP) server."""
 
-from . import api, models, tools, utils
+import importlib
+from typing import Any
 
 __version__ = "0.1.0"
 
 __all__ = [
     "api",
     "models",
+    "store",
     "tools",
     "utils",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Subpackages are imported on first access to keep server startup fast
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,18 @@
 """3Commas API client module."""
 
 from .client import api_request, health_check, detect_endpoint_type
+from .burst import APICall, fan_out
+from .coalesce import RequestCoalescer, coalesce_requests
+from .prefetch import Prefetcher, UsageStats
 
 __all__ = [
     "api_request",
     "health_check",
     "detect_endpoint_type",
+    "APICall",
+    "fan_out",
+    "RequestCoalescer",
+    "coalesce_requests",
+    "Prefetcher",
+    "UsageStats",
 ]
@@ -0,0 +1,88 @@
+"""Burst fan-out scheduler for 3Commas API requests
+
+Short-window limits such as SmartTrades (40 requests per 10 seconds) are
+used best by sending a full burst as soon as the window frees up instead of
+pacing requests evenly. fan_out launches as many requests concurrently as
+the shared rate limiter allows, then waits for the window boundary until a
+whole burst fits again.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Dict, NamedTuple
+
+from .client import api_request, detect_endpoint_type
+from ..utils.decorators import _rate_limiter
+
+
+class APICall(NamedTuple):
+    """A single GET request to fan out."""
+
+    path: str
+    params: Dict[str, Any] | None = None
+
+
+async def fan_out(
+    calls: list[APICall],
+    endpoint_type: str | None = None,
+    min_burst: int | None = None,
+) -> list[Dict[str, Any]]:
+    """Run GET requests concurrently in bursts that fit the rate-limit window.
+
+    Requests hold a limiter slot from launch until the client records them,
+    so a burst never exceeds the bucket even before responses arrive, and
+    other sessions sharing the limiter see the slots as taken.
+
+    Args:
+        calls: Requests to make; all should share one rate-limit bucket
+        endpoint_type: Rate-limit bucket (default: detected from the first path)
+        min_burst: Smallest burst worth sending (default: the bucket size),
+            so freed slots are batched at window boundaries
+
+    Returns:
+        Responses in the same order as calls (errors as {"error": ...}).
+    """
+    if not calls:
+        return []
+    bucket = endpoint_type or detect_endpoint_type(calls[0].path, "GET")
+    limit, _ = _rate_limiter.get_limit(bucket)
+    burst = max(1, min(min_burst or limit, limit))
+
+    results: list[Dict[str, Any]] = [{} for _ in calls]
+    pending = deque(range(len(calls)))
+    in_flight: dict[asyncio.Task[Dict[str, Any]], int] = {}
+
+    while pending or in_flight:
+        wanted = min(burst, len(pending))
+        free = _rate_limiter.available_slots(bucket)
+        if pending and free >= wanted:
+            for _ in range(min(free, len(pending))):
+                index = pending.popleft()
+                call = calls[index]
+                task = asyncio.ensure_future(
+                    api_request(
+                        call.path,
+                        method="GET",
+                        params=dict(call.params or {}),
+                        endpoint_type=bucket,
+                    )
+                )
+                in_flight[task] = index
+            # Let the new tasks reserve their limiter slots before counting again
+            await asyncio.sleep(0)
+            continue
+
+        # Wait for the window boundary, or for in-flight requests to be recorded
+        wait = _rate_limiter.get_wait_time_for_slots(bucket, wanted)
+        if in_flight:
+            done, _ = await asyncio.wait(
+                in_flight,
+                timeout=wait if pending and wait > 0 else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                results[in_flight.pop(task)] = task.result()
+        else:
+            await asyncio.sleep(wait)
+
+    return results
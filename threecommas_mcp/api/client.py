@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import time
 from typing import Dict, TypeVar, Union, Any
 import httpx
 from pydantic import BaseModel
@@ -9,11 +10,18 @@ from pydantic import BaseModel
 from ..utils import (
     get_3commas_credentials,
     get_api_base_url,
+    get_http_max_connections,
     validate_environment,
     sign_request,
     handle_api_errors,
 )
 from ..utils.decorators import _rate_limiter
+from ..utils.lifecycle import on_shutdown
+from ..utils.metrics import _metrics, current_endpoint, current_tool
+from ..utils.offload import _execution_policy
+from ..utils.tracing import span, traced
+from .coalesce import coalesce_identical_gets
+from .prefetch import serve_prefetched
 
 logger = logging.getLogger(__name__)
 
@@ -21,20 +29,63 @@ logger = logging.getLogger(__name__)
 ReqT = TypeVar("ReqT", bound=BaseModel)
 
 
+class _SharedClient:
+    """One pooled httpx.AsyncClient for all sessions of the server process.
+
+    The client is created on first use and recreated if the event loop that
+    owns its connections has changed (for example between asyncio.run calls
+    in scripts).
+    """
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def get(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            max_connections = get_http_max_connections()
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                ),
+            )
+            self._loop = loop
+            on_shutdown(self.aclose)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close pooled connections (called on server shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._loop = None
+
+
+# Global HTTP client shared by every API request
+_http_client = _SharedClient()
+
+
 def detect_endpoint_type(path: str, method: str) -> str:
     """Detect endpoint type for rate limiting based on official 3Commas limits.
 
     Official rate limits from https://developers.3commas.io/quick-start/limits:
     - Global: 100 req/min
     - /ver1/deals: 120 req/min
-    - /ver1/smart_trades: 40 req/10 seconds
+    - /ver1/smart_trades: 40 req/10 seconds (also applied to /v2/smart_trades)
     - /ver1/deals/:deal_id/show: 120 req/min
+
+    Paths may be given with or without a leading slash.
     """
+    path = "/" + path.lstrip("/")
+
     # Specific endpoint patterns with higher limits
     if "/ver1/deals" in path and not path.endswith("/show"):
         return "deals"
 
-    if "/ver1/smart_trades" in path:
+    if "/ver1/smart_trades" in path or "/v2/smart_trades" in path:
         return "smart_trades"
 
     if "/ver1/deals/" in path and path.endswith("/show"):
@@ -45,6 +96,9 @@ def detect_endpoint_type(path: str, method: str) -> str:
 
 
 @handle_api_errors
+@serve_prefetched
+@coalesce_identical_gets
+@traced("api_request", "path", "method")
 async def api_request(
     path: str,
     method: str = "GET",
@@ -70,14 +124,8 @@ async def api_request(
     # Determine endpoint type for rate limiting
     if endpoint_type is None:
         endpoint_type = detect_endpoint_type(path, method)
-
-    # Rate limiting check
-    if not _rate_limiter.can_make_request(endpoint_type):
-        wait_time = _rate_limiter.get_wait_time(endpoint_type)
-        logger.info(
-            f"Rate limit reached for {endpoint_type} endpoints. Waiting {wait_time:.2f}s"
-        )
-        await asyncio.sleep(wait_time)
+    # Left set after returning, so work on the response is attributed too
+    current_endpoint.set(path)
 
     # Convert Pydantic models to dict
     request_data = None
@@ -102,13 +150,14 @@ async def api_request(
         # Generate authentication headers
         import json
 
-        auth_headers = sign_request(
-            api_key,
-            secret,
-            path,
-            params=request_params if method in ("GET", "DELETE") else None,
-            body=json.dumps(json_body) if json_body else None,
-        )
+        with span("sign"):
+            auth_headers = sign_request(
+                api_key,
+                secret,
+                path,
+                params=request_params if method in ("GET", "DELETE") else None,
+                body=json.dumps(json_body) if json_body else None,
+            )
 
         # Prepare headers
         headers = {
@@ -116,50 +165,78 @@ async def api_request(
             **auth_headers,  # Apikey and Signature headers
         }
 
-        # Make the request
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            url = f"{base_url}/{path}"
+        url = f"{base_url}/{path}"
 
-            kwargs: Dict[str, Any] = {
-                "headers": headers,
-                "params": request_params if method in ("GET", "DELETE") else None,
-            }
+        kwargs: Dict[str, Any] = {
+            "headers": headers,
+            "params": request_params if method in ("GET", "DELETE") else None,
+        }
 
-            if json_body:
-                kwargs["json"] = json_body
+        if json_body:
+            kwargs["json"] = json_body
 
+        # Hold a rate-limit slot from the check until the request is recorded,
+        # so concurrent sessions sharing the limiter cannot overshoot it
+        with span("limiter", endpoint_type=endpoint_type):
+            await _rate_limiter.acquire(endpoint_type)
+        sent = False
+        try:
             logger.debug(
                 f"Making {method} request to {url} (endpoint_type: {endpoint_type})"
             )
-            response = await client.request(method, url, **kwargs)
-
+            start = time.monotonic()
+            with span("http") as http_span:
+                response = await _http_client.get().request(method, url, **kwargs)
+                if http_span is not None:
+                    http_span.set(
+                        status=response.status_code, bytes=len(response.content)
+                    )
+            sent = True
+        finally:
             # Record successful request for rate limiting
-            _rate_limiter.record_request(endpoint_type)
-
-            # Handle 204 No Content responses
-            if response.status_code == 204:
-                return {"status": "success", "status_code": 204}
-
-            # Handle successful responses with content
-            if 200 <= response.status_code < 300:
-                try:
-                    json_data = response.json()
-                    # Ensure we return a dict as specified in the function signature
-                    if not isinstance(json_data, dict):
-                        json_data = {"data": json_data}
-                    return json_data
-                except ValueError:
-                    # If JSON parsing fails but status is success, return the text
-                    return {"content": response.text}
-
-            # Handle API errors
+            _rate_limiter.release(endpoint_type, sent=sent)
+            _metrics.inc("api_requests_total", endpoint_type=endpoint_type)
+            if not sent:
+                _metrics.inc("api_errors_total", endpoint_type=endpoint_type)
+
+        # Time and size of the exchange, before any tool filters the response
+        size = len(response.content)
+        _metrics.observe(
+            "api_duration_ms",
+            (time.monotonic() - start) * 1000,
+            endpoint_type=endpoint_type,
+        )
+        _metrics.observe("api_response_bytes", size, endpoint_type=endpoint_type)
+        tool = current_tool.get()
+        if tool is not None:
+            _metrics.inc("tool_upstream_bytes_total", size, tool=tool)
+        if response.status_code == 429:
+            _metrics.inc("api_rate_limited_total", endpoint_type=endpoint_type)
+        elif response.status_code >= 400:
+            _metrics.inc("api_errors_total", endpoint_type=endpoint_type)
+
+        # Handle 204 No Content responses
+        if response.status_code == 204:
+            return {"status": "success", "status_code": 204}
+
+        # Handle successful responses with content
+        if 200 <= response.status_code < 300:
             try:
-                error_data = response.json()
-                if isinstance(error_data, dict) and "error" in error_data:
-                    return {"error": f"API error: {error_data['error']}"}
-                return {"error": f"API error {response.status_code}: {error_data}"}
+                # Lists and other values are wrapped as {"data": ...}
+                with span("decode"):
+                    return await _execution_policy.decode(response)
             except ValueError:
-                return {"error": f"API error {response.status_code}: {response.text}"}
+                # If JSON parsing fails but status is success, return the text
+                return {"content": response.text}
+
+        # Handle API errors
+        try:
+            error_data = response.json()
+            if isinstance(error_data, dict) and "error" in error_data:
+                return {"error": f"API error: {error_data['error']}"}
+            return {"error": f"API error {response.status_code}: {error_data}"}
+        except ValueError:
+            return {"error": f"API error {response.status_code}: {response.text}"}
 
     except httpx.RequestError as e:
         logger.error(f"Network error while making request to {path}: {e}")
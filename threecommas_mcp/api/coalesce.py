@@ -0,0 +1,90 @@
+"""Coalescing of identical API requests for 3Commas MCP
+
+Within a coalescing scope (for example one batch tool call), GET requests
+with the same path and query parameters are sent once; every caller awaits
+the same in-flight request and receives its own copy of the response. The
+scope is carried in a context variable, so tasks started inside it (such as
+gathered tool calls and fan-out requests) share it automatically.
+"""
+
+import asyncio
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Iterator
+
+from ..utils.metrics import _metrics
+from ..utils.offload import _execution_policy
+
+
+class RequestCoalescer:
+    """In-flight GET requests of one coalescing scope, keyed by path and params."""
+
+    def __init__(self) -> None:
+        self._requests: Dict[str, asyncio.Future[Dict[str, Any]]] = {}
+        self.sent = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def key(path: str, params: Dict[str, Any] | None) -> str:
+        query = json.dumps(params or {}, sort_keys=True, default=str)
+        return f"{path.lstrip('/')}?{query}"
+
+    async def request(
+        self, key: str, send: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Send a request once per key; later callers share its response."""
+        future = self._requests.get(key)
+        if future is None:
+            future = asyncio.ensure_future(send())
+            self._requests[key] = future
+            self.sent += 1
+            _metrics.cache_lookup("coalescer", False)
+        else:
+            self.coalesced += 1
+            _metrics.cache_lookup("coalescer", True)
+        # Shield so one cancelled caller does not cancel the shared request
+        response = await asyncio.shield(future)
+        return await _execution_policy.copy_response(response)
+
+    def stats(self) -> Dict[str, int]:
+        return {"upstream_requests": self.sent, "coalesced_requests": self.coalesced}
+
+
+_coalescer: ContextVar[RequestCoalescer | None] = ContextVar("_coalescer", default=None)
+
+
+@contextmanager
+def coalesce_requests() -> Iterator[RequestCoalescer]:
+    """Share identical GET requests made within this block (and its tasks)."""
+    coalescer = RequestCoalescer()
+    token = _coalescer.set(coalescer)
+    try:
+        yield coalescer
+    finally:
+        _coalescer.reset(token)
+
+
+def coalesce_identical_gets(
+    func: Callable[..., Awaitable[Dict[str, Any]]],
+) -> Callable[..., Awaitable[Dict[str, Any]]]:
+    """Decorator routing GET requests through the active coalescing scope."""
+
+    @wraps(func)
+    async def wrapper(
+        path: str,
+        method: str = "GET",
+        params: Dict[str, Any] | None = None,
+        data: Any = None,
+        endpoint_type: str | None = None,
+    ) -> Dict[str, Any]:
+        coalescer = _coalescer.get()
+        if coalescer is None or method != "GET" or data is not None:
+            return await func(path, method, params, data, endpoint_type)
+        return await coalescer.request(
+            RequestCoalescer.key(path, params),
+            lambda: func(path, method, dict(params or {}), data, endpoint_type),
+        )
+
+    return wrapper
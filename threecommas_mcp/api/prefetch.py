@@ -0,0 +1,264 @@
+"""Usage-based prefetching of 3Commas API requests
+
+Sessions usually open with the same few requests (ver1/accounts, ver1/bots,
+market_list). This module counts the GET requests tools make and keeps the
+counts in a small stats file in the data directory. At startup and on a
+schedule it sends the most used requests again in the background and keeps
+their responses for a short time, so the next tool call asking for the same
+path and parameters is answered without waiting for the API.
+
+Prefetching runs at low priority: it only uses a configurable share of each
+rate-limit bucket, skips a request whenever foreground calls leave less than
+that share free, and never waits for a slot. Callers that need the API's
+current answer (refresh=True, max_age=0, background resource refreshes)
+run inside fresh_responses() and are neither served nor counted.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Iterator, NamedTuple
+
+from ..utils.decorators import _rate_limiter
+from ..utils.env import (
+    get_data_dir,
+    get_prefetch_budget,
+    get_prefetch_max_age,
+    get_prefetch_top,
+)
+from ..utils.lifecycle import on_shutdown
+from ..utils.metrics import _metrics
+from ..utils.offload import _execution_policy
+from .coalesce import RequestCoalescer
+
+logger = logging.getLogger(__name__)
+
+# Requests remembered in the stats file (least used are dropped)
+MAX_TRACKED_REQUESTS = 200
+
+# Requests not seen for this long are no longer prefetched
+STALE_AFTER = 7 * 24 * 3600
+
+
+class _Usage(NamedTuple):
+    path: str
+    params: Dict[str, Any]
+    requests: int
+    last_used: float
+
+
+class UsageStats:
+    """Request counts per GET path and params, persisted as JSON."""
+
+    def __init__(self, path: str | None = None) -> None:
+        self._path = path
+        self._entries: Dict[str, _Usage] | None = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _file(self) -> str:
+        return self._path or os.path.join(get_data_dir(), "prefetch.json")
+
+    def _load(self) -> Dict[str, _Usage]:
+        """Read the stats file lazily."""
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(self._file(), encoding="utf-8") as f:
+                    for key, entry in json.load(f).items():
+                        self._entries[key] = _Usage(**entry)
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, TypeError) as e:
+                logger.warning(f"Prefetch stats unreadable at {self._file()}: {e}")
+        return self._entries
+
+    def record(self, key: str, path: str, params: Dict[str, Any] | None) -> None:
+        """Count one request, dropping the least used beyond MAX_TRACKED_REQUESTS."""
+        with self._lock:
+            entries = self._load()
+            previous = entries.get(key)
+            requests = previous.requests + 1 if previous is not None else 1
+            entries[key] = _Usage(path, dict(params or {}), requests, time.time())
+            while len(entries) > MAX_TRACKED_REQUESTS:
+                least = min(
+                    entries, key=lambda k: (entries[k].requests, entries[k].last_used)
+                )
+                del entries[least]
+            self._dirty = True
+
+    def top(self, limit: int) -> list[_Usage]:
+        """Most used requests seen within STALE_AFTER, most used first."""
+        cutoff = time.time() - STALE_AFTER
+        with self._lock:
+            recent = [u for u in self._load().values() if u.last_used >= cutoff]
+        return sorted(recent, key=lambda u: (-u.requests, -u.last_used))[:limit]
+
+    def save(self) -> None:
+        """Write the stats file atomically if anything changed."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            ranked = sorted(self._entries.items(), key=lambda item: -item[1].requests)
+            self._entries = dict(ranked[:MAX_TRACKED_REQUESTS])
+            payload = {key: usage._asdict() for key, usage in self._entries.items()}
+            self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(self._file()), exist_ok=True)
+            with open(self._file() + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(self._file() + ".tmp", self._file())
+        except OSError as e:
+            logger.warning(f"Could not save prefetch stats to {self._file()}: {e}")
+
+
+class Prefetcher:
+    """Background warm-up of the most used requests within a rate-limit budget."""
+
+    def __init__(self, stats: UsageStats) -> None:
+        self.stats = stats
+        self._warm: Dict[str, tuple[float, Dict[str, Any]]] = {}
+        self._sent: Dict[str, list[float]] = {}
+        self._task: asyncio.Task[None] | None = None
+        self.hits = 0
+        self.skipped = 0
+
+    def _within_budget(self, endpoint_type: str) -> bool:
+        """Whether a prefetch request fits its budget and leaves room for calls."""
+        limit, window = _rate_limiter.get_limit(endpoint_type)
+        allowance = int(limit * get_prefetch_budget())
+        now = time.time()
+        sent = [t for t in self._sent.get(endpoint_type, []) if t > now - window]
+        self._sent[endpoint_type] = sent
+        return (
+            len(sent) < allowance
+            and _rate_limiter.available_slots(endpoint_type) > limit - allowance
+        )
+
+    async def warm(self) -> int:
+        """Prefetch the most used requests that fit the budget; returns count."""
+        from .client import api_request, detect_endpoint_type
+
+        warmed = 0
+        token = _prefetching.set(True)
+        try:
+            for usage in self.stats.top(get_prefetch_top()):
+                endpoint_type = detect_endpoint_type(usage.path, "GET")
+                if not self._within_budget(endpoint_type):
+                    self.skipped += 1
+                    continue
+                self._sent.setdefault(endpoint_type, []).append(time.time())
+                response = await api_request(
+                    usage.path,
+                    method="GET",
+                    params=dict(usage.params) or None,
+                    endpoint_type=endpoint_type,
+                )
+                if "error" not in response:
+                    key = RequestCoalescer.key(usage.path, usage.params)
+                    self._warm[key] = (time.monotonic(), response)
+                    warmed += 1
+        finally:
+            _prefetching.reset(token)
+        return warmed
+
+    def take(self, key: str) -> Dict[str, Any] | None:
+        """A fresh prefetched response, if there is one (copy before use)."""
+        cached = self._warm.get(key)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] >= get_prefetch_max_age():
+            del self._warm[key]
+            return None
+        self.hits += 1
+        return cached[1]
+
+    def invalidate(self) -> None:
+        """Drop prefetched responses (after any request that changes data)."""
+        self._warm.clear()
+
+    async def _run(self, interval: float) -> None:
+        while True:
+            try:
+                await self.warm()
+                await asyncio.to_thread(self.stats.save)
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning(f"Prefetch run failed: {e}")
+            await asyncio.sleep(interval)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, interval: float) -> None:
+        """Prefetch now and every interval seconds (no-op if running)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(interval))
+            on_shutdown(self.stop)
+
+    async def stop(self) -> None:
+        """Cancel the prefetch task and save the usage stats."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await asyncio.to_thread(self.stats.save)
+
+
+# Set while the prefetcher's own requests run, and while callers need fresh
+# responses, so these requests are neither counted nor served prefetched data
+_prefetching: ContextVar[bool] = ContextVar("_prefetching", default=False)
+
+
+@contextmanager
+def fresh_responses(enabled: bool = True) -> Iterator[None]:
+    """Send the API requests made in this block past prefetched responses."""
+    if not enabled:
+        yield
+        return
+    token = _prefetching.set(True)
+    try:
+        yield
+    finally:
+        _prefetching.reset(token)
+
+
+# Global usage stats and prefetcher shared by the API client
+_prefetcher = Prefetcher(UsageStats())
+
+
+def serve_prefetched(
+    func: Callable[..., Awaitable[Dict[str, Any]]],
+) -> Callable[..., Awaitable[Dict[str, Any]]]:
+    """Decorator counting GET requests and answering them from prefetched data."""
+
+    @wraps(func)
+    async def wrapper(
+        path: str,
+        method: str = "GET",
+        params: Dict[str, Any] | None = None,
+        data: Any = None,
+        endpoint_type: str | None = None,
+    ) -> Dict[str, Any]:
+        if method != "GET" or data is not None:
+            _prefetcher.invalidate()
+        elif _prefetcher.running and not _prefetching.get():
+            key = RequestCoalescer.key(path, params)
+            _prefetcher.stats.record(key, path.lstrip("/"), params)
+            prefetched = _prefetcher.take(key)
+            if _prefetcher.running:
+                _metrics.cache_lookup("prefetch", prefetched is not None)
+            if prefetched is not None:
+                return await _execution_policy.copy_response(prefetched)
+        return await func(path, method, params, data, endpoint_type)
+
+    return wrapper
@@ -13,6 +13,7 @@ from .base import (  # noqa: F401
     LimitType,
     MarketCode,
 )
+from .batch import BatchCall, BatchRequest
 
 # Define __all__ to control what's imported with wildcard imports
 __all__ = [
@@ -28,4 +29,7 @@ __all__ = [
     "StrategyType",
     "LimitType",
     "MarketCode",
+    # Batch models
+    "BatchCall",
+    "BatchRequest",
 ]
@@ -24,3 +24,52 @@ class GetAccountInfoRequest(APIRequest):
         default="summary",
         description="Account ID or 'summary' for aggregated data from all accounts",
     )
+
+
+class GetAccountsOverviewRequest(APIRequest):
+    """Request parameters for the aggregated balance and profit table of all accounts."""
+
+    account_ids: list[int] | None = Field(
+        default=None,
+        max_length=200,
+        description="Only include these account IDs (default: every connected account)",
+        examples=[[12345, 67890]],
+    )
+    refresh: bool = Field(
+        default=False,
+        description="Bypass the cached account list and list ver1/accounts again",
+    )
+
+
+class GetBalanceHistoryRequest(APIRequest):
+    """Request parameters for locally recorded account balance history."""
+
+    account_id: int = Field(
+        default=0,
+        ge=0,
+        description="Exchange account ID (0 = every recorded account)",
+        examples=[0, 12345],
+    )
+    from_date: str | None = Field(
+        default=None,
+        description="Only samples at or after this date (ISO format)",
+        examples=["2024-01-01T00:00:00Z"],
+    )
+    to_date: str | None = Field(
+        default=None,
+        description="Only samples at or before this date (ISO format)",
+        examples=["2024-12-31T23:59:59Z"],
+    )
+    resolution: str = Field(
+        default="hour",
+        pattern=r"^(sample|hour|day)$",
+        description="Series resolution: every recorded sample, or hourly/daily buckets (UTC)",
+        examples=["sample", "hour", "day"],
+    )
+    max_points: int | None = Field(
+        default=100,
+        ge=3,
+        le=1000,
+        description="Downsample each account's series to at most this many points (LTTB)",
+        examples=[24, 100],
+    )
@@ -11,6 +11,8 @@ from enum import Enum
 from typing import Any, Dict, TypeVar
 from pydantic import BaseModel, ConfigDict, Field
 
+from ..utils.tracing import span
+
 
 class BaseModelConfig(BaseModel):
     """Base model configuration for all models in the project.
@@ -70,6 +72,10 @@ class APIRequest(BaseModelConfig):
         description="Filter type for response ('full' or 'display', default: 'display')",
     )
 
+    def __init__(self, **data: Any) -> None:
+        with span("validate", model=type(self).__name__):
+            super().__init__(**data)
+
     def to_query_params(self, exclude_defaults: bool = True) -> dict[str, str]:
         """Convert model to API query parameters dict.
 
@@ -92,20 +98,21 @@ class APIRequest(BaseModelConfig):
             >>> params = request.to_query_params()
             >>> # {'account_id': '12345', 'strategy': 'long'}
         """
-        # Get model data using by_alias to handle field aliases properly
-        data = self.model_dump(
-            by_alias=True,
-            exclude_none=True,
-            exclude_defaults=exclude_defaults,
-            exclude={"response_filter"},  # Exclude internal field
-        )
-
-        # Handle special cases for optional-like behavior
-        if data.get("account_id") == 0:
-            data.pop("account_id", None)  # Don't filter by account
-
-        # Convert all values to strings as required by query parameters
-        return {key: str(value) for key, value in data.items()}
+        with span("to_query_params", model=type(self).__name__):
+            # Get model data using by_alias to handle field aliases properly
+            data = self.model_dump(
+                by_alias=True,
+                exclude_none=True,
+                exclude_defaults=exclude_defaults,
+                exclude={"response_filter"},  # Exclude internal field
+            )
+
+            # Handle special cases for optional-like behavior
+            if data.get("account_id") == 0:
+                data.pop("account_id", None)  # Don't filter by account
+
+            # Convert all values to strings as required by query parameters
+            return {key: str(value) for key, value in data.items()}
 
 
 # Common enums used across multiple modules
@@ -0,0 +1,42 @@
+"""Batch models for 3Commas MCP.
+
+This module defines Pydantic models for running several read-only tools in
+one call. Each entry names a registered tool and its arguments; the tool
+validates its own arguments with its request model.
+"""
+
+from typing import Any, Dict
+
+from pydantic import Field
+from .base import APIRequest, BaseModelConfig
+
+# Most tool calls a single batch may contain
+MAX_BATCH_CALLS = 20
+
+
+class BatchCall(BaseModelConfig):
+    """One tool call inside a batch."""
+
+    tool: str = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Name of a read-only tool",
+        examples=["get_dca_bot_details", "get_currency_rates_and_limits"],
+    )
+    args: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Keyword arguments for the tool",
+        examples=[{"bot_id": "12345"}, {"market_code": "binance", "pair": "USDT_BTC"}],
+    )
+
+
+class BatchRequest(APIRequest):
+    """Request parameters for running read-only tools concurrently."""
+
+    calls: list[BatchCall] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_CALLS,
+        description=f"Tool calls to run (1-{MAX_BATCH_CALLS})",
+    )
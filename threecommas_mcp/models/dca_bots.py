@@ -87,6 +87,32 @@ class GetAvailableStrategyListRequest(APIRequest):
     pass
 
 
+class SearchStrategiesRequest(APIRequest):
+    """Request parameters for searching the indexed strategy catalog."""
+
+    query: str = Field(
+        default="",
+        max_length=200,
+        description="Keywords matched against strategy keys, names, option keys and values such as timeframes (empty = all)",
+        examples=["rsi", "tradingview 15m", "bollinger"],
+    )
+    type: StrategyType | None = Field(
+        default=None,
+        description="Catalog for long or short bots (default: the unfiltered catalog)",
+        examples=["long", "short"],
+    )
+    limit: int = Field(
+        default=10,
+        ge=1,
+        le=100,
+        description="Maximum number of strategies to return (1-100)",
+    )
+    refresh: bool = Field(
+        default=False,
+        description="Refetch ver1/bots/strategy_list instead of using the cached catalog",
+    )
+
+
 class GetBlacklistOfPairsRequest(APIRequest):
     """Request parameters for DCA bot blacklisted pairs retrieval."""
 
@@ -110,3 +136,42 @@ class GetDCABotProfitDataRequest(APIRequest):
         description="Number of days for profit data (1-365 days, default: 30)",
         examples=[7, 30, 90, 180],
     )
+    resolution: str = Field(
+        default="day",
+        pattern=r"^(day|week|month)$",
+        description="Series resolution: raw daily rows, or weekly/monthly rollups",
+        examples=["day", "week", "month"],
+    )
+    max_points: int | None = Field(
+        default=None,
+        ge=3,
+        le=365,
+        description="Downsample the series to at most this many points (LTTB)",
+        examples=[12, 30, 60],
+    )
+
+
+class GetDCABotChangesRequest(APIRequest):
+    """Request parameters for the DCA bot change feed."""
+
+    since: str | None = Field(
+        default=None,
+        description="Cursor (next_since from a previous call) or ISO timestamp; default: changes found by this call's sync",
+        examples=["42", "2024-06-15T12:30:00+00:00"],
+    )
+    account_id: int = Field(
+        default=0,
+        ge=0,
+        description="Only report bots of this exchange account ID (0 = all accounts)",
+        examples=[0, 12345],
+    )
+    full: bool = Field(
+        default=False,
+        description="Refetch the complete bot list instead of only recently updated bots",
+    )
+    limit: int = Field(
+        default=100,
+        ge=1,
+        le=1000,
+        description="Maximum number of change records to return (1-1000)",
+    )
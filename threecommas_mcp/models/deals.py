@@ -0,0 +1,92 @@
+"""Deal history models for 3Commas MCP.
+
+This module defines Pydantic models for deals history tool requests.
+These models validate filters for syncing ver1/deals into the local store
+and querying it.
+
+Reference: https://github.com/3commas-io/3commas-official-api-docs/blob/master/deals_api.md
+"""
+
+from pydantic import Field
+from .base import APIRequest
+
+# Scopes accepted by ver1/deals
+DEAL_SCOPE_PATTERN = r"^(active|finished|completed|cancelled|failed)$"
+
+
+class SyncDealsHistoryRequest(APIRequest):
+    """Request parameters for paging ver1/deals into the local store."""
+
+    bot_id: str | None = Field(
+        default=None,
+        pattern=r"^\d+$",
+        description="Only sync deals of this DCA bot (numeric string)",
+        examples=["12345"],
+    )
+    account_id: int = Field(
+        default=0,
+        ge=0,
+        description="Only sync deals of this exchange account ID (0 = all accounts)",
+        examples=[0, 12345],
+    )
+    scope: str | None = Field(
+        default=None,
+        pattern=DEAL_SCOPE_PATTERN,
+        description="Deal scope filter",
+        examples=["finished", "active"],
+    )
+    from_date: str | None = Field(
+        default=None,
+        description="Sync deals created from this date (ISO format); default resumes the last sync",
+        examples=["2024-01-01T00:00:00Z"],
+    )
+    max_pages: int = Field(
+        default=50,
+        ge=1,
+        le=500,
+        description="Maximum pages of 1000 deals fetched in this call",
+    )
+
+
+class GetDealsHistoryRequest(APIRequest):
+    """Request parameters for querying locally stored deals."""
+
+    bot_id: str | None = Field(
+        default=None,
+        pattern=r"^\d+$",
+        description="Filter by DCA bot ID (numeric string)",
+        examples=["12345"],
+    )
+    account_id: int = Field(
+        default=0,
+        ge=0,
+        description="Filter by exchange account ID (0 = all accounts)",
+        examples=[0, 12345],
+    )
+    scope: str | None = Field(
+        default=None,
+        pattern=DEAL_SCOPE_PATTERN,
+        description="Deal scope filter",
+        examples=["finished", "active"],
+    )
+    from_date: str | None = Field(
+        default=None,
+        description="Only deals created at or after this date (ISO format)",
+        examples=["2024-01-01T00:00:00Z"],
+    )
+    to_date: str | None = Field(
+        default=None,
+        description="Only deals created at or before this date (ISO format)",
+        examples=["2024-12-31T23:59:59Z"],
+    )
+    limit: int = Field(
+        default=100,
+        ge=1,
+        le=1000,
+        description="Maximum number of deals to return (1-1000)",
+    )
+    offset: int = Field(
+        default=0,
+        ge=0,
+        description="Number of deals to skip for pagination",
+    )
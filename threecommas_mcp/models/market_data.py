@@ -6,8 +6,9 @@ These models provide validation for market information operations.
 Reference: https://developers.3commas.io/market-data
 """
 
+from decimal import Decimal
 from pydantic import Field
-from .base import APIRequest, LimitType
+from .base import APIRequest, BaseModelConfig, LimitType
 
 
 class GetAllMarketPairsRequest(APIRequest):
@@ -49,3 +50,85 @@ class GetSupportedMarketsRequest(APIRequest):
     """Request parameters for supported markets retrieval."""
 
     pass  # No parameters required for this endpoint
+
+
+class OrderParams(BaseModelConfig):
+    """Order parameters for a single bot configuration to validate against limits."""
+
+    market_code: str = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="Exchange market code (e.g., 'binance', 'okex')",
+        examples=["binance", "okex", "bybit_spot"],
+    )
+    pair: str = Field(
+        ...,
+        min_length=3,
+        max_length=20,
+        pattern=r"^[A-Z0-9]+_[A-Z0-9]+$",
+        description="Trading pair in BASE_QUOTE format (e.g., 'BTC_USDT')",
+        examples=["BTC_USDT", "ETH_USDT"],
+    )
+    limit_type: LimitType = Field(
+        default=LimitType.BOT,
+        description="Limit type the order is placed under (bot or smart_trade)",
+    )
+    base_order_volume: Decimal | None = Field(
+        default=None,
+        gt=0,
+        description="Base order volume",
+        examples=["10", "25.5"],
+    )
+    safety_order_volume: Decimal | None = Field(
+        default=None,
+        gt=0,
+        description="Safety order volume",
+        examples=["20", "50"],
+    )
+    volume_type: str = Field(
+        default="quote_currency",
+        pattern=r"^(quote_currency|base_currency)$",
+        description="Unit of the order volumes (quote_currency or base_currency)",
+        examples=["quote_currency", "base_currency"],
+    )
+    price: Decimal | None = Field(
+        default=None,
+        gt=0,
+        description="Order price (defaults to the cached last price)",
+        examples=["65000.5"],
+    )
+
+
+class ValidateOrderParamsRequest(APIRequest):
+    """Request parameters for bulk order parameter validation against cached limits."""
+
+    orders: list[OrderParams] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="Order parameter sets to validate (1-1000)",
+    )
+
+
+class ScreenPairsRequest(APIRequest):
+    """Request parameters for screening candidate pairs against the blacklist."""
+
+    pairs: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="Candidate pairs (USDT_BTC, BTC/USDT and BTC-USDT forms are accepted)",
+        examples=[["USDT_BTC", "USDT_ETH", "BTC/USDT"]],
+    )
+    market_code: str | None = Field(
+        None,
+        min_length=1,
+        max_length=50,
+        description="Also check that each pair exists on this market",
+        examples=["binance", "okex", "bybit_spot"],
+    )
+    refresh: bool = Field(
+        default=False,
+        description="Refetch the blacklist and market pairs instead of using the cached sets",
+    )
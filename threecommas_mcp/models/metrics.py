@@ -0,0 +1,34 @@
+"""Server metrics models for 3Commas MCP.
+
+This module defines Pydantic models for the tools that report on this
+server itself rather than on 3Commas data.
+"""
+
+from typing import Literal
+
+from pydantic import Field
+from .base import BaseModelConfig
+
+# Most functions get_profile_hotspots returns
+MAX_HOTSPOTS = 200
+
+
+class GetProfileHotspotsRequest(BaseModelConfig):
+    """Request parameters for the hottest functions of profiled tool calls."""
+
+    tool: str | None = Field(
+        default=None,
+        min_length=1,
+        description="Only functions from profiles of this tool (default: all tools)",
+        examples=["get_all_market_pairs"],
+    )
+    top: int = Field(
+        default=20,
+        ge=1,
+        le=MAX_HOTSPOTS,
+        description=f"Number of functions to return (1-{MAX_HOTSPOTS})",
+    )
+    sort: Literal["self", "cumulative"] = Field(
+        default="self",
+        description="Rank by time in the function itself or including its callees",
+    )
@@ -0,0 +1,121 @@
+"""Portfolio models for 3Commas MCP.
+
+This module defines Pydantic models for fleet-wide portfolio tool requests.
+These models provide validation for aggregations computed across all DCA bots.
+
+Reference: https://developers.3commas.io/dca-bot
+"""
+
+from typing import Annotated
+
+from pydantic import Field
+from .base import APIRequest
+
+
+class GetDCAPortfolioSummaryRequest(APIRequest):
+    """Request parameters for portfolio aggregation across all DCA bots."""
+
+    account_id: int = Field(
+        default=0,
+        ge=0,
+        description="Limit aggregation to one exchange account ID (0 = all accounts)",
+        examples=[0, 12345],
+    )
+    group_by: list[str] = Field(
+        default=["account", "strategy", "quote"],
+        min_length=1,
+        description="Grouping dimensions (account, strategy, quote)",
+        examples=[["account"], ["strategy", "quote"]],
+    )
+    refresh: bool = Field(
+        default=False,
+        description="Bypass the cached bot list and page through ver1/bots again",
+    )
+
+
+class GetDCACapitalRequirementsRequest(APIRequest):
+    """Request parameters for safety-order ladder and capital requirement calculation."""
+
+    account_id: int = Field(
+        default=0,
+        ge=0,
+        description="Limit calculation to one exchange account ID (0 = all accounts)",
+        examples=[0, 12345],
+    )
+    bot_ids: list[str] | None = Field(
+        default=None,
+        max_length=1000,
+        description="Only include these bot IDs (default: every bot)",
+        examples=[["12345", "67890"]],
+    )
+    enabled_only: bool = Field(
+        default=False,
+        description="Only include enabled bots",
+    )
+    include_ladder: bool = Field(
+        default=False,
+        description="Include the full per-order ladder for each bot",
+    )
+    refresh: bool = Field(
+        default=False,
+        description="Bypass the cached bot list and page through ver1/bots again",
+    )
+
+
+class GetActiveDealProjectionRequest(APIRequest):
+    """Request parameters for projecting remaining safety orders of active deals."""
+
+    account_id: int = Field(
+        default=0,
+        ge=0,
+        description="Limit projection to one exchange account ID (0 = all accounts)",
+        examples=[0, 12345],
+    )
+    drawdowns: list[Annotated[float, Field(ge=0, lt=100)]] = Field(
+        default=[5.0, 10.0, 20.0, 30.0],
+        min_length=1,
+        max_length=20,
+        description="Adverse price moves in percent from each deal's current price",
+        examples=[[5, 10, 20, 30]],
+    )
+    include_deals: bool = Field(
+        default=False,
+        description="Include per-deal projections in addition to per-quote totals",
+    )
+    refresh: bool = Field(
+        default=False,
+        description="Bypass the cached bot list and page through ver1/bots again",
+    )
+
+
+class GetDCAExposureRequest(APIRequest):
+    """Request parameters for coin and quote exposure across active deals."""
+
+    account_id: int = Field(
+        default=0,
+        ge=0,
+        description="Limit exposure to one exchange account ID (0 = all accounts)",
+        examples=[0, 12345],
+    )
+    group_by: str = Field(
+        default="base",
+        pattern="^(pair|base|quote|account)$",
+        description="Exposure dimension: pair, base coin, quote currency or account",
+        examples=["base", "pair"],
+    )
+    top_n: int = Field(
+        default=10,
+        ge=1,
+        le=100,
+        description="Number of groups returned per quote currency",
+    )
+    quote: str | None = Field(
+        default=None,
+        max_length=20,
+        description="Only report this quote currency (e.g. USDT)",
+        examples=["USDT"],
+    )
+    refresh: bool = Field(
+        default=False,
+        description="Bypass the cached bot list and page through ver1/bots again",
+    )
@@ -0,0 +1,64 @@
+"""SmartTrade models for 3Commas MCP.
+
+This module defines Pydantic models for read-only SmartTrade tool requests.
+These models validate list filters and bulk ID lookups against the v2
+SmartTrade API.
+
+Reference: https://developers.3commas.io/smart-trade
+"""
+
+from pydantic import Field
+from .base import APIRequest
+
+
+class GetSmartTradesRequest(APIRequest):
+    """Request parameters for the SmartTrade list."""
+
+    account_id: int = Field(
+        default=0,
+        ge=0,
+        description="Filter by exchange account ID (0 = all accounts)",
+        examples=[0, 12345],
+    )
+    status: str | None = Field(
+        default=None,
+        pattern=r"^(all|active|finished|successfully_finished|cancelled|failed)$",
+        description="SmartTrade status filter",
+        examples=["active", "finished"],
+    )
+    type: str | None = Field(
+        default=None,
+        pattern=r"^(simple_buy|simple_sell|smart_sell|smart_trade|smart_cover)$",
+        description="SmartTrade type filter",
+        examples=["smart_trade", "smart_sell"],
+    )
+    pair: str | None = Field(
+        default=None,
+        max_length=30,
+        description="Filter by pair (e.g. USDT_BTC)",
+        examples=["USDT_BTC"],
+    )
+    per_page: int = Field(
+        default=100,
+        ge=1,
+        le=100,
+        description="SmartTrades per page (1-100)",
+    )
+    max_pages: int = Field(
+        default=1,
+        ge=1,
+        le=200,
+        description="Pages to read; pages after the first are fetched concurrently",
+    )
+
+
+class GetSmartTradeDetailsRequest(APIRequest):
+    """Request parameters for bulk SmartTrade detail or trade lookups."""
+
+    smart_trade_ids: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=400,
+        description="SmartTrade IDs (numeric strings)",
+        examples=[["1234567", "1234568"]],
+    )
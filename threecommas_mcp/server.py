@@ -1,51 +1,115 @@
 #!/usr/bin/env python3
 """3Commas MCP Server."""
 
+import argparse
 import logging
+from typing import Any, AsyncIterator
+
 from fastmcp import FastMCP
+from fastmcp.server.lifespan import lifespan
 
 # Import environment configuration
-from .utils.env import should_enable_destructive_ops
+from .utils.env import (
+    get_balance_sample_interval,
+    get_loop_lag_interval,
+    get_prefetch_interval,
+    get_server_host,
+    get_server_port,
+    get_server_transport,
+    get_slow_callback_threshold,
+    should_enable_destructive_ops,
+    should_monitor_event_loop,
+    should_serve_metrics_endpoint,
+)
+from .utils.lifecycle import run_shutdown_hooks
+from .utils.loop_monitor import _loop_monitor
+
+# Import reference data resources and their subscriptions
+from .store.reference import ACCOUNTS_URI, BLACKLIST_URI, MARKETS_URI, STRATEGIES_URI
+from .utils.subscriptions import _resource_subscriptions
+from .tools import metrics, reference
+from .tools.registry import preload_tool_modules, register_tools
+
+
+@lifespan
+async def background_tasks(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
+    """Run optional background samplers for the lifetime of the server.
+
+    Each sampler is imported only when enabled; the reference data refresh
+    starts on the first resource read. Shutdown hooks registered by anything
+    started meanwhile (samplers, refresh, HTTP client, loop monitor) run on
+    exit. Lazily registered tool modules are imported in a background thread.
+    """
+    if should_monitor_event_loop():
+        _loop_monitor.start(get_loop_lag_interval(), get_slow_callback_threshold())
+    preload_tool_modules()
+    interval = get_balance_sample_interval()
+    if interval > 0:
+        from .store.balance_history import _balance_sampler
+
+        _balance_sampler.start(interval)
+    prefetch_interval = get_prefetch_interval()
+    if prefetch_interval > 0:
+        from .api.prefetch import _prefetcher
+
+        _prefetcher.start(prefetch_interval)
+    try:
+        yield {}
+    finally:
+        await run_shutdown_hooks()
+
 
-# Import API client health check
-from .api.client import health_check
+# Create server instance
+mcp: FastMCP = FastMCP("3Commas MCP Server", lifespan=background_tasks)
 
-# Import tools
-from .tools import dca_bots, account, market_data
+# Route resource subscriptions so clients hear about reference data changes
+_resource_subscriptions.install(mcp._mcp_server)
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
+# Time every tool call for get_server_metrics
+mcp.add_middleware(metrics.ToolMetrics())
 
-# Create server instance
-mcp: FastMCP = FastMCP("3Commas MCP Server")
+# Serve Prometheus metrics at /metrics in HTTP mode when enabled
+if should_serve_metrics_endpoint():
+    mcp.custom_route("/metrics", methods=["GET"])(metrics.prometheus_metrics)
 
 # Check if destructive operations should be enabled
 enable_destructive_ops = should_enable_destructive_ops()
 
-# Register health check tool
-mcp.tool()(health_check)
+# Register tools (see tools/registry.py for the list and lazy loading)
+register_tools(mcp)
 
-# Register DCA bot management tools
-mcp.tool()(dca_bots.get_dca_bot_details)
-mcp.tool()(dca_bots.get_dca_bot_list)
-mcp.tool()(dca_bots.get_available_strategy_list)
-mcp.tool()(dca_bots.get_dca_bot_profit_data)
-mcp.tool()(dca_bots.get_blacklist_of_pairs)
-
-# Register account management tools
-mcp.tool()(account.get_connected_exchanges_and_wallets)
-mcp.tool()(account.get_account_info)
-
-# Register market data tools
-mcp.tool()(market_data.get_all_market_pairs)
-mcp.tool()(market_data.get_currency_rates_and_limits)
-mcp.tool()(market_data.get_supported_markets)
+# Register reference data resources
+mcp.resource(MARKETS_URI, mime_type="application/json")(reference.supported_markets)
+mcp.resource(STRATEGIES_URI, mime_type="application/json")(reference.strategy_catalog)
+mcp.resource(BLACKLIST_URI, mime_type="application/json")(reference.pairs_blacklist)
+mcp.resource(ACCOUNTS_URI, mime_type="application/json")(reference.connected_accounts)
 
 
 def main() -> None:
-    """Run the 3Commas MCP server."""
-
-    mcp.run(transport="stdio")
+    """Run the 3Commas MCP server.
+
+    stdio serves the single client that launched the process. The http
+    (streamable HTTP) and sse transports serve many clients from one process,
+    sharing the API connection pool, caches and rate limiter between them.
+    """
+    parser = argparse.ArgumentParser(description="3Commas MCP Server")
+    parser.add_argument(
+        "--transport",
+        choices=("stdio", "http", "sse"),
+        default=get_server_transport(),
+        help="MCP transport (default: 3COMMAS_MCP_TRANSPORT or stdio)",
+    )
+    parser.add_argument("--host", default=get_server_host())
+    parser.add_argument("--port", type=int, default=get_server_port())
+    args = parser.parse_args()
+
+    # Configure logging
+    logging.basicConfig(level=logging.DEBUG)
+
+    if args.transport == "stdio":
+        mcp.run(transport="stdio")
+    else:
+        mcp.run(transport=args.transport, host=args.host, port=args.port)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,38 @@
+"""Local data stores for 3Commas MCP."""
+
+import importlib
+from typing import Any
+
+# Exported names and the submodule defining them; submodules are imported on
+# first access because some (balance history, accounts) pull in NumPy
+_EXPORTS = {
+    "AccountsCache": "accounts",
+    "accounts_table": "accounts",
+    "BalanceHistoryStore": "balance_history",
+    "BalanceSampler": "balance_history",
+    "BotSnapshotStore": "bot_snapshot",
+    "diff_bots": "bot_snapshot",
+    "BotFleetCache": "fleet",
+    "collect_active_deals": "fleet",
+    "embedded_active_deals": "fleet",
+    "fetch_all_bots": "fleet",
+    "DealsHistoryStore": "deals_history",
+    "SyncResult": "deals_history",
+    "LimitsTable": "limits",
+    "PairLimits": "limits",
+    "PairSetCache": "pairs",
+    "normalize_pair": "pairs",
+    "ProfitHistoryStore": "profit_history",
+    "ReferenceData": "reference",
+    "StrategyCatalog": "strategies",
+    "StrategyIndex": "strategies",
+    "extract_profit_rows": "profit_history",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
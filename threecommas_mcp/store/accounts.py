@@ -0,0 +1,105 @@
+"""Cached exchange accounts for 3Commas MCP
+
+This module keeps the raw `ver1/accounts` list (account names, exchanges,
+lock state) in memory for a few minutes, so tools that work across accounts
+do not list them again on every call. Per-account balances and profit are
+fetched fresh from `ver1/accounts/{id}` and folded into a compact table.
+"""
+
+import time
+from typing import Any, Dict
+
+from ..utils.env import get_account_cache_ttl
+from ..api.client import api_request
+from ..api.prefetch import fresh_responses
+from ..utils.metrics import _metrics
+from ..utils.portfolio import to_float
+
+# Columns of the accounts overview table, in order
+ACCOUNT_COLUMNS = (
+    "id",
+    "name",
+    "exchange",
+    "usd_amount",
+    "btc_amount",
+    "usd_profit",
+    "usd_profit_percentage",
+    "day_profit_usd",
+    "day_profit_usd_percentage",
+    "is_locked",
+)
+
+# Columns summed into the totals row
+ACCOUNT_TOTALS = ("usd_amount", "btc_amount", "usd_profit", "day_profit_usd")
+
+
+class AccountsCache:
+    """Short-lived cache of the raw ver1/accounts list."""
+
+    def __init__(self) -> None:
+        self._entry: tuple[float, list[Dict[str, Any]]] | None = None
+
+    async def get_accounts(
+        self, max_age: float | None = None
+    ) -> list[Dict[str, Any]] | Dict[str, Any]:
+        """Return all connected accounts, refetching when stale."""
+        ttl = get_account_cache_ttl() if max_age is None else max_age
+        hit = self._entry is not None and time.monotonic() - self._entry[0] < ttl
+        _metrics.cache_lookup("accounts", hit)
+        if self._entry is not None and hit:
+            return self._entry[1]
+
+        with fresh_responses(max_age == 0):
+            response = await api_request("ver1/accounts", method="GET")
+        if "error" in response:
+            return response
+        accounts = response.get("data", [])
+        if not isinstance(accounts, list):
+            return {"error": f"Unexpected accounts response: {type(accounts).__name__}"}
+
+        accounts = [account for account in accounts if isinstance(account, dict)]
+        self._entry = (time.monotonic(), accounts)
+        return accounts
+
+    def peek(self) -> list[Dict[str, Any]] | None:
+        """Return cached accounts without fetching, regardless of age."""
+        return self._entry[1] if self._entry is not None else None
+
+    def clear(self) -> None:
+        """Drop the cached account list."""
+        self._entry = None
+
+
+def account_row(account: Dict[str, Any], details: Dict[str, Any]) -> list[Any]:
+    """One overview table row from list metadata and per-account details."""
+    merged = {**account, **details}
+    return [
+        merged.get("id"),
+        merged.get("name"),
+        merged.get("market_code") or merged.get("exchange_name"),
+        round(to_float(merged.get("usd_amount")), 2),
+        round(to_float(merged.get("btc_amount")), 8),
+        round(to_float(merged.get("usd_profit")), 2),
+        round(to_float(merged.get("usd_profit_percentage")), 2),
+        round(to_float(merged.get("day_profit_usd")), 2),
+        round(to_float(merged.get("day_profit_usd_percentage")), 2),
+        bool(merged.get("is_locked")),
+    ]
+
+
+def accounts_table(rows: list[list[Any]]) -> Dict[str, Any]:
+    """Assemble overview rows into a column-oriented table with totals.
+
+    Rows are ordered by USD balance, largest first.
+    """
+    usd = ACCOUNT_COLUMNS.index("usd_amount")
+    rows = sorted(rows, key=lambda row: row[usd], reverse=True)
+    totals = {
+        name: round(sum(row[ACCOUNT_COLUMNS.index(name)] for row in rows), 8)
+        for name in ACCOUNT_TOTALS
+    }
+    return {"columns": list(ACCOUNT_COLUMNS), "rows": rows, "totals": totals}
+
+
+# Global account list cache shared by account tools
+_accounts_cache = AccountsCache()
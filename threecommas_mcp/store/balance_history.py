@@ -0,0 +1,257 @@
+"""Local balance snapshot history for 3Commas MCP
+
+This module records account balance fields from `ver1/accounts` at a fixed
+interval into compact columnar files, so balance ranges and rollups can be
+answered without calling the slow balance-history endpoint.
+
+Each account is stored as one or more segments. A segment keeps its first
+sample (timestamp and fixed-point values) in the index and appends one
+20-byte record per later sample: the seconds since the previous sample and
+the fixed-point change of every field (cents for USD, satoshi for BTC).
+Segment files are read through NumPy memory maps and decoded with cumsum.
+A new segment starts when a change does not fit the 32-bit record fields.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict
+
+import numpy as np
+
+from ..utils.env import get_data_dir
+from ..utils.lifecycle import on_shutdown
+from .accounts import _accounts_cache
+
+logger = logging.getLogger(__name__)
+
+# Balance fields recorded per account and their fixed-point scale
+BALANCE_FIELDS = ("usd_amount", "btc_amount", "usd_profit", "day_profit_usd")
+_SCALES = np.array([100, 100_000_000, 100, 100], dtype=np.int64)
+
+# One record per sample after the first of a segment (20 bytes)
+RECORD = np.dtype(
+    [("dt", "<u4"), *((name, "<i4") for name in BALANCE_FIELDS)],
+)
+
+_I4 = np.iinfo(np.int32)
+_U4 = np.iinfo(np.uint32)
+
+
+def _fixed_point(account: Dict[str, Any]) -> np.ndarray:
+    """Balance fields of an account as fixed-point integers."""
+    values = []
+    for name in BALANCE_FIELDS:
+        try:
+            value = float(account.get(name) or 0)
+        except (TypeError, ValueError):
+            value = 0.0
+        values.append(value if np.isfinite(value) else 0.0)
+    return np.rint(np.array(values) * _SCALES).astype(np.int64)
+
+
+class BalanceHistoryStore:
+    """Delta-encoded, memory-mapped balance samples per account."""
+
+    def __init__(self, path: str | None = None) -> None:
+        self._path = path
+        self._index: Dict[str, list[Dict[str, Any]]] | None = None
+        self._lock = threading.Lock()
+
+    def _directory(self) -> str:
+        return self._path or os.path.join(get_data_dir(), "balances")
+
+    def _load(self) -> Dict[str, list[Dict[str, Any]]]:
+        """Read the segment index lazily."""
+        if self._index is None:
+            index_path = os.path.join(self._directory(), "index.json")
+            try:
+                with open(index_path, encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except FileNotFoundError:
+                self._index = {}
+            except (OSError, ValueError) as e:
+                logger.warning(f"Balance history index unreadable at {index_path}: {e}")
+                self._index = {}
+        return self._index
+
+    def _save(self) -> None:
+        """Write the segment index atomically."""
+        index_path = os.path.join(self._directory(), "index.json")
+        with open(index_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+        os.replace(index_path + ".tmp", index_path)
+
+    def append(self, timestamp: int, accounts: list[Dict[str, Any]]) -> int:
+        """Record one sample for each account; returns the number recorded."""
+        with self._lock:
+            index = self._load()
+            os.makedirs(self._directory(), exist_ok=True)
+            recorded = 0
+            for account in accounts:
+                if account.get("id") is None:
+                    continue
+                account_id = str(account["id"])
+                values = _fixed_point(account)
+                segments = index.setdefault(account_id, [])
+                segment = segments[-1] if segments else None
+
+                if segment is not None:
+                    dt = timestamp - segment["last_t"]
+                    deltas = values - np.array(segment["last"], dtype=np.int64)
+                    fits = 0 <= dt <= _U4.max and bool(
+                        np.all((deltas >= _I4.min) & (deltas <= _I4.max))
+                    )
+                    if fits:
+                        record = np.zeros(1, dtype=RECORD)
+                        record["dt"] = dt
+                        for name, delta in zip(BALANCE_FIELDS, deltas):
+                            record[name] = delta
+                        with open(
+                            os.path.join(self._directory(), segment["file"]), "ab"
+                        ) as f:
+                            # Drop records a crash wrote after the last index save
+                            f.truncate(segment["count"] * RECORD.itemsize)
+                            f.write(record.tobytes())
+                        segment["count"] += 1
+                        segment["last_t"] = timestamp
+                        segment["last"] = values.tolist()
+                        recorded += 1
+                        continue
+
+                # First sample of a new segment lives in the index only
+                segments.append(
+                    {
+                        "file": f"{account_id}-{len(segments)}.bin",
+                        "t0": timestamp,
+                        "base": values.tolist(),
+                        "count": 0,
+                        "last_t": timestamp,
+                        "last": values.tolist(),
+                    }
+                )
+                recorded += 1
+            self._save()
+        return recorded
+
+    def accounts(self) -> list[str]:
+        """Account IDs with recorded samples."""
+        with self._lock:
+            return sorted(self._load())
+
+    def read(
+        self, account_id: str, start: int | None = None, end: int | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Decode an account's samples within [start, end] (Unix seconds).
+
+        Returns:
+            (timestamps int64 array, values float64 array of shape (n, fields))
+        """
+        with self._lock:
+            segments = [dict(s) for s in self._load().get(str(account_id), [])]
+
+        times, values = [], []
+        for segment in segments:
+            if (end is not None and segment["t0"] > end) or (
+                start is not None and segment["last_t"] < start
+            ):
+                continue
+            base = np.array(segment["base"], dtype=np.int64)
+            t = np.array([segment["t0"]], dtype=np.int64)
+            fixed = base[np.newaxis, :]
+            if segment["count"]:
+                records = np.memmap(
+                    os.path.join(self._directory(), segment["file"]),
+                    dtype=RECORD,
+                    mode="r",
+                    shape=(segment["count"],),
+                )
+                deltas = np.stack(
+                    [records[name].astype(np.int64) for name in BALANCE_FIELDS], axis=1
+                )
+                t = np.concatenate([t, t[0] + np.cumsum(records["dt"], dtype=np.int64)])
+                fixed = np.concatenate([fixed, base + np.cumsum(deltas, axis=0)])
+            times.append(t)
+            values.append(fixed / _SCALES)
+
+        if not times:
+            return np.empty(0, dtype=np.int64), np.empty((0, len(BALANCE_FIELDS)))
+        t = np.concatenate(times)
+        v = np.concatenate(values)
+        keep = np.ones(t.size, dtype=bool)
+        if start is not None:
+            keep &= t >= start
+        if end is not None:
+            keep &= t <= end
+        return t[keep], v[keep]
+
+    def stats(self) -> Dict[str, Any]:
+        """Sample counts and on-disk size of the store."""
+        with self._lock:
+            index = self._load()
+            samples = sum(s["count"] + 1 for segs in index.values() for s in segs)
+            records = sum(s["count"] for segs in index.values() for s in segs)
+        return {
+            "accounts": len(index),
+            "samples": samples,
+            "bytes": records * RECORD.itemsize,
+        }
+
+
+class BalanceSampler:
+    """Background task recording account balances at a fixed interval."""
+
+    def __init__(self, store: BalanceHistoryStore) -> None:
+        self._store = store
+        self._task: asyncio.Task[None] | None = None
+        self.last_sample: float | None = None
+        self.last_error: str | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def sample(self) -> int:
+        """Fetch ver1/accounts once and record every account's balances."""
+        accounts = await _accounts_cache.get_accounts(max_age=0)
+        if isinstance(accounts, dict):
+            self.last_error = str(accounts.get("error"))
+            return 0
+        self.last_sample = time.time()
+        self.last_error = None
+        return await asyncio.to_thread(
+            self._store.append, int(self.last_sample), accounts
+        )
+
+    async def _run(self, interval: float) -> None:
+        while True:
+            try:
+                await self.sample()
+            except (OSError, ValueError) as e:
+                self.last_error = str(e)
+                logger.warning(f"Balance sample failed: {e}")
+            await asyncio.sleep(interval)
+
+    def start(self, interval: float) -> None:
+        """Start sampling every interval seconds (no-op if already running)."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run(interval))
+            on_shutdown(self.stop)
+
+    async def stop(self) -> None:
+        """Cancel the sampling task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Global balance history store and sampler used by balance history tools
+_balance_store = BalanceHistoryStore()
+_balance_sampler = BalanceSampler(_balance_store)
@@ -0,0 +1,340 @@
+"""Bot list snapshot and change feed for 3Commas MCP
+
+This module keeps a local SQLite snapshot of every DCA bot with a content
+hash per bot. Incremental syncs page `ver1/bots` sorted by updated_at
+(newest first) and stop at the last seen update, so only recently changed
+bots are transferred. Every detected difference is appended to a change
+feed with a field-level diff. Periodic full syncs detect deleted bots.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, NamedTuple
+
+from ..api.client import api_request
+from ..utils.env import get_data_dir, get_full_sync_interval
+from .fleet import fetch_all_bots
+
+logger = logging.getLogger(__name__)
+
+# Page size for incremental syncs; most syncs touch only a handful of bots
+DELTA_PAGE_SIZE = 100
+
+# Fields excluded from the content hash because they change without content
+_VOLATILE_FIELDS = ("updated_at",)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bots (
+    id TEXT PRIMARY KEY,
+    account_id TEXT,
+    hash TEXT NOT NULL,
+    updated_at TEXT,
+    payload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bot_changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    detected_at TEXT NOT NULL,
+    bot_id TEXT NOT NULL,
+    account_id TEXT,
+    kind TEXT NOT NULL,
+    diff TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bot_changes_detected ON bot_changes (detected_at);
+CREATE TABLE IF NOT EXISTS bot_sync_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class SyncSummary(NamedTuple):
+    """Outcome of one snapshot sync."""
+
+    mode: str
+    fetched: int
+    changes: int
+    detected_at: str
+
+
+def content_hash(bot: Dict[str, Any]) -> str:
+    """Stable hash of a bot's content, ignoring volatile fields."""
+    content = {k: v for k, v in bot.items() if k not in _VOLATILE_FIELDS}
+    encoded = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _list_diff(old: list[Any], new: list[Any]) -> Dict[str, Any] | None:
+    """Diff lists by element id (dicts) or value (scalars)."""
+
+    def keys(items: list[Any]) -> list[Any]:
+        return [
+            item.get("id") if isinstance(item, dict) else json.dumps(item, default=str)
+            for item in items
+        ]
+
+    old_keys, new_keys = keys(old), keys(new)
+    added = [k for k in new_keys if k not in old_keys]
+    removed = [k for k in old_keys if k not in new_keys]
+    if added or removed:
+        return {"added": added, "removed": removed}
+    # Same membership but changed contents (e.g. a deal's bought volume)
+    changed = [
+        k
+        for k, a, b in zip(old_keys, old, new)
+        if isinstance(a, dict) and isinstance(b, dict) and a != b
+    ]
+    return {"changed": changed} if changed else None
+
+
+def diff_bots(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Field-level diff between two versions of a bot.
+
+    Scalars are reported as [old, new]; lists as added/removed/changed element
+    ids, so a changed active deal does not repeat the whole deal payload.
+    """
+    diff: Dict[str, Any] = {}
+    for key in sorted(set(old) | set(new)):
+        if key in _VOLATILE_FIELDS:
+            continue
+        before, after = old.get(key), new.get(key)
+        if before == after:
+            continue
+        if isinstance(before, list) or isinstance(after, list):
+            list_diff = _list_diff(before or [], after or [])
+            if list_diff:
+                diff[key] = list_diff
+        elif isinstance(before, dict) or isinstance(after, dict):
+            diff[key] = {"changed": True}
+        else:
+            diff[key] = [before, after]
+    return diff
+
+
+class BotSnapshotStore:
+    """SQLite-backed bot snapshot with content hashes and a change feed."""
+
+    def __init__(self, path: str | None = None) -> None:
+        self._path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database lazily, falling back to memory if unwritable."""
+        if self._conn is None:
+            path = self._path or os.path.join(get_data_dir(), "bot_snapshot.db")
+            try:
+                if path != ":memory:":
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                self._conn = sqlite3.connect(path, check_same_thread=False)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Bot snapshot store unavailable at {path}: {e}")
+                self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def _meta(self, key: str) -> str | None:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT value FROM bot_sync_meta WHERE key = ?", (key,))
+                .fetchone()
+            )
+        return row[0] if row else None
+
+    def watermark(self) -> str | None:
+        """Newest updated_at in the snapshot, if any."""
+        with self._lock:
+            row = self._connect().execute("SELECT MAX(updated_at) FROM bots").fetchone()
+        return row[0] if row else None
+
+    def apply(self, bots: list[Dict[str, Any]], full: bool, detected_at: str) -> int:
+        """Merge fetched bots into the snapshot and record their changes.
+
+        Args:
+            bots: Fetched bot dicts
+            full: bots is the complete list, so missing bots were removed
+            detected_at: Timestamp stored with each change
+
+        Returns:
+            Number of change records written.
+        """
+        with self._lock:
+            conn = self._connect()
+            stored = {
+                bot_id: (digest, payload)
+                for bot_id, digest, payload in conn.execute(
+                    "SELECT id, hash, payload FROM bots"
+                )
+            }
+            baseline = not stored
+
+            upserts, changes = [], []
+            seen = set()
+            for bot in bots:
+                bot_id = str(bot.get("id"))
+                seen.add(bot_id)
+                digest = content_hash(bot)
+                account_id = str(bot.get("account_id"))
+                previous = stored.get(bot_id)
+                # Always store the row so updated_at (the sync watermark) advances
+                upserts.append(
+                    (bot_id, account_id, digest, bot.get("updated_at"), json.dumps(bot))
+                )
+                if baseline or (previous is not None and previous[0] == digest):
+                    continue
+                if previous is None:
+                    kind, diff = "added", {"name": bot.get("name")}
+                else:
+                    kind, diff = "updated", diff_bots(json.loads(previous[1]), bot)
+                changes.append(
+                    (detected_at, bot_id, account_id, kind, json.dumps(diff))
+                )
+
+            removed = sorted(set(stored) - seen) if full and not baseline else []
+            for bot_id in removed:
+                old = json.loads(stored[bot_id][1])
+                changes.append(
+                    (
+                        detected_at,
+                        bot_id,
+                        str(old.get("account_id")),
+                        "removed",
+                        json.dumps({"name": old.get("name")}),
+                    )
+                )
+
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO bots "
+                    "(id, account_id, hash, updated_at, payload) VALUES (?, ?, ?, ?, ?)",
+                    upserts,
+                )
+                conn.executemany(
+                    "DELETE FROM bots WHERE id = ?", [(bot_id,) for bot_id in removed]
+                )
+                conn.executemany(
+                    "INSERT INTO bot_changes "
+                    "(detected_at, bot_id, account_id, kind, diff) VALUES (?, ?, ?, ?, ?)",
+                    changes,
+                )
+                meta = [("last_sync", detected_at)]
+                if full:
+                    meta.append(("last_full_sync", str(time.time())))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO bot_sync_meta (key, value) VALUES (?, ?)",
+                    meta,
+                )
+        return len(changes)
+
+    def changes_since(
+        self,
+        since: str,
+        account_id: int = 0,
+        limit: int = 100,
+        inclusive: bool = False,
+    ) -> list[Dict[str, Any]]:
+        """Change records after a cursor, oldest first.
+
+        Args:
+            since: Cursor from a previous change record, or an ISO timestamp
+            account_id: Only changes of this account (0 = all accounts)
+            limit: Maximum records
+            inclusive: Include records detected exactly at an ISO `since`
+        """
+        value: int | str
+        if since.isdigit():
+            condition, value = "seq > ?", int(since)
+        else:
+            condition, value = f"detected_at {'>=' if inclusive else '>'} ?", since
+        query = (
+            "SELECT seq, detected_at, bot_id, account_id, kind, diff FROM bot_changes "
+            f"WHERE {condition}"
+        )
+        args: list[Any] = [value]
+        if account_id:
+            query += " AND account_id = ?"
+            args.append(str(account_id))
+        query += " ORDER BY seq LIMIT ?"
+        args.append(limit)
+        with self._lock:
+            rows = self._connect().execute(query, args).fetchall()
+        return [
+            {
+                "cursor": str(seq),
+                "detected_at": detected_at,
+                "bot_id": bot_id,
+                "account_id": account,
+                "kind": kind,
+                "diff": json.loads(diff),
+            }
+            for seq, detected_at, bot_id, account, kind, diff in rows
+        ]
+
+    def latest_cursor(self) -> str:
+        """Cursor of the newest change record ("0" when there are none)."""
+        with self._lock:
+            row = self._connect().execute("SELECT MAX(seq) FROM bot_changes").fetchone()
+        return str(row[0] or 0)
+
+    def needs_full_sync(self) -> bool:
+        """Whether the snapshot is empty or its last full sync is too old."""
+        last_full = self._meta("last_full_sync")
+        if last_full is None:
+            return True
+        return time.time() - float(last_full) >= get_full_sync_interval()
+
+    async def _fetch_updated(
+        self, watermark: str
+    ) -> list[Dict[str, Any]] | Dict[str, Any]:
+        """Page bots newest-updated first until reaching the watermark."""
+        bots: list[Dict[str, Any]] = []
+        offset = 0
+        while True:
+            params = {
+                "sort_by": "updated_at",
+                "order_direction": "DESC",
+                "limit": str(DELTA_PAGE_SIZE),
+                "offset": str(offset),
+            }
+            response = await api_request("ver1/bots", params=params, method="GET")
+            if "error" in response:
+                return response
+            page = [bot for bot in response.get("data", []) if isinstance(bot, dict)]
+            bots.extend(page)
+            # Bots updated at the watermark are refetched; hashes dedupe them
+            reached = any(str(bot.get("updated_at") or "") < watermark for bot in page)
+            if reached or len(page) < DELTA_PAGE_SIZE:
+                return bots
+            offset += DELTA_PAGE_SIZE
+
+    async def sync(self, full: bool = False) -> SyncSummary | Dict[str, Any]:
+        """Bring the snapshot up to date, incrementally when possible.
+
+        Args:
+            full: Force a complete refetch (also detects deleted bots)
+
+        Returns:
+            SyncSummary, or {"error": ...} if fetching fails.
+        """
+        watermark = self.watermark()
+        full = full or watermark is None or self.needs_full_sync()
+        if full:
+            bots = await fetch_all_bots()
+        else:
+            bots = await self._fetch_updated(str(watermark))
+        if isinstance(bots, dict):
+            return bots
+
+        detected_at = datetime.now(timezone.utc).isoformat(timespec="microseconds")
+        changes = self.apply(bots, full, detected_at)
+        return SyncSummary("full" if full else "delta", len(bots), changes, detected_at)
+
+
+# Global bot snapshot used by get_dca_bot_changes
+_bot_snapshot = BotSnapshotStore()
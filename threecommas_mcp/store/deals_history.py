@@ -0,0 +1,368 @@
+"""Local deals history store for 3Commas MCP
+
+This module pages through `ver1/deals` and streams each page into a SQLite
+table as it arrives, so exports of tens of thousands of deals never sit in
+memory and can be queried locally afterwards. Paging runs on the dedicated
+deals rate-limit bucket (120 req/min), leaving the global bucket free for
+other tool calls.
+
+Syncs resume at the newest created_at already stored, so deals that were
+still running when stored would never be fetched again. Each sync therefore
+also stores the currently active deals, and refetches stored deals that are
+no longer active through `ver1/deals/:deal_id/show` (its own 120 req/min
+bucket) to record how they finished.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, NamedTuple
+
+from ..api.burst import APICall, fan_out
+from ..api.client import api_request
+from ..utils.env import get_data_dir
+
+logger = logging.getLogger(__name__)
+
+# Maximum page size accepted by ver1/deals
+PAGE_SIZE = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS deals (
+    id INTEGER PRIMARY KEY,
+    bot_id TEXT,
+    account_id TEXT,
+    pair TEXT,
+    status TEXT,
+    created_at TEXT,
+    closed_at TEXT,
+    final_profit REAL,
+    usd_final_profit REAL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS deals_bot_created ON deals (bot_id, created_at);
+CREATE INDEX IF NOT EXISTS deals_created ON deals (created_at);
+CREATE TABLE IF NOT EXISTS deals_sync (
+    filter_key TEXT PRIMARY KEY,
+    last_created_at TEXT NOT NULL,
+    synced_at TEXT NOT NULL
+);
+"""
+
+# Deal status groups matching the ver1/deals scope filter
+SCOPE_STATUSES = {
+    "active": ("created", "base_order_placed", "bought", "panic_sell_pending"),
+    "finished": ("completed", "cancelled", "failed", "panic_sold"),
+    "completed": ("completed", "panic_sold"),
+    "cancelled": ("cancelled",),
+    "failed": ("failed",),
+}
+
+
+class SyncResult(NamedTuple):
+    """Outcome of one deals history sync run."""
+
+    fetched: int
+    pages: int
+    complete: bool
+    last_created_at: str | None
+    refreshed: int = 0
+
+
+def _float_or_none(value: Any) -> float | None:
+    """Convert an API numeric value to float, or None if missing."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def sync_filter_key(
+    bot_id: str | None, account_id: int | None, scope: str | None
+) -> str:
+    """Key identifying a sync high-water mark for one filter combination."""
+    return f"bot={bot_id or '*'}|account={account_id or '*'}|scope={scope or '*'}"
+
+
+async def iter_deal_pages(
+    params: Dict[str, str], page_size: int = PAGE_SIZE, max_pages: int | None = None
+) -> AsyncIterator[list[Dict[str, Any]] | Dict[str, Any]]:
+    """Yield pages of ver1/deals oldest first, one request per page.
+
+    Yields each page as a list of deal dicts, or a single {"error": ...}
+    dict after which iteration stops.
+    """
+    offset = 0
+    pages = 0
+    while max_pages is None or pages < max_pages:
+        page_params = {
+            **params,
+            "order": "created_at",
+            "order_direction": "asc",
+            "limit": str(page_size),
+            "offset": str(offset),
+        }
+        response = await api_request("ver1/deals", params=page_params, method="GET")
+        if "error" in response:
+            yield response
+            return
+
+        page = response.get("data", [])
+        if not isinstance(page, list):
+            yield {"error": f"Unexpected deals response: {type(page).__name__}"}
+            return
+
+        pages += 1
+        yield [deal for deal in page if isinstance(deal, dict)]
+        if len(page) < page_size:
+            return
+        offset += page_size
+
+
+class DealsHistoryStore:
+    """SQLite-backed deals table keyed by deal id, with per-filter sync marks."""
+
+    def __init__(self, path: str | None = None) -> None:
+        self._path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database lazily, falling back to memory if unwritable."""
+        if self._conn is None:
+            path = self._path or os.path.join(get_data_dir(), "deals_history.db")
+            try:
+                if path != ":memory:":
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                self._conn = sqlite3.connect(path, check_same_thread=False)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Deals history store unavailable at {path}: {e}")
+                self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def upsert(self, deals: list[Dict[str, Any]]) -> int:
+        """Insert or replace deals by id; returns the number stored."""
+        rows = [
+            (
+                int(deal["id"]),
+                str(deal.get("bot_id")) if deal.get("bot_id") is not None else None,
+                str(deal.get("account_id"))
+                if deal.get("account_id") is not None
+                else None,
+                deal.get("pair"),
+                deal.get("status"),
+                deal.get("created_at"),
+                deal.get("closed_at"),
+                _float_or_none(deal.get("final_profit")),
+                _float_or_none(deal.get("usd_final_profit")),
+                json.dumps(deal),
+            )
+            for deal in deals
+            if str(deal.get("id", "")).isdigit()
+        ]
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO deals (id, bot_id, account_id, pair, "
+                    "status, created_at, closed_at, final_profit, usd_final_profit, "
+                    "payload) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+        return len(rows)
+
+    def high_water_mark(self, filter_key: str) -> str | None:
+        """Get the newest created_at synced for a filter, if any."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT last_created_at FROM deals_sync WHERE filter_key = ?",
+                    (filter_key,),
+                )
+                .fetchone()
+            )
+        return row[0] if row else None
+
+    def set_high_water_mark(self, filter_key: str, created_at: str) -> None:
+        """Record the newest created_at synced for a filter."""
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO deals_sync "
+                    "(filter_key, last_created_at, synced_at) VALUES (?, ?, ?)",
+                    (filter_key, created_at, now),
+                )
+
+    def unfinished_ids(
+        self, bot_id: str | None = None, account_id: int | None = None
+    ) -> list[int]:
+        """Get ids of stored deals that were still active when last fetched."""
+        statuses = SCOPE_STATUSES["active"]
+        clauses = [f"status IN ({', '.join('?' * len(statuses))})"]
+        args: list[Any] = list(statuses)
+        if bot_id is not None:
+            clauses.append("bot_id = ?")
+            args.append(bot_id)
+        if account_id:
+            clauses.append("account_id = ?")
+            args.append(str(account_id))
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(f"SELECT id FROM deals WHERE {' AND '.join(clauses)}", args)
+                .fetchall()
+            )
+        return [row[0] for row in rows]
+
+    def query(
+        self,
+        bot_id: str | None = None,
+        account_id: int | None = None,
+        scope: str | None = None,
+        created_from: str | None = None,
+        created_to: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> tuple[int, list[Dict[str, Any]], Dict[str, float]]:
+        """Query stored deals, newest first.
+
+        Returns:
+            (total matching deals, page of deal payloads, profit totals)
+        """
+        clauses, args = [], []
+        if bot_id is not None:
+            clauses.append("bot_id = ?")
+            args.append(bot_id)
+        if account_id:
+            clauses.append("account_id = ?")
+            args.append(str(account_id))
+        if scope is not None:
+            statuses = SCOPE_STATUSES[scope]
+            clauses.append(f"status IN ({', '.join('?' * len(statuses))})")
+            args.extend(statuses)
+        if created_from is not None:
+            clauses.append("created_at >= ?")
+            args.append(created_from)
+        if created_to is not None:
+            clauses.append("created_at <= ?")
+            args.append(created_to)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            conn = self._connect()
+            total, profit, usd_profit = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(final_profit), 0), "
+                f"COALESCE(SUM(usd_final_profit), 0) FROM deals {where}",
+                args,
+            ).fetchone()
+            rows = conn.execute(
+                f"SELECT payload FROM deals {where} "
+                "ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?",
+                [*args, limit, offset],
+            ).fetchall()
+        totals = {"final_profit": profit, "usd_final_profit": usd_profit}
+        return total, [json.loads(row[0]) for row in rows], totals
+
+    async def sync(
+        self,
+        bot_id: str | None = None,
+        account_id: int | None = None,
+        scope: str | None = None,
+        from_date: str | None = None,
+        max_pages: int = 50,
+    ) -> SyncResult | Dict[str, Any]:
+        """Page ver1/deals into the store, resuming from the last sync.
+
+        Each page is written before the next is requested. Without from_date
+        the sync resumes at the newest created_at already stored for the same
+        filters; that boundary deal is refetched and deduplicated by id.
+        Afterwards active deals are stored and stored deals that have since
+        finished are refetched (see refresh_unfinished).
+
+        Returns:
+            SyncResult, or {"error": ...} if a page fails (earlier pages stay stored).
+        """
+        key = sync_filter_key(bot_id, account_id, scope)
+        start = from_date or self.high_water_mark(key)
+        params = {
+            name: str(value)
+            for name, value in (
+                ("bot_id", bot_id),
+                ("account_id", account_id or None),
+                ("scope", scope),
+                ("from", start),
+            )
+            if value is not None
+        }
+
+        fetched = pages = 0
+        newest = start
+        complete = False
+        async for page in iter_deal_pages(params, max_pages=max_pages):
+            if isinstance(page, dict):
+                return page
+            fetched += self.upsert(page)
+            pages += 1
+            created = [str(d["created_at"]) for d in page if d.get("created_at")]
+            if created:
+                newest = max(created + ([newest] if newest else []))
+                self.set_high_water_mark(key, newest)
+            complete = len(page) < PAGE_SIZE
+
+        refreshed = await self.refresh_unfinished(bot_id, account_id)
+        if isinstance(refreshed, dict):
+            return refreshed
+        return SyncResult(fetched, pages, complete, newest, refreshed)
+
+    async def refresh_unfinished(
+        self, bot_id: str | None = None, account_id: int | None = None
+    ) -> int | Dict[str, Any]:
+        """Store the active deals and refetch stored deals that have finished.
+
+        Active deals are stored whatever scope was synced, so a deal created
+        before a scoped sync's resume point is known once it finishes.
+
+        Returns:
+            Deals refetched after finishing, or {"error": ...} if listing active deals fails.
+        """
+        params = {
+            name: str(value)
+            for name, value in (
+                ("bot_id", bot_id),
+                ("account_id", account_id or None),
+                ("scope", "active"),
+            )
+            if value is not None
+        }
+        active: set[int] = set()
+        async for page in iter_deal_pages(params):
+            if isinstance(page, dict):
+                return page
+            self.upsert(page)
+            active.update(int(d["id"]) for d in page if str(d.get("id", "")).isdigit())
+
+        finished = [
+            i for i in self.unfinished_ids(bot_id, account_id) if i not in active
+        ]
+        responses = await fan_out(
+            [APICall(f"ver1/deals/{deal_id}/show") for deal_id in finished]
+        )
+        deals = []
+        for deal_id, response in zip(finished, responses):
+            if "error" in response:
+                # Stays marked active and is retried on the next sync
+                logger.warning(f"Could not refetch finished deal {deal_id}: {response}")
+            else:
+                deals.append(response)
+        return self.upsert(deals)
+
+
+# Global deals history store used by deal history tools
+_deals_store = DealsHistoryStore()
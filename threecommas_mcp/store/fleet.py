@@ -0,0 +1,177 @@
+"""Cached DCA bot fleet for 3Commas MCP
+
+This module pages through `ver1/bots` with the existing API client and keeps
+the raw (unfiltered) bot list in memory for a short time, so fleet-wide tools
+can share one download instead of each pulling every bot again.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict
+
+from ..utils.env import get_fleet_cache_ttl
+from ..api.client import api_request
+from ..api.prefetch import fresh_responses
+from ..utils.metrics import _metrics
+
+# Maximum page size accepted by ver1/bots
+PAGE_SIZE = 1000
+
+# Bot-level DCA settings copied onto deals that do not carry them
+DEAL_LADDER_FIELDS = (
+    "strategy",
+    "base_order_volume",
+    "safety_order_volume",
+    "martingale_volume_coefficient",
+    "martingale_step_coefficient",
+    "safety_order_step_percentage",
+    "max_safety_orders",
+)
+
+
+async def fetch_all_bots(
+    params: Dict[str, str] | None = None, page_size: int = PAGE_SIZE
+) -> list[Dict[str, Any]] | Dict[str, Any]:
+    """Page through ver1/bots and return every bot matching params.
+
+    Args:
+        params: Query parameters applied to every page (limit/offset are managed here)
+        page_size: Bots requested per page (1-1000)
+
+    Returns:
+        List of raw bot dicts, or {"error": ...} if any page fails.
+    """
+    bots: list[Dict[str, Any]] = []
+    offset = 0
+    while True:
+        page_params = {
+            **(params or {}),
+            "limit": str(page_size),
+            "offset": str(offset),
+        }
+        response = await api_request("ver1/bots", params=page_params, method="GET")
+        if "error" in response:
+            return response
+
+        page = response.get("data", [])
+        if not isinstance(page, list):
+            return {"error": f"Unexpected bot list response: {type(page).__name__}"}
+
+        bots.extend(bot for bot in page if isinstance(bot, dict))
+        if len(page) < page_size:
+            return bots
+        offset += page_size
+
+
+def _nested_deals(bot: Dict[str, Any]) -> list[Dict[str, Any]]:
+    """Get a bot's active deals with missing ladder settings filled from the bot."""
+    deals = []
+    for deal in bot.get("active_deals") or []:
+        if not isinstance(deal, dict):
+            continue
+        defaults = {
+            k: bot.get(k)
+            for k in (*DEAL_LADDER_FIELDS, "account_id", "account_name")
+            if deal.get(k) is None
+        }
+        deals.append({**deal, **defaults, "bot_id": deal.get("bot_id", bot.get("id"))})
+    return deals
+
+
+def embedded_active_deals(bots: list[Dict[str, Any]]) -> list[Dict[str, Any]]:
+    """Get active deals embedded in a bot list without any upstream request."""
+    return [deal for bot in bots for deal in _nested_deals(bot)]
+
+
+async def collect_active_deals(
+    bots: list[Dict[str, Any]],
+) -> list[Dict[str, Any]] | Dict[str, Any]:
+    """Gather active deals nested in a bot list.
+
+    ver1/bots already embeds active deals, so most bots need no extra request.
+    Bots reporting more active deals than they embed are refetched concurrently
+    through ver1/bots/{id}/show.
+
+    Returns:
+        List of deal dicts (with bot ladder settings as fallbacks), or {"error": ...}.
+    """
+    deals: list[Dict[str, Any]] = []
+    incomplete = []
+    for bot in bots:
+        nested = _nested_deals(bot)
+        try:
+            expected = int(bot.get("active_deals_count") or 0)
+        except (TypeError, ValueError):
+            expected = 0
+        if expected > len(nested) and bot.get("id") is not None:
+            incomplete.append(bot)
+        else:
+            deals.extend(nested)
+
+    responses = await asyncio.gather(
+        *(
+            api_request(f"ver1/bots/{bot['id']}/show", method="GET")
+            for bot in incomplete
+        )
+    )
+    for bot, response in zip(incomplete, responses):
+        if "error" in response:
+            return response
+        deals.extend(_nested_deals({**bot, **response}))
+    return deals
+
+
+def _filter_account(
+    bots: list[Dict[str, Any]], account_id: int
+) -> list[Dict[str, Any]]:
+    """Select bots belonging to a single exchange account."""
+    return [bot for bot in bots if str(bot.get("account_id")) == str(account_id)]
+
+
+class BotFleetCache:
+    """Short-lived cache of the complete raw bot list, keyed by account."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[int, tuple[float, list[Dict[str, Any]]]] = {}
+
+    async def get_bots(
+        self, account_id: int = 0, max_age: float | None = None
+    ) -> list[Dict[str, Any]] | Dict[str, Any]:
+        """Return all bots for an account (0 = all), refetching when stale."""
+        ttl = get_fleet_cache_ttl() if max_age is None else max_age
+        cached = self._entries.get(account_id)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            _metrics.cache_lookup("bot_fleet", True)
+            return cached[1]
+
+        # A fresh all-accounts list already contains this account's bots
+        everything = self._entries.get(0)
+        if account_id and everything and time.monotonic() - everything[0] < ttl:
+            _metrics.cache_lookup("bot_fleet", True)
+            return _filter_account(everything[1], account_id)
+
+        _metrics.cache_lookup("bot_fleet", False)
+        params = {"account_id": str(account_id)} if account_id else None
+        with fresh_responses(max_age == 0):
+            result = await fetch_all_bots(params)
+        if isinstance(result, list):
+            self._entries[account_id] = (time.monotonic(), result)
+        return result
+
+    def peek(self, account_id: int = 0) -> list[Dict[str, Any]] | None:
+        """Return cached bots without fetching, regardless of age."""
+        cached = self._entries.get(account_id)
+        if cached is None and account_id:
+            # Fall back to the all-accounts list filtered locally
+            everything = self._entries.get(0)
+            if everything is not None:
+                return _filter_account(everything[1], account_id)
+        return cached[1] if cached is not None else None
+
+    def clear(self) -> None:
+        """Drop all cached bot lists."""
+        self._entries.clear()
+
+
+# Global fleet cache shared by fleet-wide tools
+_fleet_cache = BotFleetCache()
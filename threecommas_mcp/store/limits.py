@@ -0,0 +1,169 @@
+"""Local trading limits table for 3Commas MCP
+
+This module keeps a precomputed table of exchange trading limits built from
+currency-rate responses (`ver1/accounts/currency_rates`). Rows are keyed by
+(market_code, pair, limit_type) so order parameters can be checked locally
+without another API round-trip.
+"""
+
+import time
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, NamedTuple
+
+# Limit type used for rows fetched without an explicit limit_type
+DEFAULT_LIMIT_TYPE = "default"
+
+
+class PairLimits(NamedTuple):
+    """Trading limits for a single market/pair/limit_type combination."""
+
+    min_total: Decimal | None
+    min_lot_size: Decimal | None
+    max_lot_size: Decimal | None
+    lot_step: Decimal | None
+    min_price: Decimal | None
+    max_price: Decimal | None
+    price_step: Decimal | None
+    last_price: Decimal | None
+    updated_at: float
+
+
+def _to_decimal(value: Any) -> Decimal | None:
+    """Convert an API numeric value (usually a string) to Decimal."""
+    if value is None or value == "":
+        return None
+    try:
+        result = Decimal(str(value))
+    except (InvalidOperation, ValueError):
+        return None
+    return result if result.is_finite() else None
+
+
+def _is_step_multiple(value: Decimal, step: Decimal | None) -> bool:
+    """Check that value is an exact multiple of the exchange step size."""
+    if step is None or step <= 0:
+        return True
+    return value % step == 0
+
+
+class LimitsTable:
+    """Precomputed trading limits keyed by (market_code, pair, limit_type)."""
+
+    def __init__(self) -> None:
+        self._rows: Dict[tuple[str, str, str], PairLimits] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def update(
+        self,
+        market_code: str,
+        pair: str,
+        limit_type: str | None,
+        response: Dict[str, Any],
+    ) -> PairLimits:
+        """Store limits parsed from a raw currency-rate response."""
+        limits = PairLimits(
+            min_total=_to_decimal(response.get("minTotal")),
+            min_lot_size=_to_decimal(response.get("minLotSize")),
+            max_lot_size=_to_decimal(response.get("maxLotSize")),
+            lot_step=_to_decimal(response.get("lotStep")),
+            min_price=_to_decimal(response.get("minPrice")),
+            max_price=_to_decimal(response.get("maxPrice")),
+            price_step=_to_decimal(response.get("priceStep")),
+            last_price=_to_decimal(
+                response.get("last") or response.get("ask") or response.get("bid")
+            ),
+            updated_at=time.time(),
+        )
+        self._rows[(market_code, pair, limit_type or DEFAULT_LIMIT_TYPE)] = limits
+        return limits
+
+    def get(
+        self, market_code: str, pair: str, limit_type: str | None = None
+    ) -> PairLimits | None:
+        """Look up limits, falling back to rows fetched without a limit_type."""
+        key_type = limit_type or DEFAULT_LIMIT_TYPE
+        row = self._rows.get((market_code, pair, key_type))
+        if row is None and key_type != DEFAULT_LIMIT_TYPE:
+            row = self._rows.get((market_code, pair, DEFAULT_LIMIT_TYPE))
+        return row
+
+    def keys(self) -> list[tuple[str, str, str]]:
+        """Return all (market_code, pair, limit_type) keys in the table."""
+        return list(self._rows)
+
+    def clear(self) -> None:
+        """Drop all cached limits."""
+        self._rows.clear()
+
+    def validate_volume(
+        self,
+        limits: PairLimits,
+        volume: Decimal,
+        volume_type: str,
+        price: Decimal | None,
+    ) -> list[str]:
+        """Check a single order volume against pair limits.
+
+        Args:
+            limits: Limits row for the pair
+            volume: Order volume
+            volume_type: "quote_currency" or "base_currency"
+            price: Price used to convert between base and quote amounts
+
+        Returns:
+            List of human-readable violations (empty when the volume is valid).
+        """
+        violations: list[str] = []
+        if volume <= 0:
+            return [f"volume {volume} must be positive"]
+
+        if volume_type == "base_currency":
+            amount: Decimal | None = volume
+            total = volume * price if price is not None else None
+            if not _is_step_multiple(volume, limits.lot_step):
+                violations.append(
+                    f"amount {volume} is not a multiple of lot step {limits.lot_step}"
+                )
+        else:
+            total = volume
+            amount = volume / price if price else None
+
+        if (
+            total is not None
+            and limits.min_total is not None
+            and total < limits.min_total
+        ):
+            violations.append(
+                f"order total {total.normalize()} is below minimum total {limits.min_total}"
+            )
+        if amount is not None:
+            if limits.min_lot_size is not None and amount < limits.min_lot_size:
+                violations.append(
+                    f"amount {amount:.8f} is below minimum lot size {limits.min_lot_size}"
+                )
+            if limits.max_lot_size is not None and amount > limits.max_lot_size:
+                violations.append(
+                    f"amount {amount:.8f} exceeds maximum lot size {limits.max_lot_size}"
+                )
+        return violations
+
+    def validate_price(self, limits: PairLimits, price: Decimal) -> list[str]:
+        """Check an order price against the pair price range and precision."""
+        violations: list[str] = []
+        if limits.min_price is not None and price < limits.min_price:
+            violations.append(
+                f"price {price} is below minimum price {limits.min_price}"
+            )
+        if limits.max_price is not None and price > limits.max_price:
+            violations.append(f"price {price} exceeds maximum price {limits.max_price}")
+        if not _is_step_multiple(price, limits.price_step):
+            violations.append(
+                f"price {price} is not a multiple of price step {limits.price_step}"
+            )
+        return violations
+
+
+# Global limits table populated by get_currency_rates_and_limits
+_limits_table = LimitsTable()
@@ -0,0 +1,145 @@
+"""Cached pair sets for 3Commas MCP
+
+This module keeps the DCA pairs blacklist (`ver1/bots/pairs_black_list`)
+and per-market pair lists (`ver1/accounts/market_pairs`) as frozensets, so
+candidate pairs are screened with O(1) lookups. Stale sets keep answering
+while a refresh runs in the background; only the first lookup of a set
+waits for the API.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from typing import Any, Callable, Dict
+
+from ..utils.env import get_blacklist_cache_ttl, get_market_pairs_cache_ttl
+from ..api.client import api_request
+from ..api.prefetch import fresh_responses
+from ..utils.metrics import _metrics
+from ..utils.offload import _execution_policy, decode_response, response_body
+
+logger = logging.getLogger(__name__)
+
+_SEPARATORS = re.compile(r"[/\-:\s]+")
+
+
+def normalize_pair(pair: str) -> str:
+    """Uppercase a pair and join its currencies with "_" (accepts "/", "-", ":")."""
+    return _SEPARATORS.sub("_", pair.strip().upper())
+
+
+def pair_variants(pair: str) -> tuple[str, str]:
+    """A normalized pair and the same pair with its currencies swapped.
+
+    3Commas uses QUOTE_BASE (USDT_BTC) while exchanges often write BASE/QUOTE,
+    so lookups accept either orientation.
+    """
+    normalized = normalize_pair(pair)
+    first, _, second = normalized.partition("_")
+    return normalized, f"{second}_{first}" if second else normalized
+
+
+def parse_pairs(response: Dict[str, Any]) -> frozenset[str]:
+    """Extract normalized pairs from a blacklist or market pairs response.
+
+    Accepts {"pairs": [...]} and list responses (wrapped as {"data": [...]}),
+    with pairs given as strings or dicts carrying a "pair" or "symbol".
+    """
+    items = response.get("pairs", response.get("data", []))
+    pairs = set()
+    for item in items if isinstance(items, list) else []:
+        if isinstance(item, dict):
+            item = item.get("pair") or item.get("symbol")
+        if isinstance(item, str) and item.strip():
+            pairs.add(normalize_pair(item))
+    return frozenset(pairs)
+
+
+def _decode_and_parse(body: bytes) -> frozenset[str]:
+    # Runs in worker processes, which get the body rather than the decoded data
+    return parse_pairs(decode_response(body))
+
+
+async def parse_response_pairs(response: Dict[str, Any]) -> frozenset[str]:
+    """Parse pairs from an API response, in the worker pool if it is large."""
+    body = response_body(response)
+    if body is None or not _execution_policy.offloads(len(body)):
+        return parse_pairs(response)
+    if _execution_policy.pool == "process":
+        return await _execution_policy.run(len(body), "pairs", _decode_and_parse, body)
+    return await _execution_policy.run(len(body), "pairs", parse_pairs, response)
+
+
+class PairSetCache:
+    """Frozensets of pairs per key, refreshed in the background when stale."""
+
+    def __init__(
+        self,
+        path: str,
+        ttl: Callable[[], float],
+        params: Callable[[str], Dict[str, Any] | None] = lambda key: None,
+    ) -> None:
+        self._path = path
+        self._ttl = ttl
+        self._params = params
+        self._entries: Dict[str, tuple[float, frozenset[str]]] = {}
+        self._refreshing: Dict[str, asyncio.Task[Any]] = {}
+
+    async def load(self, response: Dict[str, Any], key: str = "") -> frozenset[str]:
+        """Store pairs parsed from a raw response (also used by list tools)."""
+        pairs = await parse_response_pairs(response)
+        self._entries[key] = (time.monotonic(), pairs)
+        return pairs
+
+    async def _fetch(self, key: str) -> frozenset[str] | Dict[str, Any]:
+        response = await api_request(self._path, params=self._params(key), method="GET")
+        if "error" in response:
+            return response
+        return await self.load(response, key)
+
+    def _refresh_in_background(self, key: str) -> None:
+        task = self._refreshing.get(key)
+        if task is not None and not task.done():
+            return
+
+        def done(finished: asyncio.Task[Any]) -> None:
+            if not finished.cancelled() and isinstance(finished.result(), dict):
+                logger.warning(f"Refreshing {self._path} failed: {finished.result()}")
+
+        self._refreshing[key] = asyncio.ensure_future(self._fetch(key))
+        self._refreshing[key].add_done_callback(done)
+
+    async def get(
+        self, key: str = "", max_age: float | None = None
+    ) -> tuple[frozenset[str], float] | Dict[str, Any]:
+        """Return the pair set for a key and its age in seconds.
+
+        A stale set is returned immediately while a background refresh runs;
+        max_age=0 waits for a fresh download instead.
+        """
+        cached = self._entries.get(key)
+        # Stale sets served during a background refresh count as hits
+        _metrics.cache_lookup(self._path, cached is not None and max_age != 0)
+        if cached is None or max_age == 0:
+            with fresh_responses(max_age == 0):
+                result = await self._fetch(key)
+            return result if isinstance(result, dict) else (result, 0.0)
+
+        age = time.monotonic() - cached[0]
+        if age >= (self._ttl() if max_age is None else max_age):
+            self._refresh_in_background(key)
+        return cached[1], age
+
+    def clear(self) -> None:
+        """Drop all cached pair sets."""
+        self._entries.clear()
+
+
+# Global pair sets shared by blacklist and market pair tools
+_blacklist_cache = PairSetCache("ver1/bots/pairs_black_list", get_blacklist_cache_ttl)
+_market_pairs_cache = PairSetCache(
+    "ver1/accounts/market_pairs",
+    get_market_pairs_cache_ttl,
+    params=lambda market_code: {"market_code": market_code} if market_code else None,
+)
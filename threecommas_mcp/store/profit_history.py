@@ -0,0 +1,220 @@
+"""Incremental profit-by-day store for 3Commas MCP
+
+This module keeps an append-only SQLite table of `ver1/bots/{id}/profit_by_day`
+rows per bot, together with the contiguous date range already synced. Callers
+fetch only the days that are missing (usually just today) and answer range
+queries locally.
+
+Methods block on SQLite; async callers run them with asyncio.to_thread.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import date, datetime, timezone
+from typing import Any, Dict, NamedTuple
+
+from ..utils.env import get_data_dir
+
+logger = logging.getLogger(__name__)
+
+# Keys that may carry the row date in profit_by_day responses
+_DATE_KEYS = ("date", "day", "d", "t")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profit_by_day (
+    bot_id TEXT NOT NULL,
+    day TEXT NOT NULL,
+    usd REAL NOT NULL,
+    btc REAL NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (bot_id, day)
+);
+CREATE TABLE IF NOT EXISTS profit_coverage (
+    bot_id TEXT PRIMARY KEY,
+    covered_from TEXT NOT NULL,
+    covered_to TEXT NOT NULL
+);
+"""
+
+
+class Coverage(NamedTuple):
+    """Contiguous date range already synced for a bot (inclusive)."""
+
+    covered_from: date
+    covered_to: date
+
+
+class ProfitRow(NamedTuple):
+    """A single stored profit_by_day row."""
+
+    day: date
+    usd: float
+    btc: float
+    payload: Dict[str, Any]
+
+
+def _parse_day(value: Any) -> date | None:
+    """Parse a row date given as ISO string or Unix timestamp."""
+    if isinstance(value, (int, float)) or (isinstance(value, str) and value.isdigit()):
+        return datetime.fromtimestamp(float(value), tz=timezone.utc).date()
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            return None
+    return None
+
+
+def _to_float(value: Any) -> float:
+    """Convert an API numeric value to float, defaulting to 0.0."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def extract_profit_rows(response: Dict[str, Any]) -> list[ProfitRow]:
+    """Extract dated profit rows from a raw profit_by_day response."""
+    data = response.get("data", response)
+    if isinstance(data, dict):
+        data = data.get("profit_by_day") or data.get("data") or []
+    if not isinstance(data, list):
+        return []
+
+    rows = []
+    for item in data:
+        if not isinstance(item, dict):
+            continue
+        day = next(
+            (d for d in (_parse_day(item.get(k)) for k in _DATE_KEYS) if d), None
+        )
+        if day is None:
+            continue
+        nested = item.get("profit")
+        profit: Dict[str, Any] = nested if isinstance(nested, dict) else item
+        usd = _to_float(profit.get("usd", profit.get("profit_usd")))
+        btc = _to_float(profit.get("btc", profit.get("profit_btc")))
+        rows.append(ProfitRow(day, usd, btc, item))
+    return rows
+
+
+class ProfitHistoryStore:
+    """SQLite-backed append-only profit_by_day store keyed by bot_id."""
+
+    def __init__(self, path: str | None = None) -> None:
+        self._path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database lazily, falling back to memory if unwritable."""
+        if self._conn is None:
+            path = self._path or os.path.join(get_data_dir(), "profit_history.db")
+            try:
+                if path != ":memory:":
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                self._conn = sqlite3.connect(path, check_same_thread=False)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Profit history store unavailable at {path}: {e}")
+                self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def _coverage(self, bot_id: str) -> Coverage | None:
+        # Callers hold the lock
+        row = (
+            self._connect()
+            .execute(
+                "SELECT covered_from, covered_to FROM profit_coverage WHERE bot_id = ?",
+                (bot_id,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        return Coverage(date.fromisoformat(row[0]), date.fromisoformat(row[1]))
+
+    def coverage(self, bot_id: str) -> Coverage | None:
+        """Get the synced date range for a bot, if any."""
+        with self._lock:
+            return self._coverage(bot_id)
+
+    def merge(
+        self, bot_id: str, rows: list[ProfitRow], fetched_from: date, fetched_to: date
+    ) -> Coverage:
+        """Upsert fetched rows and extend the synced range.
+
+        The range stays a single contiguous interval: a fetch that overlaps or
+        touches the existing range extends it, a disjoint fetch replaces it.
+        """
+        with self._lock:
+            # Read and extend the range under one lock so concurrent merges
+            # from worker threads do not overwrite each other's coverage
+            current = self._coverage(bot_id)
+            if current is not None and (
+                fetched_from.toordinal() <= current.covered_to.toordinal() + 1
+                and fetched_to.toordinal() >= current.covered_from.toordinal() - 1
+            ):
+                merged = Coverage(
+                    min(current.covered_from, fetched_from),
+                    max(current.covered_to, fetched_to),
+                )
+            else:
+                merged = Coverage(fetched_from, fetched_to)
+
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO profit_by_day "
+                    "(bot_id, day, usd, btc, payload) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (bot_id, r.day.isoformat(), r.usd, r.btc, json.dumps(r.payload))
+                        for r in rows
+                    ],
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO profit_coverage "
+                    "(bot_id, covered_from, covered_to) VALUES (?, ?, ?)",
+                    (
+                        bot_id,
+                        merged.covered_from.isoformat(),
+                        merged.covered_to.isoformat(),
+                    ),
+                )
+        return merged
+
+    def query(self, bot_id: str, start: date, end: date) -> list[ProfitRow]:
+        """Return stored rows for a bot within [start, end], oldest first."""
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT day, usd, btc, payload FROM profit_by_day "
+                    "WHERE bot_id = ? AND day BETWEEN ? AND ? ORDER BY day",
+                    (bot_id, start.isoformat(), end.isoformat()),
+                )
+                .fetchall()
+            )
+        return [
+            ProfitRow(date.fromisoformat(day), usd, btc, json.loads(payload))
+            for day, usd, btc, payload in rows
+        ]
+
+    def days_to_fetch(self, bot_id: str, start: date, today: date) -> int:
+        """Number of trailing days to request so [start, today] is fully synced.
+
+        The last synced day is always refetched because its row may have been
+        incomplete when it was stored.
+        """
+        requested = (today - start).days + 1
+        current = self.coverage(bot_id)
+        if current is None or start < current.covered_from:
+            return requested
+        return max(1, min(requested, (today - current.covered_to).days + 1))
+
+
+# Global profit history store used by get_dca_bot_profit_data
+_profit_store = ProfitHistoryStore()
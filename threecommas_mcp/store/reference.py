@@ -0,0 +1,162 @@
+"""Cached reference data served as MCP resources
+
+Supported markets, the strategy catalog, the DCA pairs blacklist and the
+connected accounts change rarely. This module keeps their responses
+(security-filtered only, so the blacklist keeps its pairs) in memory with a content fingerprint, refreshes the ones clients
+have read in the background, and reports a resource as updated only when a
+refresh sees different content.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, NamedTuple
+
+from ..api.client import api_request
+from ..api.prefetch import fresh_responses
+from ..models.base import ResponseFilter
+from ..utils.env import get_reference_refresh_interval
+from ..utils.fingerprint import fingerprint
+from ..utils.lifecycle import on_shutdown
+from ..utils.metrics import _metrics
+from ..utils.response_filter import filter_response
+from ..utils.subscriptions import _resource_subscriptions
+from .pairs import _blacklist_cache
+from .strategies import _strategy_catalog
+
+logger = logging.getLogger(__name__)
+
+MARKETS_URI = "threecommas://markets"
+STRATEGIES_URI = "threecommas://strategies"
+BLACKLIST_URI = "threecommas://blacklist"
+ACCOUNTS_URI = "threecommas://accounts"
+
+
+async def _load_markets() -> Dict[str, Any]:
+    return await api_request("ver1/accounts/market_list", method="GET")
+
+
+async def _load_strategies() -> Dict[str, Any]:
+    response = await api_request("ver1/bots/strategy_list", method="GET")
+    if "error" not in response:
+        # Keep search_strategies on the same download
+        _strategy_catalog.load(response)
+    return response
+
+
+async def _load_blacklist() -> Dict[str, Any]:
+    response = await api_request("ver1/bots/pairs_black_list", method="GET")
+    if "error" not in response:
+        # Keep screen_pairs on the same download
+        await _blacklist_cache.load(response)
+    return response
+
+
+async def _load_accounts() -> Dict[str, Any]:
+    # Imported on first use: the accounts store pulls in NumPy
+    from .accounts import _accounts_cache
+
+    accounts = await _accounts_cache.get_accounts(max_age=0)
+    return accounts if isinstance(accounts, dict) else {"data": accounts}
+
+
+class _Cached(NamedTuple):
+    fetched_at: float
+    fingerprint: str
+    content: Dict[str, Any]
+
+
+class ReferenceData:
+    """Security-filtered reference responses per resource URI."""
+
+    def __init__(
+        self,
+        loaders: Dict[str, Callable[[], Awaitable[Dict[str, Any]]]],
+        notify: Callable[[str], Awaitable[None]] | None = None,
+    ) -> None:
+        self._loaders = loaders
+        self._notify = notify
+        self._entries: Dict[str, _Cached] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    async def refresh(self, uri: str) -> Dict[str, Any]:
+        """Refetch a resource; notify subscribers if its content changed."""
+        with fresh_responses():
+            response = await self._loaders[uri]()
+        if "error" in response:
+            return response
+        # The display filter would reduce the blacklist to a pair count
+        content = filter_response(response, ResponseFilter.FULL)
+        digest = fingerprint(content)
+        previous = self._entries.get(uri)
+        self._entries[uri] = _Cached(time.monotonic(), digest, content)
+        if (
+            previous is not None
+            and previous.fingerprint != digest
+            and self._notify is not None
+        ):
+            await self._notify(uri)
+        return content
+
+    async def read(self, uri: str) -> Dict[str, Any]:
+        """Return a resource from cache, fetching it when missing or stale.
+
+        The first read starts the background refresh of read resources.
+        With refreshing turned off (interval 0), cached content is kept.
+        """
+        cached = self._entries.get(uri)
+        interval = get_reference_refresh_interval()
+        if interval > 0:
+            self.start(interval)
+        hit = cached is not None and (
+            interval <= 0 or time.monotonic() - cached.fetched_at < interval
+        )
+        _metrics.cache_lookup("reference", hit)
+        if cached is not None and hit:
+            return cached.content
+        return await self.refresh(uri)
+
+    async def _run(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            # Only resources a client has read are kept fresh
+            for uri in list(self._entries):
+                try:
+                    result = await self.refresh(uri)
+                    if "error" in result:
+                        logger.warning(f"Refreshing {uri} failed: {result['error']}")
+                except (TypeError, ValueError) as e:
+                    # Unexpected response shapes; API failures come back as errors
+                    logger.warning(f"Refreshing {uri} failed: {e}")
+
+    def start(self, interval: float) -> None:
+        """Refresh read resources every interval seconds (no-op if running)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(interval))
+            on_shutdown(self.stop)
+
+    async def stop(self) -> None:
+        """Cancel the refresh task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def clear(self) -> None:
+        """Drop all cached resources."""
+        self._entries.clear()
+
+
+# Global reference data behind the MCP resources
+_reference_data = ReferenceData(
+    {
+        MARKETS_URI: _load_markets,
+        STRATEGIES_URI: _load_strategies,
+        BLACKLIST_URI: _load_blacklist,
+        ACCOUNTS_URI: _load_accounts,
+    },
+    notify=_resource_subscriptions.resource_updated,
+)
@@ -0,0 +1,180 @@
+"""Indexed DCA strategy catalog for 3Commas MCP
+
+This module caches the `ver1/bots/strategy_list` catalog and builds an
+inverted index over strategy keys, names, option keys and names, and option
+values such as supported timeframes. Searches are answered from the index
+with prefix matching, so only the matching strategies and their option
+schema are returned instead of the whole catalog.
+"""
+
+import bisect
+import re
+import time
+from typing import Any, Dict
+
+from ..utils.env import get_strategy_cache_ttl
+from ..api.client import api_request
+from ..api.prefetch import fresh_responses
+from ..utils.metrics import _metrics
+
+# Relevance weight of a query token matching each part of a strategy
+FIELD_WEIGHTS = {"key": 4.0, "name": 3.0, "option": 2.0, "value": 1.0}
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: Any) -> list[str]:
+    """Lowercase alphanumeric tokens of a value (underscores split words)."""
+    return _TOKEN.findall(str(text).lower())
+
+
+def _catalog_entries(response: Dict[str, Any]) -> list[Dict[str, Any]]:
+    """Normalize a strategy_list response into one dict per strategy.
+
+    The endpoint returns an object keyed by strategy id; list responses
+    (wrapped as {"data": [...]}) are accepted as well.
+    """
+    raw = response.get("data", response)
+    if isinstance(raw, list):
+        items = [
+            (str(item.get("strategy") or item.get("id") or item.get("name")), item)
+            for item in raw
+            if isinstance(item, dict)
+        ]
+    else:
+        items = [
+            (str(key), item) for key, item in raw.items() if isinstance(item, dict)
+        ]
+
+    entries = []
+    for key, item in items:
+        options = item.get("options")
+        entries.append(
+            {
+                "strategy": key,
+                "name": item.get("name") or key,
+                **{k: v for k, v in item.items() if k not in ("name", "options")},
+                "options": options if isinstance(options, dict) else {},
+            }
+        )
+    return entries
+
+
+def _option_values(option: Any) -> list[Any]:
+    """Allowed or default values of an option schema (e.g. timeframes)."""
+    if not isinstance(option, dict):
+        return [option]
+    values: list[Any] = []
+    for field in ("options", "values", "value", "default"):
+        value = option.get(field)
+        if isinstance(value, list):
+            values.extend(v for v in value if not isinstance(v, (dict, list)))
+        elif isinstance(value, dict):
+            values.extend(value.keys())
+        elif value is not None:
+            values.append(value)
+    return values
+
+
+class StrategyIndex:
+    """Inverted index from tokens to weighted strategy matches."""
+
+    def __init__(self, entries: list[Dict[str, Any]]) -> None:
+        self.entries = entries
+        postings: Dict[str, Dict[int, float]] = {}
+
+        def add(position: int, text: Any, field: str) -> None:
+            for token in tokenize(text):
+                weights = postings.setdefault(token, {})
+                weights[position] = max(
+                    weights.get(position, 0.0), FIELD_WEIGHTS[field]
+                )
+
+        for position, entry in enumerate(entries):
+            add(position, entry["strategy"], "key")
+            add(position, entry["name"], "name")
+            for option_key, option in entry["options"].items():
+                add(position, option_key, "option")
+                if isinstance(option, dict) and option.get("name"):
+                    add(position, option["name"], "option")
+                for value in _option_values(option):
+                    add(position, value, "value")
+
+        self._postings = postings
+        self._vocabulary = sorted(postings)
+
+    def _matches(self, token: str) -> Dict[int, float]:
+        """Best weight per strategy over every indexed token with this prefix."""
+        merged: Dict[int, float] = {}
+        start = bisect.bisect_left(self._vocabulary, token)
+        for word in self._vocabulary[start:]:
+            if not word.startswith(token):
+                break
+            # Exact token matches rank above prefix matches
+            factor = 1.0 if word == token else 0.5
+            for position, weight in self._postings[word].items():
+                merged[position] = max(merged.get(position, 0.0), weight * factor)
+        return merged
+
+    def search(self, query: str, limit: int = 10) -> tuple[int, list[Dict[str, Any]]]:
+        """Strategies matching every query token, best first.
+
+        Returns:
+            (total matches, up to limit entries with a relevance score)
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            scores = {position: 0.0 for position in range(len(self.entries))}
+        else:
+            scores = self._matches(tokens[0])
+            for token in tokens[1:]:
+                matches = self._matches(token)
+                scores = {p: s + matches[p] for p, s in scores.items() if p in matches}
+
+        ranked = sorted(scores, key=lambda p: (-scores[p], self.entries[p]["strategy"]))
+        return len(ranked), [
+            {**self.entries[p], "score": round(scores[p], 2)} for p in ranked[:limit]
+        ]
+
+
+class StrategyCatalog:
+    """Cached strategy_list responses and their indexes, keyed by direction."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, tuple[float, StrategyIndex]] = {}
+
+    def load(
+        self, response: Dict[str, Any], strategy: str | None = None
+    ) -> StrategyIndex:
+        """Index a raw strategy_list response (also used by the list tool)."""
+        index = StrategyIndex(_catalog_entries(response))
+        self._entries[strategy or ""] = (time.monotonic(), index)
+        return index
+
+    async def get_index(
+        self, strategy: str | None = None, max_age: float | None = None
+    ) -> StrategyIndex | Dict[str, Any]:
+        """Return the catalog index for a direction, refetching when stale."""
+        ttl = get_strategy_cache_ttl() if max_age is None else max_age
+        cached = self._entries.get(strategy or "")
+        hit = cached is not None and time.monotonic() - cached[0] < ttl
+        _metrics.cache_lookup("strategy_catalog", hit)
+        if cached is not None and hit:
+            return cached[1]
+
+        params = {"strategy": strategy} if strategy else None
+        with fresh_responses(max_age == 0):
+            response = await api_request(
+                "ver1/bots/strategy_list", params=params, method="GET"
+            )
+        if "error" in response:
+            return response
+        return self.load(response, strategy)
+
+    def clear(self) -> None:
+        """Drop all cached catalogs."""
+        self._entries.clear()
+
+
+# Global strategy catalog shared by strategy tools
+_strategy_catalog = StrategyCatalog()
@@ -1,10 +1,25 @@
 """MCP tools for 3Commas"""
 
-# Import tools for easier access
-from . import account, dca_bots, market_data
+import importlib
+from typing import Any
 
 __all__: list[str] = [
     "account",
+    "batch",
     "dca_bots",
+    "deals",
     "market_data",
+    "metrics",
+    "portfolio",
+    "reference",
+    "session",
+    "smart_trades",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Tool modules are imported on first access; the server registers tools
+    # from the manifest in registry.py and imports a module when a tool runs
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,15 +4,29 @@ This module implements account-related endpoints of the 3Commas API.
 Reference: https://developers.3commas.io/account
 """
 
+from datetime import datetime, timezone
 from typing import Union
+
+from ..api.burst import APICall, fan_out
 from ..api.client import api_request
+from ..store.accounts import _accounts_cache, account_row, accounts_table
+from ..store.balance_history import BALANCE_FIELDS, _balance_sampler, _balance_store
 from ..utils.decorators import handle_api_errors
-from ..utils.response_filter import filter_response
+from ..utils.env import get_balance_sample_interval
+from ..utils.downsample import summarize_balance_series
+from ..utils.fingerprint import dedupe_session_responses
+from ..utils.response_filter import filter_api_response, filter_response
 from ..models.base import APIResponse, ResponseFilter
-from ..models.account import GetConnectedExchangesRequest, GetAccountInfoRequest
+from ..models.account import (
+    GetConnectedExchangesRequest,
+    GetAccountInfoRequest,
+    GetAccountsOverviewRequest,
+    GetBalanceHistoryRequest,
+)
 
 
 @handle_api_errors
+@dedupe_session_responses
 async def get_connected_exchanges_and_wallets(
     response_filter: str = "display",
 ) -> APIResponse:
@@ -34,12 +48,13 @@ async def get_connected_exchanges_and_wallets(
 
     # Apply response filtering for token efficiency
     if isinstance(response, dict) and "error" not in response:
-        response = filter_response(response, request.response_filter)
+        response = await filter_api_response(response, request.response_filter)
 
     return response
 
 
 @handle_api_errors
+@dedupe_session_responses
 async def get_account_info(
     account_id: Union[str, int] = "summary",
     response_filter: str = "display",
@@ -66,6 +81,142 @@ async def get_account_info(
 
     # Apply response filtering for token efficiency
     if isinstance(response, dict) and "error" not in response:
-        response = filter_response(response, request.response_filter)
+        response = await filter_api_response(response, request.response_filter)
 
     return response
+
+
+@handle_api_errors
+async def get_accounts_overview(
+    account_ids: list[int] | None = None,
+    refresh: bool = False,
+    response_filter: str = "display",
+) -> APIResponse:
+    """Get balances and profit of every connected account in one table.
+
+    Args:
+        account_ids: Only include these account IDs (default: every connected account)
+        refresh: Refetch the account list instead of using the cached copy (default: False)
+        response_filter: Response detail level ("full" or "display")
+
+    Returns:
+        Column-oriented table with one row per account (exchange, USD/BTC balance, total and daily profit) and totals.
+    """
+    # Validate inputs using Pydantic model
+    request = GetAccountsOverviewRequest(
+        account_ids=account_ids,
+        refresh=refresh,
+        response_filter=ResponseFilter(response_filter),
+    )
+
+    # List accounts once, reusing the cached metadata when fresh
+    accounts = await _accounts_cache.get_accounts(
+        max_age=0 if request.refresh else None
+    )
+    if isinstance(accounts, dict):
+        return accounts
+    if request.account_ids is not None:
+        wanted = {str(account_id) for account_id in request.account_ids}
+        accounts = [a for a in accounts if str(a.get("id")) in wanted]
+
+    # Fetch current balances for every account concurrently under the limiter
+    details = await fan_out([APICall(f"ver1/accounts/{a.get('id')}") for a in accounts])
+
+    rows, errors = [], []
+    for account, detail in zip(accounts, details):
+        if "error" in detail:
+            # Fall back to the balances included in the account list
+            errors.append({"account_id": account.get("id"), "error": detail["error"]})
+            detail = {}
+        rows.append(account_row(account, detail))
+
+    response: APIResponse = {
+        "accounts": len(rows),
+        **accounts_table(rows),
+        "errors": errors,
+    }
+
+    # Apply response filtering for token efficiency
+    return filter_response(response, request.response_filter)
+
+
+def _unix_seconds(value: str | None) -> int | None:
+    """Convert an ISO date to Unix seconds (naive dates are UTC)."""
+    if value is None:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Invalid ISO date: {value}")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+@handle_api_errors
+async def get_balance_history(
+    account_id: int = 0,
+    from_date: str | None = None,
+    to_date: str | None = None,
+    resolution: str = "hour",
+    max_points: int | None = 100,
+    response_filter: str = "display",
+) -> APIResponse:
+    """Query account balances recorded locally by the background balance sampler.
+
+    Args:
+        account_id: Exchange account ID (0 = every recorded account)
+        from_date: Only samples at or after this ISO date
+        to_date: Only samples at or before this ISO date
+        resolution: "sample" (every recorded sample), "hour" or "day" buckets
+        max_points: Downsample each series to at most this many points (LTTB)
+        response_filter: Response detail level ("full" or "display")
+
+    Returns:
+        Per account: first/last/min/max/change of USD and BTC balance and profit, plus a balance series. Reads only the local store.
+    """
+    # Validate inputs using Pydantic model
+    request = GetBalanceHistoryRequest(
+        account_id=account_id,
+        from_date=from_date,
+        to_date=to_date,
+        resolution=resolution,
+        max_points=max_points,
+        response_filter=ResponseFilter(response_filter),
+    )
+    start = _unix_seconds(request.from_date)
+    end = _unix_seconds(request.to_date)
+
+    account_ids = (
+        [str(request.account_id)] if request.account_id else _balance_store.accounts()
+    )
+    names = {str(a.get("id")): a.get("name") for a in _accounts_cache.peek() or []}
+    accounts = []
+    for recorded_id in account_ids:
+        timestamps, values = _balance_store.read(recorded_id, start, end)
+        accounts.append(
+            {
+                "account_id": recorded_id,
+                "name": names.get(recorded_id),
+                **summarize_balance_series(
+                    timestamps,
+                    values,
+                    BALANCE_FIELDS,
+                    request.resolution,
+                    request.max_points,
+                ),
+            }
+        )
+
+    response: APIResponse = {
+        "sampler": {
+            "running": _balance_sampler.running,
+            "interval_seconds": get_balance_sample_interval(),
+            "last_error": _balance_sampler.last_error,
+            **_balance_store.stats(),
+        },
+        "accounts": accounts,
+    }
+
+    # Apply response filtering for token efficiency
+    return filter_response(response, request.response_filter)
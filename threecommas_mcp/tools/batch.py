@@ -0,0 +1,127 @@
+"""Batch tool for 3Commas MCP
+
+This module implements a tool that runs several read-only tools in one MCP
+round-trip. Calls run concurrently under the shared rate limiter, and
+identical GET requests made by different calls are sent to 3Commas once.
+Each entry is measured and sampled for profiling like a top-level call of
+its tool, nested under the batch call's span.
+"""
+
+import asyncio
+import inspect
+import time
+from typing import Any, Awaitable, Callable, Dict
+
+from ..api.client import health_check
+from ..api.coalesce import coalesce_requests
+from ..utils.decorators import handle_api_errors
+from ..utils.metrics import _metrics
+from ..utils.profiling import profile_sampled_calls
+from ..models.base import APIResponse, ResponseFilter
+from ..models.batch import BatchCall, BatchRequest
+from . import account, dca_bots, deals, market_data, portfolio, smart_trades
+from .metrics import measure_tool
+
+# Registered tools that only read from 3Commas or local stores. Tools that
+# write state (sync_deals_history, get_dca_bot_changes with its snapshot and
+# change feed, reset_session_responses) are excluded.
+READ_ONLY_TOOLS: Dict[str, Callable[..., Awaitable[Dict[str, Any]]]] = {
+    func.__name__: profile_sampled_calls(func)
+    for func in (
+        health_check,
+        dca_bots.get_dca_bot_details,
+        dca_bots.get_dca_bot_list,
+        dca_bots.get_available_strategy_list,
+        dca_bots.search_strategies,
+        dca_bots.get_dca_bot_profit_data,
+        dca_bots.get_blacklist_of_pairs,
+        account.get_connected_exchanges_and_wallets,
+        account.get_account_info,
+        account.get_accounts_overview,
+        account.get_balance_history,
+        market_data.get_all_market_pairs,
+        market_data.get_currency_rates_and_limits,
+        market_data.get_supported_markets,
+        market_data.validate_order_params,
+        market_data.screen_pairs,
+        deals.get_deals_history,
+        smart_trades.get_smart_trades,
+        smart_trades.get_smart_trade_details,
+        smart_trades.get_smart_trade_trades,
+        portfolio.get_dca_portfolio_summary,
+        portfolio.get_dca_capital_requirements,
+        portfolio.get_active_deal_projection,
+        portfolio.get_dca_exposure,
+    )
+}
+
+
+async def _run_call(call: BatchCall, response_filter: str) -> Dict[str, Any]:
+    """Run one batch entry and time it; failures become the entry's error."""
+    entry: Dict[str, Any] = {"tool": call.tool}
+    start = time.perf_counter()
+    func = READ_ONLY_TOOLS.get(call.tool)
+    if func is None:
+        entry["error"] = f"Unknown or non read-only tool: {call.tool}"
+    else:
+        args = dict(call.args)
+        # Entries without their own response_filter inherit the batch's
+        if "response_filter" in inspect.signature(func).parameters:
+            args.setdefault("response_filter", response_filter)
+        # Tools report bad arguments and API failures as {"error": ...}
+        with measure_tool(call.tool):
+            result = await func(**args)
+        if "error" in result:
+            _metrics.inc("tool_errors_total", tool=call.tool)
+            entry["error"] = result["error"]
+        else:
+            entry["result"] = result
+    entry["ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return entry
+
+
+@handle_api_errors
+async def batch(
+    calls: list[Dict[str, Any]], response_filter: str = "display"
+) -> APIResponse:
+    """Run several read-only tools concurrently in one call.
+
+    Use this instead of separate calls when a question needs several lookups
+    (for example bot details, profit data, currency rates and the blacklist).
+    Identical API requests made by different entries are sent only once.
+
+    Args:
+        calls: Tool calls as {"tool": name, "args": {...}} (1-20 entries), e.g.
+            [{"tool": "get_dca_bot_details", "args": {"bot_id": "12345"}},
+             {"tool": "get_blacklist_of_pairs"}]
+        response_filter: Default response detail level for entries that do
+            not set their own ("full" or "display")
+
+    Returns:
+        One result per entry in order, each with its tool name, result or
+        error, and duration in ms, plus a summary with wall time and the
+        number of upstream requests sent and shared.
+    """
+    # Validate inputs using Pydantic model
+    request = BatchRequest(
+        calls=[BatchCall(**call) for call in calls],
+        response_filter=ResponseFilter(response_filter),
+    )
+
+    start = time.perf_counter()
+    with coalesce_requests() as coalescer:
+        results = await asyncio.gather(
+            *(_run_call(call, request.response_filter) for call in request.calls)
+        )
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        "results": list(results),
+        "summary": {
+            "calls": len(results),
+            "errors": sum(1 for entry in results if "error" in entry),
+            "wall_ms": round(wall_ms, 1),
+            "sum_ms": round(sum(entry["ms"] for entry in results), 1),
+            **coalescer.stats(),
+        },
+    }
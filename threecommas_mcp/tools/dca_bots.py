@@ -4,20 +4,33 @@ This module implements DCA bot-related endpoints of the 3Commas API.
 Reference: https://developers.3commas.io/dca-bot
 """
 
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
 from ..api.client import api_request
 from ..utils.decorators import handle_api_errors
-from ..utils.response_filter import filter_response
+from ..utils.downsample import summarize_profit_series
+from ..utils.fingerprint import dedupe_session_responses
+from ..utils.response_filter import filter_api_response, filter_response
 from ..models.base import APIResponse, ResponseFilter, StrategyType
+from ..store.bot_snapshot import _bot_snapshot
+from ..store.pairs import _blacklist_cache
+from ..store.profit_history import _profit_store, extract_profit_rows
+from ..store.strategies import _strategy_catalog
 from ..models.dca_bots import (
     GetDCABotDetailsRequest,
     GetDCABotListRequest,
     GetAvailableStrategyListRequest,
     GetBlacklistOfPairsRequest,
     GetDCABotProfitDataRequest,
+    GetDCABotChangesRequest,
+    SearchStrategiesRequest,
 )
 
 
 @handle_api_errors
+@dedupe_session_responses
 async def get_dca_bot_details(
     bot_id: str, include_events: bool = False, response_filter: str = "display"
 ) -> APIResponse:
@@ -48,12 +61,13 @@ async def get_dca_bot_details(
 
     # Apply response filtering for token efficiency
     if isinstance(response, dict) and "error" not in response:
-        response = filter_response(response, request.response_filter)
+        response = await filter_api_response(response, request.response_filter)
 
     return response
 
 
 @handle_api_errors
+@dedupe_session_responses
 async def get_dca_bot_list(
     account_id: int = 0,
     strategy: StrategyType | None = None,
@@ -105,7 +119,7 @@ async def get_dca_bot_list(
 
     # Apply response filtering for token efficiency
     if isinstance(response, dict) and "error" not in response:
-        response = filter_response(response, request.response_filter)
+        response = await filter_api_response(response, request.response_filter)
 
     return response
 
@@ -133,45 +147,140 @@ async def get_available_strategy_list(response_filter: str = "display") -> APIRe
 
     # Apply response filtering for token efficiency
     if isinstance(response, dict) and "error" not in response:
-        response = filter_response(response, request.response_filter)
+        # Refresh the search index from the same download
+        _strategy_catalog.load(response)
+        response = await filter_api_response(response, request.response_filter)
 
     return response
 
 
+@handle_api_errors
+async def search_strategies(
+    query: str = "",
+    type: StrategyType | None = None,
+    limit: int = 10,
+    refresh: bool = False,
+    response_filter: str = "display",
+) -> APIResponse:
+    """Search the DCA strategy catalog by keyword instead of listing all of it.
+
+    Args:
+        query: Keywords matched against strategy keys, names, option keys and option values such as timeframes (prefixes match too; empty = all)
+        type: Catalog for "long" or "short" bots (default: unfiltered catalog)
+        limit: Maximum strategies to return (1-100, default: 10)
+        refresh: Refetch the catalog instead of using the cached index (default: False)
+        response_filter: Response detail level ("full" or "display")
+
+    Returns:
+        Matching strategies (best first) with their option schema, the total match count and search time.
+    """
+    # Validate inputs using Pydantic model
+    request = SearchStrategiesRequest(
+        query=query,
+        type=type,
+        limit=limit,
+        refresh=refresh,
+        response_filter=ResponseFilter(response_filter),
+    )
+
+    # The catalog is downloaded and indexed once, then searched locally
+    index = await _strategy_catalog.get_index(
+        request.type, max_age=0 if request.refresh else None
+    )
+    if isinstance(index, dict):
+        return index
+
+    start = time.perf_counter()
+    total, strategies = index.search(request.query, request.limit)
+    response: APIResponse = {
+        "query": request.query,
+        "total": total,
+        "returned": len(strategies),
+        "catalog_size": len(index.entries),
+        "search_ms": round((time.perf_counter() - start) * 1000, 3),
+        "strategies": strategies,
+    }
+
+    # Apply response filtering for token efficiency
+    return filter_response(response, request.response_filter)
+
+
 @handle_api_errors
 async def get_dca_bot_profit_data(
-    bot_id: str, days: int = 30, response_filter: str = "display"
+    bot_id: str,
+    days: int = 30,
+    resolution: str = "day",
+    max_points: int | None = None,
+    response_filter: str = "display",
 ) -> APIResponse:
     """Get daily profit data for a specific DCA bot.
 
     Args:
         bot_id: DCA bot unique identifier
         days: Number of days for profit data (default: 30)
+        resolution: "day" for raw rows, or "week"/"month" rollups (default: "day")
+        max_points: Downsample the series to at most this many points (default: None)
         response_filter: Response detail level ("full" or "display")
 
     Returns:
-        Daily profit analytics with BTC/USD amounts and timestamps.
+        Daily profit analytics with BTC/USD amounts and timestamps, served from
+        the local profit history after fetching only the missing days. Rollups
+        and downsampled series return compact points with cumulative profit.
     """
     # Validate inputs using Pydantic model
     request = GetDCABotProfitDataRequest(
         bot_id=bot_id,
         days=days,
+        resolution=resolution,
+        max_points=max_points,
         response_filter=ResponseFilter(response_filter),
     )
 
-    # Build query parameters using automatic Pydantic conversion
-    params = request.to_query_params()
+    # Fetch only the days missing from the local profit history store
+    # (SQLite calls run in a thread to keep the event loop free)
+    today = datetime.now(timezone.utc).date()
+    start = today - timedelta(days=request.days - 1)
+    fetch_days = await asyncio.to_thread(
+        _profit_store.days_to_fetch, request.bot_id, start, today
+    )
 
     # Make API request using existing authentication infrastructure
     response = await api_request(
-        f"ver1/bots/{request.bot_id}/profit_by_day", params=params, method="GET"
+        f"ver1/bots/{request.bot_id}/profit_by_day",
+        params={"days": str(fetch_days)},
+        method="GET",
+    )
+    if "error" in response:
+        return response
+
+    await asyncio.to_thread(
+        _profit_store.merge,
+        request.bot_id,
+        extract_profit_rows(response),
+        today - timedelta(days=fetch_days - 1),
+        today,
     )
 
-    # Apply response filtering for token efficiency
-    if isinstance(response, dict) and "error" not in response:
-        response = filter_response(response, request.response_filter)
+    # Answer the requested range from the local store
+    rows = await asyncio.to_thread(_profit_store.query, request.bot_id, start, today)
+    sync = {
+        "from": start.isoformat(),
+        "to": today.isoformat(),
+        "fetched_days": fetch_days,
+        "stored_days": len(rows),
+    }
+    if request.resolution == "day" and request.max_points is None:
+        response = {"data": [row.payload for row in rows], "sync": sync}
+    else:
+        response = summarize_profit_series(
+            [(row.day, row.usd, row.btc) for row in rows],
+            request.resolution,
+            request.max_points,
+        )
+        response["sync"] = sync
 
-    return response
+    # Apply response filtering for token efficiency
+    return filter_response(response, request.response_filter)
 
 
 @handle_api_errors
@@ -199,6 +308,60 @@ async def get_blacklist_of_pairs(response_filter: str = "display") -> APIRespons
 
     # Apply response filtering for token efficiency
     if isinstance(response, dict) and "error" not in response:
-        response = filter_response(response, request.response_filter)
+        # Refresh the set used by screen_pairs from the same download
+        await _blacklist_cache.load(response)
+        response = await filter_api_response(response, request.response_filter)
 
     return response
+
+
+@handle_api_errors
+async def get_dca_bot_changes(
+    since: str | None = None,
+    account_id: int = 0,
+    full: bool = False,
+    limit: int = 100,
+    response_filter: str = "display",
+) -> APIResponse:
+    """Get DCA bots that changed, as field-level diffs against the local snapshot.
+
+    Args:
+        since: Cursor (next_since from a previous call) or ISO timestamp; default: changes found by this call
+        account_id: Exchange account ID (0 = all accounts)
+        full: Refetch every bot instead of only recently updated ones (default: False)
+        limit: Maximum change records to return (1-1000, default: 100)
+        response_filter: Response detail level ("full" or "display")
+
+    Returns:
+        Sync summary, change records (added/updated/removed with old and new values) and the next_since cursor for the next call.
+    """
+    # Validate inputs using Pydantic model
+    request = GetDCABotChangesRequest(
+        since=since,
+        account_id=account_id,
+        full=full,
+        limit=limit,
+        response_filter=ResponseFilter(response_filter),
+    )
+
+    # Fetch only bots updated since the snapshot's newest update
+    summary = await _bot_snapshot.sync(full=request.full)
+    if isinstance(summary, dict):
+        return summary
+
+    changes = _bot_snapshot.changes_since(
+        request.since or summary.detected_at,
+        account_id=request.account_id,
+        limit=request.limit,
+        inclusive=request.since is None,
+    )
+    response: APIResponse = {
+        "sync": summary._asdict(),
+        "changes": changes,
+        "next_since": changes[-1]["cursor"]
+        if len(changes) == request.limit
+        else _bot_snapshot.latest_cursor(),
+    }
+
+    # Apply response filtering for token efficiency
+    return filter_response(response, request.response_filter)
@@ -0,0 +1,119 @@
+"""Deal history tools for 3Commas MCP
+
+This module syncs ver1/deals into a local store on the dedicated deals
+rate-limit bucket and answers history queries from that store.
+Reference: https://github.com/3commas-io/3commas-official-api-docs/blob/master/deals_api.md
+"""
+
+from ..store.deals_history import _deals_store
+from ..utils.decorators import handle_api_errors
+from ..utils.response_filter import filter_response
+from ..models.base import APIResponse, ResponseFilter
+from ..models.deals import GetDealsHistoryRequest, SyncDealsHistoryRequest
+
+
+@handle_api_errors
+async def sync_deals_history(
+    bot_id: str | None = None,
+    account_id: int = 0,
+    scope: str | None = None,
+    from_date: str | None = None,
+    max_pages: int = 50,
+) -> APIResponse:
+    """Download deals from 3Commas into the local deals history store.
+
+    Args:
+        bot_id: Only sync deals of this DCA bot (default: all bots)
+        account_id: Only sync deals of this exchange account (0 = all accounts)
+        scope: "active", "finished", "completed", "cancelled" or "failed" (default: all)
+        from_date: Sync deals created from this ISO date (default: resume the last sync with the same filters)
+        max_pages: Maximum pages of 1000 deals fetched in this call (default: 50)
+
+    Returns:
+        Deals fetched, pages requested, whether the history is complete, the newest created_at synced, and stored deals refetched because they finished since. Call again to continue an incomplete sync.
+    """
+    # Validate inputs using Pydantic model
+    request = SyncDealsHistoryRequest(
+        bot_id=bot_id,
+        account_id=account_id,
+        scope=scope,
+        from_date=from_date,
+        max_pages=max_pages,
+    )
+
+    result = await _deals_store.sync(
+        bot_id=request.bot_id,
+        account_id=request.account_id,
+        scope=request.scope,
+        from_date=request.from_date,
+        max_pages=request.max_pages,
+    )
+    if isinstance(result, dict):
+        return result
+
+    return {
+        "fetched": result.fetched,
+        "pages": result.pages,
+        "complete": result.complete,
+        "last_created_at": result.last_created_at,
+        "refreshed": result.refreshed,
+    }
+
+
+@handle_api_errors
+async def get_deals_history(
+    bot_id: str | None = None,
+    account_id: int = 0,
+    scope: str | None = None,
+    from_date: str | None = None,
+    to_date: str | None = None,
+    limit: int = 100,
+    offset: int = 0,
+    response_filter: str = "display",
+) -> APIResponse:
+    """Query deals previously downloaded with sync_deals_history.
+
+    Args:
+        bot_id: Filter by DCA bot ID (default: all bots)
+        account_id: Filter by exchange account (0 = all accounts)
+        scope: "active", "finished", "completed", "cancelled" or "failed" (default: all)
+        from_date: Only deals created at or after this ISO date
+        to_date: Only deals created at or before this ISO date
+        limit: Maximum deals to return (1-1000, default: 100)
+        offset: Pagination offset
+        response_filter: Response detail level ("full" or "display")
+
+    Returns:
+        Matching deal count, realized profit totals and a page of deals (newest first). Reads only the local store.
+    """
+    # Validate inputs using Pydantic model
+    request = GetDealsHistoryRequest(
+        bot_id=bot_id,
+        account_id=account_id,
+        scope=scope,
+        from_date=from_date,
+        to_date=to_date,
+        limit=limit,
+        offset=offset,
+        response_filter=ResponseFilter(response_filter),
+    )
+
+    total, deals, totals = _deals_store.query(
+        bot_id=request.bot_id,
+        account_id=request.account_id,
+        scope=request.scope,
+        created_from=request.from_date,
+        created_to=request.to_date,
+        limit=request.limit,
+        offset=request.offset,
+    )
+    response: APIResponse = {
+        "total": total,
+        "returned": len(deals),
+        "offset": request.offset,
+        "totals": {name: round(value, 8) for name, value in totals.items()},
+        "data": deals,
+    }
+
+    # Apply response filtering for token efficiency
+    return filter_response(response, request.response_filter)
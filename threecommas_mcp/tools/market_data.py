@@ -4,15 +4,23 @@ This module implements market data-related endpoints of the 3Commas API.
 Reference: https://developers.3commas.io/market-data
 """
 
+import time
+from typing import Any, Dict
+
 from ..api.client import api_request
 from ..utils.decorators import handle_api_errors
-from ..utils.response_filter import filter_response
+from ..utils.response_filter import filter_api_response, filter_response
 from ..models.base import APIResponse, LimitType, ResponseFilter
 from ..models.market_data import (
     GetAllMarketPairsRequest,
     GetCurrencyRatesRequest,
     GetSupportedMarketsRequest,
+    OrderParams,
+    ScreenPairsRequest,
+    ValidateOrderParamsRequest,
 )
+from ..store.limits import _limits_table
+from ..store.pairs import _blacklist_cache, _market_pairs_cache, pair_variants
 
 
 @handle_api_errors
@@ -43,7 +51,10 @@ async def get_all_market_pairs(
 
     # Apply response filtering for token efficiency
     if isinstance(response, dict) and "error" not in response:
-        response = filter_response(response, request.response_filter)
+        # Refresh the pair index used by screen_pairs from the same download
+        if request.market_code:
+            await _market_pairs_cache.load(response, request.market_code)
+        response = await filter_api_response(response, request.response_filter)
 
     return response
 
@@ -82,9 +93,15 @@ async def get_currency_rates_and_limits(
         "ver1/accounts/currency_rates", params=params, method="GET"
     )
 
+    # Record limits in the local table for validate_order_params
+    if isinstance(response, dict) and "error" not in response:
+        _limits_table.update(
+            request.market_code, request.pair, request.limit_type, response
+        )
+
     # Apply response filtering for token efficiency
     if isinstance(response, dict) and "error" not in response:
-        response = filter_response(response, request.response_filter)
+        response = await filter_api_response(response, request.response_filter)
 
     return response
 
@@ -109,6 +126,168 @@ async def get_supported_markets(response_filter: str = "display") -> APIResponse
 
     # Apply response filtering for token efficiency
     if isinstance(response, dict) and "error" not in response:
-        response = filter_response(response, request.response_filter)
+        response = await filter_api_response(response, request.response_filter)
 
     return response
+
+
+@handle_api_errors
+async def validate_order_params(
+    orders: list[Dict[str, Any]], response_filter: str = "display"
+) -> APIResponse:
+    """Validate base and safety order volumes against cached trading limits.
+
+    Checks run locally against limits recorded by get_currency_rates_and_limits,
+    so no API request is made. Pairs without cached limits are reported as missing.
+
+    Args:
+        orders: Order parameter sets with market_code, pair, limit_type,
+            base_order_volume, safety_order_volume, volume_type and optional price
+        response_filter: Response detail level ("full" or "display")
+
+    Returns:
+        Per-order validation status with violations and a summary of valid, invalid and missing entries.
+    """
+    # Validate inputs using Pydantic model
+    request = ValidateOrderParamsRequest(
+        orders=[OrderParams(**order) for order in orders],
+        response_filter=ResponseFilter(response_filter),
+    )
+
+    results = []
+    missing: set[tuple[str, str, str]] = set()
+    for index, order in enumerate(request.orders):
+        limit_type = LimitType(order.limit_type).value
+        entry: Dict[str, Any] = {
+            "index": index,
+            "market_code": order.market_code,
+            "pair": order.pair,
+            "limit_type": limit_type,
+        }
+        limits = _limits_table.get(order.market_code, order.pair, limit_type)
+        if limits is None:
+            entry["status"] = "missing_limits"
+            missing.add((order.market_code, order.pair, limit_type))
+            results.append(entry)
+            continue
+
+        price = order.price if order.price is not None else limits.last_price
+        violations: list[str] = []
+        if order.price is not None:
+            violations.extend(_limits_table.validate_price(limits, order.price))
+        for field in ("base_order_volume", "safety_order_volume"):
+            volume = getattr(order, field)
+            if volume is None:
+                continue
+            violations.extend(
+                f"{field}: {message}"
+                for message in _limits_table.validate_volume(
+                    limits, volume, order.volume_type, price
+                )
+            )
+
+        entry["status"] = "invalid" if violations else "valid"
+        entry["valid"] = not violations
+        entry["violations"] = violations
+        entry["limits_age_seconds"] = round(time.time() - limits.updated_at)
+        results.append(entry)
+
+    response: APIResponse = {
+        "summary": {
+            "total": len(results),
+            "valid": sum(1 for r in results if r["status"] == "valid"),
+            "invalid": sum(1 for r in results if r["status"] == "invalid"),
+            "missing_limits": sum(
+                1 for r in results if r["status"] == "missing_limits"
+            ),
+        },
+        "results": results,
+    }
+    if missing:
+        response["missing_limits"] = [
+            {"market_code": m, "pair": p, "limit_type": t}
+            for m, p, t in sorted(missing)
+        ]
+
+    # Apply response filtering for token efficiency
+    return filter_response(response, request.response_filter)
+
+
+@handle_api_errors
+async def screen_pairs(
+    pairs: list[str],
+    market_code: str | None = None,
+    refresh: bool = False,
+    response_filter: str = "display",
+) -> APIResponse:
+    """Split candidate pairs into allowed and blacklisted in one call.
+
+    Membership is checked against a cached set of the DCA pairs blacklist
+    (and, with market_code, the market's pair list) refreshed in the
+    background, so screening does not wait for the API once cached.
+
+    Args:
+        pairs: Candidate pairs (1-1000); either currency order is matched
+        market_code: Also check that each pair exists on this market (e.g., "binance")
+        refresh: Refetch the blacklist and market pairs first (default: False)
+        response_filter: Response detail level ("full" or "display")
+
+    Returns:
+        Allowed, blacklisted and (with market_code) unknown pairs, plus the age of the cached sets.
+    """
+    # Validate inputs using Pydantic model
+    request = ScreenPairsRequest(
+        pairs=pairs,
+        market_code=market_code,
+        refresh=refresh,
+        response_filter=ResponseFilter(response_filter),
+    )
+    max_age = 0 if request.refresh else None
+
+    blacklist = await _blacklist_cache.get(max_age=max_age)
+    if isinstance(blacklist, dict):
+        return blacklist
+    blacklisted_pairs, blacklist_age = blacklist
+
+    market: frozenset[str] | None = None
+    market_age = 0.0
+    if request.market_code:
+        listed = await _market_pairs_cache.get(request.market_code, max_age=max_age)
+        if isinstance(listed, dict):
+            return listed
+        market, market_age = listed
+
+    allowed, blacklisted, unknown = [], [], []
+    for pair in dict.fromkeys(request.pairs):
+        variants = pair_variants(pair)
+        if market is not None and not any(v in market for v in variants):
+            unknown.append(pair)
+        elif any(v in blacklisted_pairs for v in variants):
+            blacklisted.append(pair)
+        else:
+            allowed.append(pair)
+
+    response: APIResponse = {
+        "allowed": allowed,
+        "blacklisted": blacklisted,
+        "summary": {
+            "candidates": len(allowed) + len(blacklisted) + len(unknown),
+            "allowed": len(allowed),
+            "blacklisted": len(blacklisted),
+            "blacklist_size": len(blacklisted_pairs),
+            "blacklist_age_seconds": round(blacklist_age, 1),
+        },
+    }
+    if market is not None:
+        response["unknown"] = unknown
+        response["summary"].update(
+            {
+                "unknown": len(unknown),
+                "market_code": request.market_code,
+                "market_pairs": len(market),
+                "market_pairs_age_seconds": round(market_age, 1),
+            }
+        )
+
+    # Apply response filtering for token efficiency
+    return filter_response(response, request.response_filter)
@@ -0,0 +1,212 @@
+"""Server metrics for 3Commas MCP
+
+This module implements a tool reporting where the server spends its time:
+per-tool and per-endpoint latency, rate limiter waits, cache hit ratios,
+response sizes and event loop stalls, and a tool returning the hottest
+functions found by on-demand profiling. It also holds the middleware that
+times every tool call and the Prometheus text endpoint served in HTTP mode.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Literal
+
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools import ToolResult
+from mcp import types
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+
+from ..models.base import APIResponse
+from ..models.metrics import GetProfileHotspotsRequest
+from ..utils.decorators import handle_api_errors
+from ..utils.loop_monitor import _loop_monitor
+from ..utils.metrics import _metrics, current_tool
+from ..utils.env import get_profile_rate, get_profiler_type
+from ..utils.profiling import _tool_profiles
+from ..utils.tracing import span
+
+
+def _result_bytes(result: ToolResult) -> int:
+    return sum(
+        len(block.text.encode()) for block in result.content if hasattr(block, "text")
+    )
+
+
+def _is_error(result: ToolResult) -> bool:
+    structured = result.structured_content
+    return result.is_error or (isinstance(structured, dict) and "error" in structured)
+
+
+@contextmanager
+def measure_tool(tool: str) -> Iterator[None]:
+    """Time a tool call, count it and raised errors, and open its span."""
+    token = current_tool.set(tool)
+    start = time.monotonic()
+    try:
+        with span("tool", tool=tool):
+            yield
+    except Exception:
+        _metrics.inc("tool_errors_total", tool=tool)
+        raise
+    finally:
+        current_tool.reset(token)
+        _metrics.inc("tool_calls_total", tool=tool)
+        _metrics.observe(
+            "tool_duration_ms", (time.monotonic() - start) * 1000, tool=tool
+        )
+
+
+class ToolMetrics(Middleware):
+    """Times tool calls and counts their errors and returned bytes.
+
+    Each call is also the root span of its trace when tracing is on.
+    """
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[types.CallToolRequestParams],
+        call_next: CallNext[types.CallToolRequestParams, ToolResult],
+    ) -> ToolResult:
+        tool = context.message.name
+        with measure_tool(tool):
+            result = await call_next(context)
+        if _is_error(result):
+            _metrics.inc("tool_errors_total", tool=tool)
+        _metrics.inc("tool_result_bytes_total", _result_bytes(result), tool=tool)
+        return result
+
+
+async def prometheus_metrics(request: Request) -> PlainTextResponse:
+    """Serve all metrics in the Prometheus text format (GET /metrics)."""
+    return PlainTextResponse(
+        _metrics.prometheus(), media_type="text/plain; version=0.0.4"
+    )
+
+
+def _tools() -> Dict[str, Any]:
+    tools = {}
+    for tool, metrics in sorted(_metrics.group("tool").items()):
+        if "tool_calls_total" not in metrics:
+            # Only slow callbacks outside tool calls
+            continue
+        upstream = metrics.get("tool_upstream_bytes_total", 0)
+        returned = metrics.get("tool_result_bytes_total", 0)
+        tools[tool] = {
+            "calls": metrics.get("tool_calls_total", 0),
+            "errors": metrics.get("tool_errors_total", 0),
+            "latency_ms": metrics.get("tool_duration_ms"),
+            "upstream_bytes": upstream,
+            "returned_bytes": returned,
+            "returned_ratio": round(returned / upstream, 3) if upstream else None,
+            "slow_callbacks": metrics.get("slow_callbacks_total", 0),
+        }
+    return tools
+
+
+def _endpoints() -> Dict[str, Any]:
+    endpoints = {}
+    for endpoint_type, metrics in sorted(_metrics.group("endpoint_type").items()):
+        endpoints[endpoint_type] = {
+            "requests": metrics.get("api_requests_total", 0),
+            "errors": metrics.get("api_errors_total", 0),
+            "rate_limited": metrics.get("api_rate_limited_total", 0),
+            "latency_ms": metrics.get("api_duration_ms"),
+            "limiter_wait_ms": metrics.get("limiter_wait_ms"),
+            "response_bytes": metrics.get("api_response_bytes"),
+        }
+    return endpoints
+
+
+def _event_loop() -> Dict[str, Any]:
+    return {
+        "lag_ms": _metrics.summary("event_loop_lag_ms"),
+        "slow_callback_threshold_ms": _loop_monitor.threshold_ms or None,
+        "slow_callbacks": _metrics.counter("slow_callbacks_total"),
+        "slow_callbacks_by_endpoint": {
+            endpoint: metrics.get("slow_callback_ms")
+            for endpoint, metrics in sorted(_metrics.group("endpoint").items())
+        },
+        "recent_slow_callbacks": list(_loop_monitor.recent),
+    }
+
+
+def _caches() -> Dict[str, Any]:
+    caches = {}
+    for cache, metrics in sorted(_metrics.group("cache").items()):
+        hits = metrics.get("cache_hits_total", 0)
+        misses = metrics.get("cache_misses_total", 0)
+        caches[cache] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / (hits + misses), 3) if hits + misses else None,
+        }
+    return caches
+
+
+@handle_api_errors
+async def get_server_metrics(reset: bool = False) -> APIResponse:
+    """Get performance metrics of this MCP server since start (or last reset).
+
+    Use this to find out why calls are slow: whether time goes into waiting
+    for rate-limit slots, the 3Commas API itself, or the server, and how
+    often caches answer without an API request.
+
+    Args:
+        reset: Clear all metrics after reading them
+
+    Returns:
+        Per tool: calls, errors, latency percentiles (ms), bytes received
+        from the API and bytes returned after filtering.
+        Per endpoint type (global, deals, deals_show, smart_trades): API
+        requests, errors, HTTP 429 responses, latency, rate limiter wait and
+        response size percentiles.
+        Per cache: hits, misses and hit ratio (coalescer counts requests
+        shared with an identical in-flight request).
+        Event loop: scheduling lag percentiles, and callbacks that blocked
+        the loop past the threshold with the tool and API path they ran for.
+    """
+    report = {
+        "uptime_seconds": round(time.time() - _metrics.started, 1),
+        "tools": _tools(),
+        "endpoints": _endpoints(),
+        "caches": _caches(),
+        "event_loop": _event_loop(),
+        "retries": _metrics.counter("retries_total"),
+    }
+    if reset:
+        _metrics.reset()
+        _loop_monitor.recent.clear()
+    return report
+
+
+@handle_api_errors
+async def get_profile_hotspots(
+    tool: str | None = None,
+    top: int = 20,
+    sort: Literal["self", "cumulative"] = "self",
+) -> APIResponse:
+    """Get the hottest functions from profiled tool calls of this server.
+
+    Profiling is on when 3COMMAS_PROFILE_RATE (percent of calls) is set;
+    aggregated stats per tool also go to 3COMMAS_PROFILE_DIR.
+
+    Args:
+        tool: Only functions from profiles of this tool (default: all tools)
+        top: Number of functions to return (1-200)
+        sort: Rank by time spent in the function itself ("self") or
+            including the functions it calls ("cumulative")
+
+    Returns:
+        Profiler in use, sample rate, profiled calls per tool and the top
+        functions with calls (cProfile only), self and cumulative time in ms.
+    """
+    # Validate inputs using Pydantic model
+    request = GetProfileHotspotsRequest(tool=tool, top=top, sort=sort)
+
+    return {
+        "profiler": get_profiler_type(),
+        "rate_percent": get_profile_rate(),
+        "profiled_calls": dict(sorted(_tool_profiles.profiled_calls.items())),
+        "functions": _tool_profiles.hotspots(request.tool, request.top, request.sort),
+    }
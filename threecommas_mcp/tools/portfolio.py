@@ -0,0 +1,214 @@
+"""Portfolio tools for 3Commas MCP
+
+This module implements fleet-wide analytics computed across all DCA bots.
+Bots are paged through ver1/bots once and shared via the fleet cache.
+Reference: https://developers.3commas.io/dca-bot
+"""
+
+from ..store.fleet import _fleet_cache, collect_active_deals, embedded_active_deals
+from ..utils.dca_ladder import capital_requirements, project_active_deals
+from ..utils.decorators import handle_api_errors
+from ..utils.exposure import build_exposure_matrix, exposure_report
+from ..utils.portfolio import GROUP_KEYS, summarize_portfolio
+from ..utils.response_filter import filter_response
+from ..models.base import APIResponse, ResponseFilter
+from ..models.portfolio import (
+    GetActiveDealProjectionRequest,
+    GetDCACapitalRequirementsRequest,
+    GetDCAExposureRequest,
+    GetDCAPortfolioSummaryRequest,
+)
+
+
+@handle_api_errors
+async def get_dca_portfolio_summary(
+    account_id: int = 0,
+    group_by: list[str] | None = None,
+    refresh: bool = False,
+    response_filter: str = "display",
+) -> APIResponse:
+    """Get aggregated profit, deal and capital metrics across all DCA bots.
+
+    Args:
+        account_id: Exchange account ID (0 = all accounts)
+        group_by: Grouping dimensions from "account", "strategy", "quote" (default: all)
+        refresh: Refetch the bot list instead of using the cached copy (default: False)
+        response_filter: Response detail level ("full" or "display")
+
+    Returns:
+        Portfolio totals (realized/unrealized USD profit, deal counts) and per-group aggregates including bought volume per quote.
+    """
+    # Validate inputs using Pydantic model
+    request = GetDCAPortfolioSummaryRequest(
+        account_id=account_id,
+        **{"group_by": group_by} if group_by is not None else {},
+        refresh=refresh,
+        response_filter=ResponseFilter(response_filter),
+    )
+    unknown = set(request.group_by) - set(GROUP_KEYS)
+    if unknown:
+        raise ValueError(
+            f"Unsupported group_by values: {', '.join(sorted(unknown))}. "
+            f"Use any of: {', '.join(GROUP_KEYS)}"
+        )
+
+    # Page through all bots once, reusing the fleet cache when fresh
+    bots = await _fleet_cache.get_bots(
+        request.account_id, max_age=0 if request.refresh else None
+    )
+    if isinstance(bots, dict):
+        return bots
+
+    response: APIResponse = summarize_portfolio(bots, tuple(request.group_by))
+
+    # Apply response filtering for token efficiency
+    return filter_response(response, request.response_filter)
+
+
+@handle_api_errors
+async def get_dca_capital_requirements(
+    account_id: int = 0,
+    bot_ids: list[str] | None = None,
+    enabled_only: bool = False,
+    include_ladder: bool = False,
+    refresh: bool = False,
+    response_filter: str = "display",
+) -> APIResponse:
+    """Compute safety-order ladders and worst-case capital needs for DCA bots.
+
+    Args:
+        account_id: Exchange account ID (0 = all accounts)
+        bot_ids: Only include these bot IDs (default: all bots)
+        enabled_only: Only include enabled bots (default: False)
+        include_ladder: Include per-order prices, volumes, cumulative funds and average entry (default: False)
+        refresh: Refetch the bot list instead of using the cached copy (default: False)
+        response_filter: Response detail level ("full" or "display")
+
+    Returns:
+        Per-bot funds per deal and across concurrent deals, maximum price deviation, worst-case average entry, and totals per quote currency.
+    """
+    # Validate inputs using Pydantic model
+    request = GetDCACapitalRequirementsRequest(
+        account_id=account_id,
+        bot_ids=bot_ids,
+        enabled_only=enabled_only,
+        include_ladder=include_ladder,
+        refresh=refresh,
+        response_filter=ResponseFilter(response_filter),
+    )
+
+    # Page through all bots once, reusing the fleet cache when fresh
+    bots = await _fleet_cache.get_bots(
+        request.account_id, max_age=0 if request.refresh else None
+    )
+    if isinstance(bots, dict):
+        return bots
+
+    if request.bot_ids is not None:
+        wanted = set(request.bot_ids)
+        bots = [bot for bot in bots if str(bot.get("id")) in wanted]
+    if request.enabled_only:
+        bots = [bot for bot in bots if bot.get("is_enabled")]
+
+    response: APIResponse = capital_requirements(bots, request.include_ladder)
+
+    # Apply response filtering for token efficiency
+    return filter_response(response, request.response_filter)
+
+
+@handle_api_errors
+async def get_active_deal_projection(
+    account_id: int = 0,
+    drawdowns: list[float] | None = None,
+    include_deals: bool = False,
+    refresh: bool = False,
+    response_filter: str = "display",
+) -> APIResponse:
+    """Project funds that open DCA deals would pull if the market moves against them.
+
+    Args:
+        account_id: Exchange account ID (0 = all accounts)
+        drawdowns: Adverse price moves in percent from current price (default: 5, 10, 20, 30)
+        include_deals: Include per-deal projections (default: False)
+        refresh: Refetch the bot list instead of using the cached copy (default: False)
+        response_filter: Response detail level ("full" or "display")
+
+    Returns:
+        Per quote currency: funds required, safety orders filled and deals affected at each drawdown level, plus funds for all remaining safety orders.
+    """
+    # Validate inputs using Pydantic model
+    request = GetActiveDealProjectionRequest(
+        account_id=account_id,
+        **{"drawdowns": drawdowns} if drawdowns is not None else {},
+        include_deals=include_deals,
+        refresh=refresh,
+        response_filter=ResponseFilter(response_filter),
+    )
+
+    # Active deals are embedded in the cached bot list; only gaps are refetched
+    bots = await _fleet_cache.get_bots(
+        request.account_id, max_age=0 if request.refresh else None
+    )
+    if isinstance(bots, dict):
+        return bots
+    deals = await collect_active_deals(bots)
+    if isinstance(deals, dict):
+        return deals
+
+    response: APIResponse = project_active_deals(
+        deals, sorted(set(request.drawdowns)), request.include_deals
+    )
+
+    # Apply response filtering for token efficiency
+    return filter_response(response, request.response_filter)
+
+
+@handle_api_errors
+async def get_dca_exposure(
+    account_id: int = 0,
+    group_by: str = "base",
+    top_n: int = 10,
+    quote: str | None = None,
+    refresh: bool = False,
+    response_filter: str = "display",
+) -> APIResponse:
+    """Get exposure to base coins, pairs, quote currencies or accounts across active deals.
+
+    Args:
+        account_id: Exchange account ID (0 = all accounts)
+        group_by: "pair", "base", "quote" or "account" (default: "base")
+        top_n: Number of groups per quote currency (default: 10)
+        quote: Only report this quote currency (default: all)
+        refresh: Refetch the bot list instead of using the cached copy (default: False)
+        response_filter: Response detail level ("full" or "display")
+
+    Returns:
+        Per quote currency: bought volume, unrealized profit, top-N groups with shares, and concentration (top share, HHI) by pair and account.
+    """
+    # Validate inputs using Pydantic model
+    request = GetDCAExposureRequest(
+        account_id=account_id,
+        group_by=group_by,
+        top_n=top_n,
+        quote=quote,
+        refresh=refresh,
+        response_filter=ResponseFilter(response_filter),
+    )
+
+    # Deals embedded in the cached bot list; no per-bot or per-deal fetches
+    bots = await _fleet_cache.get_bots(
+        request.account_id, max_age=0 if request.refresh else None
+    )
+    if isinstance(bots, dict):
+        return bots
+
+    matrix = build_exposure_matrix(embedded_active_deals(bots))
+    response: APIResponse = exposure_report(
+        matrix,
+        request.group_by,
+        request.top_n,
+        request.quote.upper() if request.quote else None,
+    )
+
+    # Apply response filtering for token efficiency
+    return filter_response(response, request.response_filter)
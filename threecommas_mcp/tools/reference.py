@@ -0,0 +1,47 @@
+"""Reference data resources for 3Commas MCP
+
+This module implements MCP resources for data that changes rarely: supported
+markets, the DCA strategy catalog, the pairs blacklist and connected
+accounts. Resources are served from the reference cache, and subscribed
+clients are notified when a background refresh sees changed content, so
+they can keep the data across turns instead of calling list tools again.
+"""
+
+from typing import Any, Dict
+
+from fastmcp.exceptions import ResourceError
+
+from ..store.reference import (
+    ACCOUNTS_URI,
+    BLACKLIST_URI,
+    MARKETS_URI,
+    STRATEGIES_URI,
+    _reference_data,
+)
+
+
+async def _read(uri: str) -> Dict[str, Any]:
+    content = await _reference_data.read(uri)
+    if "error" in content:
+        raise ResourceError(str(content["error"]))
+    return content
+
+
+async def supported_markets() -> Dict[str, Any]:
+    """Supported exchanges and markets (ver1/accounts/market_list)."""
+    return await _read(MARKETS_URI)
+
+
+async def strategy_catalog() -> Dict[str, Any]:
+    """Available DCA bot strategies and their options (ver1/bots/strategy_list)."""
+    return await _read(STRATEGIES_URI)
+
+
+async def pairs_blacklist() -> Dict[str, Any]:
+    """Pairs blacklisted for DCA bots (ver1/bots/pairs_black_list)."""
+    return await _read(BLACKLIST_URI)
+
+
+async def connected_accounts() -> Dict[str, Any]:
+    """Connected exchange accounts and wallets (ver1/accounts)."""
+    return await _read(ACCOUNTS_URI)
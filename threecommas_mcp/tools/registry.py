@@ -0,0 +1,213 @@
+"""Tool registration for 3Commas MCP
+
+Importing every tool module pulls in Pydantic models, NumPy and the stores,
+which makes up most of the server's startup time. Tool schemas only change
+with the code, so after the first start they are kept in a small manifest in
+the data directory, keyed by the package and FastMCP versions and the size
+and modification time of each source file. When the manifest matches, each
+tool is registered from its stored schema. Once the server runs, the tool
+modules are imported in a background thread; a tool called before its
+module is loaded imports it in a worker thread rather than on the event loop.
+"""
+
+import asyncio
+import hashlib
+import importlib
+import json
+import logging
+import os
+import threading
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Dict
+
+from fastmcp import FastMCP
+from fastmcp.tools import FunctionTool, Tool, ToolResult
+from pydantic import PrivateAttr
+
+from ..utils.env import get_data_dir
+from ..utils.profiling import profile_sampled_calls
+
+logger = logging.getLogger(__name__)
+
+_PACKAGE = __name__.rsplit(".", 2)[0]
+
+# Registered tools in listing order as (module, function); modules are
+# relative to the package
+TOOLS: list[tuple[str, str]] = [
+    # Health check tool
+    (".api.client", "health_check"),
+    # DCA bot management tools
+    (".tools.dca_bots", "get_dca_bot_details"),
+    (".tools.dca_bots", "get_dca_bot_list"),
+    (".tools.dca_bots", "get_available_strategy_list"),
+    (".tools.dca_bots", "search_strategies"),
+    (".tools.dca_bots", "get_dca_bot_profit_data"),
+    (".tools.dca_bots", "get_blacklist_of_pairs"),
+    (".tools.dca_bots", "get_dca_bot_changes"),
+    # Account management tools
+    (".tools.account", "get_connected_exchanges_and_wallets"),
+    (".tools.account", "get_account_info"),
+    (".tools.account", "get_accounts_overview"),
+    (".tools.account", "get_balance_history"),
+    # Market data tools
+    (".tools.market_data", "get_all_market_pairs"),
+    (".tools.market_data", "get_currency_rates_and_limits"),
+    (".tools.market_data", "get_supported_markets"),
+    (".tools.market_data", "validate_order_params"),
+    (".tools.market_data", "screen_pairs"),
+    # Deal history tools
+    (".tools.deals", "sync_deals_history"),
+    (".tools.deals", "get_deals_history"),
+    # SmartTrade tools
+    (".tools.smart_trades", "get_smart_trades"),
+    (".tools.smart_trades", "get_smart_trade_details"),
+    (".tools.smart_trades", "get_smart_trade_trades"),
+    # Portfolio analytics tools
+    (".tools.portfolio", "get_dca_portfolio_summary"),
+    (".tools.portfolio", "get_dca_capital_requirements"),
+    (".tools.portfolio", "get_active_deal_projection"),
+    (".tools.portfolio", "get_dca_exposure"),
+    # Session tools
+    (".tools.session", "reset_session_responses"),
+    # Batch tool
+    (".tools.batch", "batch"),
+    # Server metrics tools
+    (".tools.metrics", "get_server_metrics"),
+    (".tools.metrics", "get_profile_hotspots"),
+]
+
+# Tool fields kept in the manifest
+_SCHEMA_FIELDS = ("name", "description", "parameters", "output_schema")
+
+
+def load_function(module: str, function: str) -> Any:
+    """Import a registered tool's module and return its function.
+
+    The function is wrapped for on-demand profiling (3COMMAS_PROFILE_RATE).
+    """
+    fn = getattr(importlib.import_module(module, _PACKAGE), function)
+    return profile_sampled_calls(fn)
+
+
+class LazyTool(Tool):
+    """A tool registered from its stored schema; its module loads on first call."""
+
+    module: str
+    function: str
+    _tool: FunctionTool | None = PrivateAttr(default=None)
+
+    def _load(self) -> FunctionTool:
+        if self._tool is None:
+            fn = load_function(self.module, self.function)
+            self._tool = FunctionTool.from_function(fn)
+        return self._tool
+
+    async def run(self, arguments: Dict[str, Any]) -> ToolResult:
+        tool = self._tool
+        if tool is None:
+            # Importing a tool module can take a few hundred milliseconds
+            tool = await asyncio.to_thread(self._load)
+        return await tool.run(arguments)
+
+
+def _manifest_path() -> str:
+    return os.path.join(get_data_dir(), "tool_manifest.json")
+
+
+def _source_hash() -> str:
+    """Hash of the versions and source files the schemas came from.
+
+    Files are identified by path, size and modification time, so checking
+    the manifest never reads the sources themselves.
+    """
+    try:
+        package_version = version("threecommas-mcp")
+    except PackageNotFoundError:
+        package_version = "unknown"
+    digest = hashlib.sha256(f"{package_version}|{version('fastmcp')}".encode())
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for directory, dirs, files in sorted(os.walk(root)):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith(".py"):
+                path = os.path.join(directory, name)
+                stat = os.stat(path)
+                digest.update(
+                    f"{os.path.relpath(path, root)}|{stat.st_size}|"
+                    f"{stat.st_mtime_ns}".encode()
+                )
+    return digest.hexdigest()
+
+
+def _read_manifest(source_hash: str) -> list[Dict[str, Any]] | None:
+    """Stored tool schemas, or None if missing or built from other sources."""
+    try:
+        with open(_manifest_path(), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("source_hash") != source_hash:
+        return None
+    tools = manifest.get("tools")
+    if not isinstance(tools, list) or len(tools) != len(TOOLS):
+        return None
+    for (_, function), tool in zip(TOOLS, tools):
+        if not isinstance(tool, dict) or tool.get("name") != function:
+            return None
+        if any(field not in tool for field in _SCHEMA_FIELDS):
+            return None
+    return tools
+
+
+def _write_manifest(source_hash: str, tools: list[Dict[str, Any]]) -> None:
+    path = _manifest_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"source_hash": source_hash, "tools": tools}, f)
+        os.replace(path + ".tmp", path)
+    except OSError as e:
+        # Next start registers eagerly again
+        logger.warning(f"Could not save tool manifest to {path}: {e}")
+
+
+def register_tools(mcp: FastMCP) -> None:
+    """Register all tools, lazily when the stored manifest is current."""
+    source_hash = _source_hash()
+    manifest = _read_manifest(source_hash)
+    if manifest is not None:
+        for (module, function), schema in zip(TOOLS, manifest):
+            mcp.add_tool(
+                LazyTool(
+                    module=module,
+                    function=function,
+                    name=schema["name"],
+                    description=schema["description"],
+                    parameters=schema["parameters"],
+                    output_schema=schema["output_schema"],
+                )
+            )
+        return
+
+    schemas = []
+    for module, function in TOOLS:
+        tool = FunctionTool.from_function(load_function(module, function))
+        mcp.add_tool(tool)
+        schemas.append({field: getattr(tool, field) for field in _SCHEMA_FIELDS})
+    _write_manifest(source_hash, schemas)
+
+
+def _import_tool_modules() -> None:
+    for module in dict.fromkeys(module for module, _ in TOOLS):
+        try:
+            importlib.import_module(module, _PACKAGE)
+        except ImportError as e:
+            # The tool reports the same error when called
+            logger.warning(f"Could not preload {module}: {e}")
+
+
+def preload_tool_modules() -> None:
+    """Import all tool modules in a background thread (after lazy registration)."""
+    threading.Thread(
+        target=_import_tool_modules, name="threecommas-tool-preload", daemon=True
+    ).start()
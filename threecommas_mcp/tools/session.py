@@ -0,0 +1,26 @@
+"""Session tools for 3Commas MCP
+
+This module implements tools that manage per-session server state rather
+than calling the 3Commas API.
+"""
+
+from ..utils.decorators import handle_api_errors
+from ..utils.fingerprint import _session_responses, current_session_id
+from ..models.base import APIResponse
+
+
+@handle_api_errors
+async def reset_session_responses() -> APIResponse:
+    """Forget the responses this session has already received.
+
+    With 3COMMAS_SESSION_DIFFS=true, repeated calls to polling tools return
+    {"unchanged": true} or a patch against the previous response. After a
+    reset, the next call of each tool returns its full response again.
+
+    Returns:
+        Number of remembered tool calls that were forgotten.
+    """
+    session_id = current_session_id()
+    if session_id is None:
+        return {"forgotten_calls": 0}
+    return {"forgotten_calls": _session_responses.forget(session_id)}
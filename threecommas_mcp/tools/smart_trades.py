@@ -0,0 +1,171 @@
+"""SmartTrade tools for 3Commas MCP
+
+This module implements read-only SmartTrade endpoints of the 3Commas API.
+Multi-request reads fan out through the burst scheduler so they use the
+full SmartTrades rate-limit window (40 requests per 10 seconds).
+Reference: https://developers.3commas.io/smart-trade
+"""
+
+from typing import Any, Dict
+
+from ..api.burst import APICall, fan_out
+from ..api.client import api_request
+from ..utils.decorators import _rate_limiter, handle_api_errors
+from ..utils.response_filter import filter_response
+from ..models.base import APIResponse, ResponseFilter
+from ..models.smart_trades import GetSmartTradeDetailsRequest, GetSmartTradesRequest
+
+
+def _validate_ids(ids: list[str]) -> list[str]:
+    """Deduplicate SmartTrade IDs, rejecting non-numeric values."""
+    invalid = [i for i in ids if not str(i).isdigit()]
+    if invalid:
+        raise ValueError(f"SmartTrade IDs must be numeric: {', '.join(invalid[:5])}")
+    return list(dict.fromkeys(str(i) for i in ids))
+
+
+def _collect(ids: list[str], responses: list[Dict[str, Any]]) -> Dict[str, Any]:
+    """Split fanned-out responses into data and per-ID errors."""
+    data, errors = [], []
+    for smart_trade_id, response in zip(ids, responses):
+        if "error" in response:
+            errors.append(
+                {"smart_trade_id": smart_trade_id, "error": response["error"]}
+            )
+        else:
+            data.append({"smart_trade_id": smart_trade_id, **response})
+    return {"requested": len(ids), "data": data, "errors": errors}
+
+
+@handle_api_errors
+async def get_smart_trades(
+    account_id: int = 0,
+    status: str | None = None,
+    type: str | None = None,
+    pair: str | None = None,
+    per_page: int = 100,
+    max_pages: int = 1,
+    response_filter: str = "display",
+) -> APIResponse:
+    """Get the list of SmartTrades with optional filters.
+
+    Args:
+        account_id: Exchange account ID (0 = all accounts)
+        status: "all", "active", "finished", "successfully_finished", "cancelled" or "failed"
+        type: "simple_buy", "simple_sell", "smart_sell", "smart_trade" or "smart_cover"
+        pair: Pair filter (e.g. "USDT_BTC")
+        per_page: SmartTrades per page (1-100, default: 100)
+        max_pages: Pages to read; pages after the first are fetched concurrently in rate-limit bursts, stopping at the last page (default: 1)
+        response_filter: Response detail level ("full" or "display")
+
+    Returns:
+        SmartTrades with status, pair, position, take profit and stop loss settings.
+    """
+    # Validate inputs using Pydantic model
+    request = GetSmartTradesRequest(
+        account_id=account_id,
+        status=status,
+        type=type,
+        pair=pair,
+        per_page=per_page,
+        max_pages=max_pages,
+        response_filter=ResponseFilter(response_filter),
+    )
+    params = request.to_query_params()
+    params.pop("max_pages", None)
+    params["per_page"] = str(request.per_page)
+
+    # The first page tells whether more pages exist
+    first = await api_request(
+        "v2/smart_trades", params={**params, "page": "1"}, method="GET"
+    )
+    if "error" in first:
+        return first
+    smart_trades = list(first.get("data", []))
+
+    # Fetch the remaining pages in bursts that double in size, capped by the
+    # free limiter slots, and stop at the first short page, so a short list
+    # does not spend the window on pages past its end
+    next_page, size = 2, 2
+    more = len(smart_trades) == request.per_page
+    while more and next_page <= request.max_pages:
+        limit, _ = _rate_limiter.get_limit("smart_trades")
+        burst = min(size, _rate_limiter.available_slots("smart_trades") or limit)
+        size *= 2
+        last_page = min(request.max_pages, next_page + burst - 1)
+        pages = await fan_out(
+            [
+                APICall("v2/smart_trades", {**params, "page": str(page)})
+                for page in range(next_page, last_page + 1)
+            ],
+            min_burst=last_page - next_page + 1,
+        )
+        next_page = last_page + 1
+        for page in pages:
+            if "error" in page:
+                return page
+            rows = page.get("data", [])
+            smart_trades.extend(rows)
+            # Pages past the end come back short or empty
+            if len(rows) < request.per_page:
+                more = False
+                break
+
+    response: APIResponse = {"data": smart_trades}
+
+    # Apply response filtering for token efficiency
+    return filter_response(response, request.response_filter)
+
+
+@handle_api_errors
+async def get_smart_trade_details(
+    smart_trade_ids: list[str], response_filter: str = "display"
+) -> APIResponse:
+    """Get details for one or more SmartTrades.
+
+    Args:
+        smart_trade_ids: SmartTrade IDs (1-400); fetched concurrently in rate-limit bursts
+        response_filter: Response detail level ("full" or "display")
+
+    Returns:
+        SmartTrade details per ID (position, take profit steps, stop loss, status) and per-ID errors.
+    """
+    # Validate inputs using Pydantic model
+    request = GetSmartTradeDetailsRequest(
+        smart_trade_ids=smart_trade_ids,
+        response_filter=ResponseFilter(response_filter),
+    )
+    ids = _validate_ids(request.smart_trade_ids)
+
+    responses = await fan_out([APICall(f"v2/smart_trades/{i}") for i in ids])
+    response: APIResponse = _collect(ids, responses)
+
+    # Apply response filtering for token efficiency
+    return filter_response(response, request.response_filter)
+
+
+@handle_api_errors
+async def get_smart_trade_trades(
+    smart_trade_ids: list[str], response_filter: str = "display"
+) -> APIResponse:
+    """Get the executed and pending trades of one or more SmartTrades.
+
+    Args:
+        smart_trade_ids: SmartTrade IDs (1-400); fetched concurrently in rate-limit bursts
+        response_filter: Response detail level ("full" or "display")
+
+    Returns:
+        Trades per SmartTrade ID (side, order type, price, amount, status) and per-ID errors.
+    """
+    # Validate inputs using Pydantic model
+    request = GetSmartTradeDetailsRequest(
+        smart_trade_ids=smart_trade_ids,
+        response_filter=ResponseFilter(response_filter),
+    )
+    ids = _validate_ids(request.smart_trade_ids)
+
+    responses = await fan_out([APICall(f"v2/smart_trades/{i}/trades") for i in ids])
+    response: APIResponse = _collect(ids, responses)
+
+    # Apply response filtering for token efficiency
+    return filter_response(response, request.response_filter)
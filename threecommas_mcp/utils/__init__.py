@@ -7,6 +7,37 @@ from .env import (
     get_rate_limits,
     validate_environment,
     get_api_base_url,
+    get_data_dir,
+    get_server_transport,
+    get_server_host,
+    get_server_port,
+    get_balance_sample_interval,
+    get_reference_refresh_interval,
+    get_prefetch_interval,
+    should_serve_metrics_endpoint,
+    should_monitor_event_loop,
+    get_http_max_connections,
+    get_fleet_cache_ttl,
+    get_account_cache_ttl,
+    get_strategy_cache_ttl,
+    get_blacklist_cache_ttl,
+    get_market_pairs_cache_ttl,
+    get_full_sync_interval,
+    get_prefetch_top,
+    get_prefetch_budget,
+    get_prefetch_max_age,
+    get_offload_threshold,
+    get_offload_pool,
+    get_offload_workers,
+    get_loop_lag_interval,
+    get_slow_callback_threshold,
+    get_profile_rate,
+    get_profiler_type,
+    get_profile_dir,
+    get_trace_sinks,
+    get_trace_file,
+    should_send_session_diffs,
+    get_session_diff_ttl,
 )
 
 # Authentication utilities
@@ -33,6 +64,37 @@ __all__ = [
     "get_rate_limits",
     "validate_environment",
     "get_api_base_url",
+    "get_data_dir",
+    "get_server_transport",
+    "get_server_host",
+    "get_server_port",
+    "get_balance_sample_interval",
+    "get_reference_refresh_interval",
+    "get_prefetch_interval",
+    "should_serve_metrics_endpoint",
+    "should_monitor_event_loop",
+    "get_http_max_connections",
+    "get_fleet_cache_ttl",
+    "get_account_cache_ttl",
+    "get_strategy_cache_ttl",
+    "get_blacklist_cache_ttl",
+    "get_market_pairs_cache_ttl",
+    "get_full_sync_interval",
+    "get_prefetch_top",
+    "get_prefetch_budget",
+    "get_prefetch_max_age",
+    "get_offload_threshold",
+    "get_offload_pool",
+    "get_offload_workers",
+    "get_loop_lag_interval",
+    "get_slow_callback_threshold",
+    "get_profile_rate",
+    "get_profiler_type",
+    "get_profile_dir",
+    "get_trace_sinks",
+    "get_trace_file",
+    "should_send_session_diffs",
+    "get_session_diff_ttl",
     # Authentication utilities
     "generate_signature",
     "build_query_string",
@@ -0,0 +1,488 @@
+"""Vectorized DCA safety-order ladder calculations for 3Commas MCP
+
+This module computes complete safety-order ladders (trigger deviation, price,
+volume, cumulative funds, average entry) for many bots at once. Bot parameters
+are loaded into 1-D arrays and the ladder is built on an (bots x orders) grid
+with NumPy broadcasting; bots with fewer safety orders are masked. Below
+VECTORIZE_MIN_ORDERS safety orders in total, capital_requirements runs a
+per-bot loop instead, which is faster for small fleets.
+
+Prices are relative to the base order price (1.0), so ladders do not depend
+on the current market price. Active deals are projected by scaling the ladder
+with each deal's base order price and comparing against drawdown targets.
+"""
+
+from typing import Any, Dict, NamedTuple
+
+import numpy as np
+
+from .portfolio import bot_quote, to_float
+
+
+# Fleets with fewer safety orders than this in total are computed with a
+# per-bot loop, which is faster there than loading and broadcasting arrays
+# (see scripts/benchmark_dca_ladder.py)
+VECTORIZE_MIN_ORDERS = 400
+
+
+class LadderParams(NamedTuple):
+    """Per-bot DCA parameters as aligned 1-D arrays."""
+
+    base_order_volume: np.ndarray
+    safety_order_volume: np.ndarray
+    martingale_volume_coefficient: np.ndarray
+    martingale_step_coefficient: np.ndarray
+    safety_order_step_percentage: np.ndarray
+    max_safety_orders: np.ndarray
+    max_active_deals: np.ndarray
+    is_short: np.ndarray
+
+
+class Ladders(NamedTuple):
+    """Safety-order ladders on a (bots x max_safety_orders) grid.
+
+    Entries beyond a bot's max_safety_orders are masked out (mask == False).
+    """
+
+    mask: np.ndarray
+    deviation: np.ndarray
+    price: np.ndarray
+    volume: np.ndarray
+    cumulative_funds: np.ndarray
+    average_entry: np.ndarray
+
+
+def load_ladder_params(bots: list[Dict[str, Any]]) -> LadderParams:
+    """Load DCA ladder parameters from raw bot dicts into arrays."""
+    # One list comprehension per column is much cheaper than per-cell writes
+    columns = {
+        name: np.array([to_float(bot.get(name)) for bot in bots], dtype=np.float64)
+        for name in LadderParams._fields
+        if name not in ("max_safety_orders", "max_active_deals", "is_short")
+    }
+    max_so = np.array(
+        [to_float(bot.get("max_safety_orders")) for bot in bots], dtype=np.float64
+    ).astype(np.int64)
+    max_deals = np.maximum(
+        np.array(
+            [to_float(bot.get("max_active_deals") or 1) for bot in bots],
+            dtype=np.float64,
+        ).astype(np.int64),
+        1,
+    )
+    is_short = np.array([bot.get("strategy") == "short" for bot in bots], dtype=bool)
+
+    # Coefficients default to 1.0 (flat ladder) when missing
+    for name in ("martingale_volume_coefficient", "martingale_step_coefficient"):
+        columns[name][columns[name] <= 0] = 1.0
+
+    return LadderParams(
+        max_safety_orders=max_so,
+        max_active_deals=max_deals,
+        is_short=is_short,
+        **columns,
+    )
+
+
+def compute_ladders(params: LadderParams, max_orders: int | None = None) -> Ladders:
+    """Build safety-order ladders for all bots with one broadcast pass.
+
+    Safety order n (1-based) follows 3Commas semantics:
+    - volume_n = safety_order_volume * mvc ** (n - 1)
+    - deviation_n = step * (1 + msc + ... + msc ** (n - 1)) percent
+    - price_n = 1 - deviation_n / 100 for long bots (1 + ... for short bots)
+
+    Args:
+        params: Per-bot parameter arrays
+        max_orders: Grid width (default: largest max_safety_orders)
+
+    Returns:
+        Ladders with (bots x orders) arrays; column 0 is safety order 1.
+    """
+    max_so = params.max_safety_orders
+    width = int(max_so.max(initial=0)) if max_orders is None else max_orders
+    n = np.arange(1, width + 1, dtype=np.float64)[None, :]
+    mask = n <= max_so[:, None]
+
+    bots = max_so.size
+    mvc = params.martingale_volume_coefficient[:, None]
+    msc = params.martingale_step_coefficient[:, None]
+
+    # Running products are much cheaper than float powers on the full grid
+    volume = np.empty((bots, width))
+    volume[:, :1] = params.safety_order_volume[:, None]
+    volume[:, 1:] = mvc
+    np.cumprod(volume, axis=1, out=volume)
+    volume[~mask] = 0.0
+
+    step_sizes = np.empty((bots, width))
+    step_sizes[:, :1] = params.safety_order_step_percentage[:, None]
+    step_sizes[:, 1:] = msc
+    np.cumprod(step_sizes, axis=1, out=step_sizes)
+    deviation = np.cumsum(step_sizes, axis=1)
+
+    direction = np.where(params.is_short, 1.0, -1.0)[:, None]
+    price = 1.0 + direction * deviation / 100.0
+
+    base = params.base_order_volume[:, None]
+    cumulative_funds = base + np.cumsum(volume, axis=1)
+    # Amount bought per order in base units; invalid prices contribute nothing
+    valid = price > 0
+    amounts = np.divide(volume, price, out=np.zeros_like(volume), where=valid)
+    cumulative_amount = base + np.cumsum(amounts, axis=1)
+    average_entry = np.divide(
+        cumulative_funds,
+        cumulative_amount,
+        out=np.ones_like(cumulative_funds),
+        where=cumulative_amount > 0,
+    )
+
+    outside = ~mask
+    for grid in (deviation, price, cumulative_funds, average_entry):
+        grid[outside] = np.nan
+
+    return Ladders(
+        mask=mask,
+        deviation=deviation,
+        price=price,
+        volume=volume,
+        cumulative_funds=cumulative_funds,
+        average_entry=average_entry,
+    )
+
+
+def _last_valid(
+    values: np.ndarray, max_so: np.ndarray, fallback: np.ndarray
+) -> np.ndarray:
+    """Pick each row's value at its last safety order, or fallback without SOs."""
+    if values.shape[1] == 0:
+        return fallback
+    index = np.clip(max_so - 1, 0, values.shape[1] - 1)
+    picked = values[np.arange(values.shape[0]), index]
+    return np.where(max_so > 0, picked, fallback)
+
+
+class _Requirements(NamedTuple):
+    """Per-bot results shared by the loop and the vectorized path, as lists."""
+
+    per_deal: list[float]
+    max_deviation: list[float]
+    worst_average: list[float]
+    max_safety_orders: list[int]
+    max_active_deals: list[int]
+    is_short: list[bool]
+    # deviation, price, volume, cumulative funds and average entry rows per
+    # bot (only with include_ladder); a row may run past the bot's orders
+    ladders: list[list[list[float]]] | None
+
+
+def _vectorized_requirements(
+    bots: list[Dict[str, Any]], include_ladder: bool
+) -> _Requirements:
+    params = load_ladder_params(bots)
+    ladders = compute_ladders(params)
+    count = len(bots)
+    max_so = params.max_safety_orders
+    # Indexing arrays per element is slow; convert each column to a list once
+    return _Requirements(
+        per_deal=_last_valid(
+            ladders.cumulative_funds, max_so, params.base_order_volume
+        ).tolist(),
+        max_deviation=_last_valid(ladders.deviation, max_so, np.zeros(count)).tolist(),
+        worst_average=_last_valid(
+            ladders.average_entry, max_so, np.ones(count)
+        ).tolist(),
+        max_safety_orders=max_so.tolist(),
+        max_active_deals=params.max_active_deals.tolist(),
+        is_short=params.is_short.tolist(),
+        ladders=[
+            ladders.deviation.tolist(),
+            ladders.price.tolist(),
+            ladders.volume.tolist(),
+            ladders.cumulative_funds.tolist(),
+            ladders.average_entry.tolist(),
+        ]
+        if include_ladder
+        else None,
+    )
+
+
+def _loop_requirements(
+    bots: list[Dict[str, Any]], include_ladder: bool
+) -> _Requirements:
+    """Same results as _vectorized_requirements, one bot at a time.
+
+    Sums are accumulated in the order compute_ladders uses, so both paths
+    return identical floats.
+    """
+    result = _Requirements([], [], [], [], [], [], [[], [], [], [], []])
+    for bot in bots:
+        base = to_float(bot.get("base_order_volume"))
+        volume = to_float(bot.get("safety_order_volume"))
+        step_size = to_float(bot.get("safety_order_step_percentage"))
+        # Coefficients default to 1.0 (flat ladder) when missing
+        mvc = to_float(bot.get("martingale_volume_coefficient"))
+        mvc = mvc if mvc > 0 else 1.0
+        msc = to_float(bot.get("martingale_step_coefficient"))
+        msc = msc if msc > 0 else 1.0
+        max_so = int(to_float(bot.get("max_safety_orders")))
+        is_short = bot.get("strategy") == "short"
+        direction = 1.0 if is_short else -1.0
+
+        funds, deviation, average = base, 0.0, 1.0
+        volume_sum = amount_sum = 0.0
+        rows: list[list[float]] = [[], [], [], [], []]
+        for n in range(max_so):
+            if n:
+                volume *= mvc
+                step_size *= msc
+            deviation += step_size
+            price = 1.0 + direction * deviation / 100.0
+            volume_sum += volume
+            amount_sum += volume / price if price > 0 else 0.0
+            funds = base + volume_sum
+            amount = base + amount_sum
+            average = funds / amount if amount > 0 else 1.0
+            if include_ladder:
+                for row, value in zip(rows, (deviation, price, volume, funds, average)):
+                    row.append(value)
+
+        result.per_deal.append(funds)
+        result.max_deviation.append(deviation)
+        result.worst_average.append(average)
+        result.max_safety_orders.append(max_so)
+        result.max_active_deals.append(
+            max(int(to_float(bot.get("max_active_deals") or 1)), 1)
+        )
+        result.is_short.append(is_short)
+        if include_ladder and result.ladders is not None:
+            for grid, row in zip(result.ladders, rows):
+                grid.append(row)
+    return result if include_ladder else result._replace(ladders=None)
+
+
+def capital_requirements(
+    bots: list[Dict[str, Any]], include_ladder: bool = False
+) -> Dict[str, Any]:
+    """Compute worst-case funds and price deviation for every bot.
+
+    Fleets with fewer than VECTORIZE_MIN_ORDERS safety orders in total are
+    computed bot by bot, larger ones on the NumPy grid.
+
+    Args:
+        bots: Raw bot dicts from ver1/bots
+        include_ladder: Include the full per-order ladder for each bot
+
+    Returns:
+        Per-bot requirements, per-quote totals across concurrent deals and fleet counts.
+    """
+    orders = sum(max(0, int(to_float(bot.get("max_safety_orders")))) for bot in bots)
+    if orders >= VECTORIZE_MIN_ORDERS:
+        req = _vectorized_requirements(bots, include_ladder)
+    else:
+        req = _loop_requirements(bots, include_ladder)
+
+    quotes = [bot_quote(bot) for bot in bots]
+    group_bots: Dict[str, int] = {}
+    group_per_deal: Dict[str, float] = {}
+    group_concurrent: Dict[str, float] = {}
+    results = []
+    for i, bot in enumerate(bots):
+        quote = quotes[i]
+        per_deal = req.per_deal[i]
+        concurrent = per_deal * req.max_active_deals[i]
+        group_bots[quote] = group_bots.get(quote, 0) + 1
+        group_per_deal[quote] = group_per_deal.get(quote, 0.0) + per_deal
+        group_concurrent[quote] = group_concurrent.get(quote, 0.0) + concurrent
+
+        max_so = req.max_safety_orders[i]
+        entry: Dict[str, Any] = {
+            "bot_id": bot.get("id"),
+            "name": bot.get("name"),
+            "quote": quote,
+            "strategy": "short" if req.is_short[i] else "long",
+            "volume_type": bot.get("safety_order_volume_type")
+            or bot.get("base_order_volume_type"),
+            "max_safety_orders": max_so,
+            "max_active_deals": req.max_active_deals[i],
+            "funds_per_deal": round(per_deal, 8),
+            "funds_all_concurrent_deals": round(concurrent, 8),
+            "max_price_deviation_percent": round(req.max_deviation[i], 4),
+            "worst_case_average_entry_percent": round(
+                (req.worst_average[i] - 1.0) * 100.0, 4
+            ),
+        }
+        if max_so > 0 and not req.is_short[i] and req.max_deviation[i] >= 100.0:
+            entry["warning"] = "last safety orders trigger at or below zero price"
+        if req.ladders is not None:
+            deviation, price, volume, funds, average = (grid[i] for grid in req.ladders)
+            entry["ladder"] = [
+                {
+                    "order": n + 1,
+                    "deviation_percent": round(deviation[n], 4),
+                    "price_ratio": round(price[n], 6),
+                    "volume": round(volume[n], 8),
+                    "cumulative_funds": round(funds[n], 8),
+                    "average_entry_ratio": round(average[n], 6),
+                }
+                for n in range(max_so)
+            ]
+        results.append(entry)
+
+    return {
+        "bots": len(bots),
+        "totals_by_quote": [
+            {
+                "quote": quote,
+                "bots": group_bots[quote],
+                "funds_per_deal": round(group_per_deal[quote], 8),
+                "funds_all_concurrent_deals": round(group_concurrent[quote], 8),
+            }
+            for quote in sorted(group_bots)
+        ],
+        "requirements": results,
+    }
+
+
+def _deal_quote(deal: Dict[str, Any]) -> str:
+    """Get the quote currency of a deal (from_currency or QUOTE_BASE pair)."""
+    if deal.get("from_currency"):
+        return str(deal["from_currency"])
+    pair = deal.get("pair")
+    if isinstance(pair, str) and "_" in pair:
+        return pair.split("_", 1)[0]
+    return "unknown"
+
+
+def project_active_deals(
+    deals: list[Dict[str, Any]],
+    drawdowns: list[float],
+    include_deals: bool = False,
+) -> Dict[str, Any]:
+    """Project remaining safety-order fills of active deals at drawdown levels.
+
+    A drawdown of X percent moves the price X percent against each deal from
+    its current price (down for long deals, up for short deals). Every
+    remaining safety order whose trigger price is reached fills. All deals and
+    levels are evaluated in one broadcast pass on a (deals x levels x orders)
+    grid.
+
+    Args:
+        deals: Active deal dicts with ladder settings, prices and completed SO counts
+        drawdowns: Drawdown levels in percent
+        include_deals: Include per-deal projections
+
+    Returns:
+        Per-quote funds required and orders filled at each level, plus optional per-deal rows.
+    """
+    params = load_ladder_params(deals)
+    ladders = compute_ladders(params)
+    count, width = ladders.mask.shape
+
+    def column(name: str) -> np.ndarray:
+        return np.array([to_float(deal.get(name)) for deal in deals], dtype=np.float64)
+
+    completed = column("completed_safety_orders_count")
+    base_price = column("base_order_average_price")
+    current = column("current_price")
+    bought_volume = column("bought_volume")
+    bought_amount = column("bought_amount")
+
+    # Remaining orders of deals with usable prices
+    order = np.arange(1, width + 1)[None, :]
+    priced = (base_price > 0) & (current > 0)
+    remaining = ladders.mask & (order > completed[:, None]) & priced[:, None]
+    trigger = np.where(remaining, base_price[:, None] * ladders.price, np.nan)
+    volume = np.where(remaining, ladders.volume, 0.0)
+
+    levels = np.asarray(drawdowns, dtype=np.float64)
+    direction = np.where(params.is_short, 1.0, -1.0)[:, None]
+    target = current[:, None] * (1.0 + direction * levels[None, :] / 100.0)
+
+    # Long orders fill once the target falls to their trigger, short once it rises
+    fills = (
+        direction[:, :, None] * (trigger[:, None, :] - target[:, :, None]) <= 0
+    ) & remaining[:, None, :]
+    funds = np.einsum("dlo,do->dl", fills, volume)
+    filled = fills.sum(axis=2)
+    amounts = np.divide(volume, trigger, out=np.zeros_like(volume), where=trigger > 0)
+    total_amount = bought_amount[:, None] + np.einsum("dlo,do->dl", fills, amounts)
+    average = np.divide(
+        bought_volume[:, None] + funds,
+        total_amount,
+        out=np.full_like(funds, np.nan),
+        where=total_amount > 0,
+    )
+    next_trigger = np.full(count, np.nan)
+    if width:
+        first = trigger[np.arange(count), np.argmax(remaining, axis=1)]
+        next_trigger = np.where(remaining.any(axis=1), first, np.nan)
+
+    quotes = np.array([_deal_quote(deal) for deal in deals], dtype=object).astype(str)
+    totals: list[Dict[str, Any]] = []
+    if count:
+        groups, inverse = np.unique(quotes, return_inverse=True)
+        deal_counts = np.bincount(inverse, minlength=groups.size)
+        all_remaining = np.bincount(
+            inverse, weights=volume.sum(axis=1), minlength=groups.size
+        )
+        # Per-quote sums for every level at once
+        group_funds = np.zeros((groups.size, levels.size))
+        group_orders = np.zeros((groups.size, levels.size), dtype=np.int64)
+        group_deals = np.zeros((groups.size, levels.size), dtype=np.int64)
+        np.add.at(group_funds, inverse, funds)
+        np.add.at(group_orders, inverse, filled)
+        np.add.at(group_deals, inverse, filled > 0)
+        totals = [
+            {
+                "quote": str(group),
+                "deals": int(deal_counts[g]),
+                "funds_all_remaining_orders": round(float(all_remaining[g]), 8),
+                "levels": [
+                    {
+                        "drawdown_percent": float(level),
+                        "funds_required": round(float(group_funds[g, j]), 8),
+                        "orders_filled": int(group_orders[g, j]),
+                        "deals_affected": int(group_deals[g, j]),
+                    }
+                    for j, level in enumerate(levels)
+                ],
+            }
+            for g, group in enumerate(groups)
+        ]
+
+    result: Dict[str, Any] = {
+        "deals": count,
+        "unpriced_deals": int(np.count_nonzero(~priced)),
+        "drawdowns_percent": [float(level) for level in levels],
+        "totals_by_quote": totals,
+    }
+    if include_deals:
+        result["projections"] = [
+            {
+                "deal_id": deal.get("id"),
+                "bot_id": deal.get("bot_id"),
+                "pair": deal.get("pair"),
+                "quote": str(quotes[i]),
+                "current_price": float(current[i]),
+                "completed_safety_orders": int(completed[i]),
+                "remaining_safety_orders": int(remaining[i].sum()),
+                "funds_all_remaining_orders": round(float(volume[i].sum()), 8),
+                "next_safety_order_price": None
+                if np.isnan(next_trigger[i])
+                else round(float(next_trigger[i]), 8),
+                "levels": [
+                    {
+                        "drawdown_percent": float(level),
+                        "funds_required": round(float(funds[i, j]), 8),
+                        "orders_filled": int(filled[i, j]),
+                        "average_price": None
+                        if np.isnan(average[i, j])
+                        else round(float(average[i, j]), 8),
+                    }
+                    for j, level in enumerate(levels)
+                ],
+            }
+            for i, deal in enumerate(deals)
+        ]
+    return result
@@ -1,11 +1,15 @@
 """Decorators and utility functions for 3Commas MCP"""
 
 import asyncio
+import logging
 import time
 from functools import wraps
 from typing import Callable, Any, Dict, Awaitable, cast
 
 from .env import validate_environment
+from .metrics import _metrics
+
+logger = logging.getLogger(__name__)
 
 
 def handle_api_errors(
@@ -71,6 +75,7 @@ def rate_limit_retry(
                                 delay = min(
                                     base_delay * (exponential_base**attempt), max_delay
                                 )
+                                _metrics.inc("retries_total", operation=func.__name__)
                                 await asyncio.sleep(delay)
                                 continue
 
@@ -84,6 +89,7 @@ def rate_limit_retry(
                             delay = min(
                                 base_delay * (exponential_base**attempt), max_delay
                             )
+                            _metrics.inc("retries_total", operation=func.__name__)
                             await asyncio.sleep(delay)
                             continue
                     # For non-rate-limit errors, don't retry
@@ -132,6 +138,10 @@ def validate_trading_context(
     return wrapper
 
 
+# Seconds between limiter checks while only in-flight requests fill a window
+IN_FLIGHT_POLL_INTERVAL = 0.05
+
+
 class RateLimiter:
     """Rate limiter for 3Commas API endpoints based on official limits."""
 
@@ -142,9 +152,18 @@ class RateLimiter:
             "smart_trades": [],
             "deals_show": [],
         }
-        from .env import get_rate_limits
+        # Requests sent but not yet recorded; they count against the window
+        self._in_flight: Dict[str, int] = {name: 0 for name in self._requests}
+        self._limits_config: Dict[str, Dict[str, int]] | None = None
 
-        self._limits = get_rate_limits()
+    @property
+    def _limits(self) -> Dict[str, Dict[str, int]]:
+        """Limits from environment, read on first use rather than at import."""
+        if self._limits_config is None:
+            from .env import get_rate_limits
+
+            self._limits_config = get_rate_limits()
+        return self._limits_config
 
     def can_make_request(self, endpoint_type: str = "global") -> bool:
         """Check if a request can be made without exceeding rate limits."""
@@ -163,7 +182,8 @@ class RateLimiter:
         ]
 
         # Check if we're under the limit
-        return len(self._requests[endpoint_type]) < limit_config["requests"]
+        used = len(self._requests[endpoint_type]) + self._in_flight[endpoint_type]
+        return used < limit_config["requests"]
 
     def record_request(self, endpoint_type: str = "global") -> None:
         """Record that a request was made."""
@@ -191,13 +211,79 @@ class RateLimiter:
             if req_time > window_start
         ]
 
-        if not old_requests:
-            return 0.0
+        if len(old_requests) < limit_config["requests"]:
+            # Only in-flight requests fill the window; poll until they are recorded
+            return IN_FLIGHT_POLL_INTERVAL
 
         # Wait until the oldest request falls outside the window
         oldest_request = min(old_requests)
         return max(0.0, (oldest_request + limit_config["window"]) - current_time)
 
+    def get_limit(self, endpoint_type: str = "global") -> tuple[int, int]:
+        """Get (requests, window seconds) for an endpoint type."""
+        if endpoint_type not in self._limits:
+            endpoint_type = "global"
+        limit_config = self._limits[endpoint_type]
+        return limit_config["requests"], limit_config["window"]
+
+    def available_slots(self, endpoint_type: str = "global") -> int:
+        """Get how many requests can be made right now without waiting."""
+        if endpoint_type not in self._limits:
+            endpoint_type = "global"
+        self.can_make_request(endpoint_type)  # Drops requests outside the window
+        requests, _ = self.get_limit(endpoint_type)
+        used = len(self._requests[endpoint_type]) + self._in_flight[endpoint_type]
+        return max(0, requests - used)
+
+    def get_wait_time_for_slots(
+        self, endpoint_type: str = "global", slots: int = 1
+    ) -> float:
+        """Get time to wait until at least `slots` requests can be made at once."""
+        if endpoint_type not in self._limits:
+            endpoint_type = "global"
+        requests, window = self.get_limit(endpoint_type)
+        slots = min(slots, requests)
+        if self.available_slots(endpoint_type) >= slots:
+            return 0.0
+
+        # The window frees one slot per recorded request, oldest first
+        in_window = sorted(self._requests[endpoint_type])
+        needed = len(in_window) + self._in_flight[endpoint_type] + slots - requests
+        if needed > len(in_window):
+            # Some of the needed slots are held by requests still in flight
+            return IN_FLIGHT_POLL_INTERVAL
+        release = in_window[needed - 1]
+        return max(0.0, release + window - time.time())
+
+    async def acquire(self, endpoint_type: str = "global") -> None:
+        """Wait for a free slot and hold it until release().
+
+        The check and the reservation happen without yielding to the event
+        loop, so concurrent requests from any number of sessions never
+        exceed the window together.
+        """
+        if endpoint_type not in self._limits:
+            endpoint_type = "global"
+        start = time.monotonic()
+        while not self.can_make_request(endpoint_type):
+            wait_time = self.get_wait_time(endpoint_type)
+            logger.info(
+                f"Rate limit reached for {endpoint_type} endpoints. "
+                f"Waiting {wait_time:.2f}s"
+            )
+            await asyncio.sleep(wait_time)
+        self._in_flight[endpoint_type] += 1
+        waited_ms = (time.monotonic() - start) * 1000
+        _metrics.observe("limiter_wait_ms", waited_ms, endpoint_type=endpoint_type)
+
+    def release(self, endpoint_type: str = "global", sent: bool = True) -> None:
+        """Return a slot held by acquire(), recording the request if it was sent."""
+        if endpoint_type not in self._limits:
+            endpoint_type = "global"
+        self._in_flight[endpoint_type] = max(0, self._in_flight[endpoint_type] - 1)
+        if sent:
+            self.record_request(endpoint_type)
+
 
 # Global rate limiter instance
 _rate_limiter = RateLimiter()
@@ -0,0 +1,229 @@
+"""Vectorized profit series rollups and downsampling for 3Commas MCP
+
+This module turns daily profit rows into compact series: weekly or monthly
+rollups and Largest-Triangle-Three-Buckets (LTTB) downsampling, all with
+cumulative profit, so the response size stays constant as the range grows.
+Recorded balance samples are bucketed the same way, keeping last values and
+ranges instead of sums.
+"""
+
+from datetime import date
+from typing import Any, Dict
+
+import numpy as np
+
+# Supported series resolutions
+RESOLUTIONS = ("day", "week", "month")
+
+
+def period_starts(days: np.ndarray, resolution: str) -> np.ndarray:
+    """Map datetime64[D] days to the first day of their week (Monday) or month."""
+    if resolution == "week":
+        # 1970-01-01 was a Thursday, so shift by 3 to align weeks on Monday
+        offsets = ((days.astype(np.int64) + 3) % 7).astype("timedelta64[D]")
+        week_starts: np.ndarray = days - offsets
+        return week_starts
+    if resolution == "month":
+        return days.astype("datetime64[M]").astype("datetime64[D]")
+    return days
+
+
+def rollup(
+    days: np.ndarray, usd: np.ndarray, btc: np.ndarray, resolution: str
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Sum daily profit into periods.
+
+    Returns:
+        (period_start, usd_sum, btc_sum, day_count) arrays ordered by period.
+    """
+    if resolution == "day" or days.size == 0:
+        return days, usd, btc, np.ones(days.size, dtype=np.int64)
+    periods, inverse = np.unique(period_starts(days, resolution), return_inverse=True)
+    return (
+        periods,
+        np.bincount(inverse, weights=usd, minlength=periods.size),
+        np.bincount(inverse, weights=btc, minlength=periods.size),
+        np.bincount(inverse, minlength=periods.size),
+    )
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Select indices with Largest-Triangle-Three-Buckets downsampling.
+
+    The first and last points are always kept. Triangle areas inside each
+    bucket are computed with NumPy; only the loop over buckets is sequential
+    because each choice depends on the previously selected point.
+    """
+    n = x.size
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    every = (n - 2) / (threshold - 2)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    previous = 0
+    for b in range(threshold - 2):
+        start = int(b * every) + 1
+        stop = int((b + 1) * every) + 1
+        next_stop = min(int((b + 2) * every) + 1, n)
+        avg_x = x[stop:next_stop].mean()
+        avg_y = y[stop:next_stop].mean()
+        areas = np.abs(
+            (x[previous] - avg_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (avg_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[b + 1] = previous
+    return selected
+
+
+def summarize_profit_series(
+    rows: list[tuple[date, float, float]],
+    resolution: str = "day",
+    max_points: int | None = None,
+) -> Dict[str, Any]:
+    """Build a compact profit series with cumulative totals.
+
+    Args:
+        rows: (day, usd, btc) tuples ordered by day
+        resolution: "day", "week" or "month" rollup
+        max_points: Optional LTTB cap on the number of returned points
+
+    Returns:
+        Dict with series points, totals and the applied resolution.
+    """
+    if resolution not in RESOLUTIONS:
+        raise ValueError(
+            f"Invalid resolution: {resolution}. Must be one of {', '.join(RESOLUTIONS)}"
+        )
+
+    days = np.array([r[0] for r in rows], dtype="datetime64[D]")
+    usd = np.array([r[1] for r in rows], dtype=np.float64)
+    btc = np.array([r[2] for r in rows], dtype=np.float64)
+
+    periods, usd_sum, btc_sum, counts = rollup(days, usd, btc, resolution)
+    cumulative_usd = np.cumsum(usd_sum)
+    cumulative_btc = np.cumsum(btc_sum)
+
+    keep = np.arange(periods.size)
+    if max_points is not None and periods.size > max_points:
+        keep = lttb_indices(
+            periods.astype(np.int64).astype(np.float64), cumulative_usd, max_points
+        )
+
+    series = [
+        {
+            "t": str(periods[i]),
+            "usd": round(float(usd_sum[i]), 8),
+            "btc": round(float(btc_sum[i]), 8),
+            "cumulative_usd": round(float(cumulative_usd[i]), 8),
+            "cumulative_btc": round(float(cumulative_btc[i]), 8),
+            **({"days": int(counts[i])} if resolution != "day" else {}),
+        }
+        for i in keep
+    ]
+    return {
+        "resolution": resolution,
+        "points": len(series),
+        "source_points": int(periods.size),
+        "downsampled": bool(keep.size < periods.size),
+        "totals": {
+            "usd": round(float(usd.sum()), 8),
+            "btc": round(float(btc.sum()), 8),
+            "active_days": int(np.count_nonzero(usd)),
+        },
+        "series": series,
+    }
+
+
+# Supported balance history resolutions
+BALANCE_RESOLUTIONS = ("sample", "hour", "day")
+_BUCKET_SECONDS = {"hour": 3600, "day": 86400}
+
+
+def summarize_balance_series(
+    timestamps: np.ndarray,
+    values: np.ndarray,
+    fields: tuple[str, ...],
+    resolution: str = "hour",
+    max_points: int | None = None,
+) -> Dict[str, Any]:
+    """Build a compact balance series with per-field ranges.
+
+    Balances are levels, not flows, so buckets report the last value of each
+    field plus the low and high of the first field instead of sums.
+
+    Args:
+        timestamps: Sample times in Unix seconds, ascending
+        values: Sample values of shape (samples, fields)
+        fields: Field names of the value columns
+        resolution: "sample", "hour" or "day" buckets (UTC)
+        max_points: Optional LTTB cap on the number of returned points
+
+    Returns:
+        Dict with series points, per-field first/last/min/max/change and the resolution.
+    """
+    if resolution not in BALANCE_RESOLUTIONS:
+        raise ValueError(
+            f"Invalid resolution: {resolution}. "
+            f"Must be one of {', '.join(BALANCE_RESOLUTIONS)}"
+        )
+    if timestamps.size == 0:
+        return {"resolution": resolution, "points": 0, "samples": 0, "series": []}
+
+    if resolution == "sample":
+        times, last = timestamps, values
+        low = high = values[:, 0]
+    else:
+        buckets = timestamps // _BUCKET_SECONDS[resolution]
+        # Samples are sorted, so each bucket's last sample precedes the next bucket
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        ends = np.r_[starts[1:], timestamps.size] - 1
+        times = buckets[starts] * _BUCKET_SECONDS[resolution]
+        last = values[ends]
+        low = np.minimum.reduceat(values[:, 0], starts)
+        high = np.maximum.reduceat(values[:, 0], starts)
+
+    keep = np.arange(times.size)
+    if max_points is not None and times.size > max_points:
+        keep = lttb_indices(times.astype(np.float64), last[:, 0], max_points)
+
+    def iso(t: int) -> str:
+        return str(np.datetime64(int(t), "s")) + "Z"
+
+    series = [
+        {
+            "t": iso(times[i]),
+            **{name: round(float(last[i, f]), 8) for f, name in enumerate(fields)},
+            **(
+                {
+                    f"{fields[0]}_low": round(float(low[i]), 8),
+                    f"{fields[0]}_high": round(float(high[i]), 8),
+                }
+                if resolution != "sample"
+                else {}
+            ),
+        }
+        for i in keep
+    ]
+    ranges = {
+        name: {
+            "first": round(float(values[0, f]), 8),
+            "last": round(float(values[-1, f]), 8),
+            "min": round(float(values[:, f].min()), 8),
+            "max": round(float(values[:, f].max()), 8),
+            "change": round(float(values[-1, f] - values[0, f]), 8),
+        }
+        for f, name in enumerate(fields)
+    }
+    return {
+        "resolution": resolution,
+        "from": iso(timestamps[0]),
+        "to": iso(timestamps[-1]),
+        "samples": int(timestamps.size),
+        "points": len(series),
+        "downsampled": bool(keep.size < times.size),
+        "ranges": ranges,
+        "series": series,
+    }
@@ -16,6 +16,18 @@ def should_enable_destructive_ops() -> bool:
     return env_value in ("true", "1", "yes", "on")
 
 
+def should_serve_metrics_endpoint() -> bool:
+    """Check if HTTP mode should serve Prometheus metrics at /metrics."""
+    env_value = os.getenv("3COMMAS_METRICS_ENDPOINT", "false").lower().strip()
+    return env_value in ("true", "1", "yes", "on")
+
+
+def should_monitor_event_loop() -> bool:
+    """Check if the event loop lag probe and slow callback timing should run."""
+    env_value = os.getenv("3COMMAS_LOOP_MONITOR", "false").lower().strip()
+    return env_value in ("true", "1", "yes", "on")
+
+
 def get_rate_limits() -> dict[str, dict[str, int]]:
     """Get 3Commas API rate limits configuration based on official limits.
 
@@ -55,6 +67,157 @@ def validate_environment() -> list[str]:
     return missing
 
 
+def get_data_dir() -> str:
+    """Get the directory for local data stores (SQLite databases, snapshots)."""
+    return os.path.expanduser(os.getenv("3COMMAS_DATA_DIR", "~/.cache/threecommas-mcp"))
+
+
+def get_balance_sample_interval() -> float:
+    """Get the balance sampling interval in seconds from environment (0 = off)."""
+    return float(os.getenv("3COMMAS_BALANCE_SAMPLE_INTERVAL", "0"))
+
+
+def get_reference_refresh_interval() -> float:
+    """Get the seconds between reference data refreshes from environment (0 = off)."""
+    return float(os.getenv("3COMMAS_REFERENCE_REFRESH_INTERVAL", "300"))
+
+
+def get_prefetch_interval() -> float:
+    """Get the seconds between prefetch runs from environment (0 = off)."""
+    return float(os.getenv("3COMMAS_PREFETCH_INTERVAL", "0"))
+
+
+def get_http_max_connections() -> int:
+    """Get the connection pool size of the shared HTTP client from environment."""
+    return int(os.getenv("3COMMAS_HTTP_MAX_CONNECTIONS", "20"))
+
+
+def get_fleet_cache_ttl() -> float:
+    """Get the fleet cache lifetime in seconds from environment."""
+    return float(os.getenv("3COMMAS_FLEET_CACHE_TTL", "60"))
+
+
+def get_account_cache_ttl() -> float:
+    """Get the account list cache lifetime in seconds from environment."""
+    return float(os.getenv("3COMMAS_ACCOUNT_CACHE_TTL", "300"))
+
+
+def get_strategy_cache_ttl() -> float:
+    """Get the strategy catalog cache lifetime in seconds from environment."""
+    return float(os.getenv("3COMMAS_STRATEGY_CACHE_TTL", "3600"))
+
+
+def get_blacklist_cache_ttl() -> float:
+    """Get the seconds after which the blacklist is refreshed from environment."""
+    return float(os.getenv("3COMMAS_BLACKLIST_CACHE_TTL", "300"))
+
+
+def get_market_pairs_cache_ttl() -> float:
+    """Get the seconds after which market pair lists are refreshed from environment."""
+    return float(os.getenv("3COMMAS_MARKET_PAIRS_CACHE_TTL", "3600"))
+
+
+def get_full_sync_interval() -> float:
+    """Get the interval in seconds between full bot list syncs from environment."""
+    return float(os.getenv("3COMMAS_BOT_FULL_SYNC_INTERVAL", "3600"))
+
+
+def get_prefetch_top() -> int:
+    """Get how many of the most used requests each run prefetches."""
+    return int(os.getenv("3COMMAS_PREFETCH_TOP", "5"))
+
+
+def get_prefetch_budget() -> float:
+    """Get the share of each rate-limit bucket prefetching may use (0-1)."""
+    return min(1.0, max(0.0, float(os.getenv("3COMMAS_PREFETCH_BUDGET", "0.1"))))
+
+
+def get_prefetch_max_age() -> float:
+    """Get the seconds a prefetched response may be served from environment."""
+    return float(os.getenv("3COMMAS_PREFETCH_MAX_AGE", "60"))
+
+
+def get_offload_threshold() -> int:
+    """Get the response size in bytes from which work is offloaded (0 = never)."""
+    return int(os.getenv("3COMMAS_OFFLOAD_BYTES", str(256 * 1024)))
+
+
+def get_offload_pool() -> str:
+    """Get the worker pool type ("thread" or "process") from environment."""
+    return os.getenv("3COMMAS_OFFLOAD_POOL", "thread").lower().strip()
+
+
+def get_offload_workers() -> int:
+    """Get the number of workers in the offload pool from environment."""
+    return int(os.getenv("3COMMAS_OFFLOAD_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+
+def get_loop_lag_interval() -> float:
+    """Get the seconds between event loop lag probes from environment (0 = off)."""
+    return float(os.getenv("3COMMAS_LOOP_LAG_INTERVAL", "0.5"))
+
+
+def get_slow_callback_threshold() -> float:
+    """Get the milliseconds from which a callback counts as slow (0 = off)."""
+    return float(os.getenv("3COMMAS_SLOW_CALLBACK_MS", "100"))
+
+
+def get_profile_rate() -> float:
+    """Get the percentage of tool calls to profile from environment (0 = off)."""
+    return min(100.0, max(0.0, float(os.getenv("3COMMAS_PROFILE_RATE", "0"))))
+
+
+def get_profiler_type() -> str:
+    """Get the profiler ("cprofile" or "sampling") from environment."""
+    return os.getenv("3COMMAS_PROFILER", "cprofile").lower().strip()
+
+
+def get_profile_dir() -> str:
+    """Get the directory for aggregated profile stats from environment."""
+    return os.path.expanduser(
+        os.getenv("3COMMAS_PROFILE_DIR", os.path.join(get_data_dir(), "profiles"))
+    )
+
+
+def get_trace_sinks() -> set[str]:
+    """Get the enabled trace sinks ("jsonl", "otel") from environment."""
+    value = os.getenv("3COMMAS_TRACE", "")
+    return {sink.strip().lower() for sink in value.split(",") if sink.strip()}
+
+
+def get_trace_file() -> str:
+    """Get the JSONL trace file path from environment."""
+    return os.path.expanduser(
+        os.getenv("3COMMAS_TRACE_FILE", os.path.join(get_data_dir(), "traces.jsonl"))
+    )
+
+
+def should_send_session_diffs() -> bool:
+    """Check if unchanged markers and patches are enabled via environment."""
+    env_value = os.getenv("3COMMAS_SESSION_DIFFS", "false").lower().strip()
+    return env_value in ("true", "1", "yes", "on")
+
+
+def get_session_diff_ttl() -> float:
+    """Get the seconds a remembered payload can serve as a base from environment."""
+    return float(os.getenv("3COMMAS_SESSION_DIFF_TTL", "600"))
+
+
+def get_server_transport() -> str:
+    """Get the MCP transport to serve (stdio, http or sse) from environment."""
+    return os.getenv("3COMMAS_MCP_TRANSPORT", "stdio").lower().strip()
+
+
+def get_server_host() -> str:
+    """Get the interface the HTTP and SSE transports listen on."""
+    return os.getenv("3COMMAS_MCP_HOST", "127.0.0.1")
+
+
+def get_server_port() -> int:
+    """Get the port the HTTP and SSE transports listen on."""
+    return int(os.getenv("3COMMAS_MCP_PORT", "8000"))
+
+
 def get_api_base_url() -> str:
     """Get 3Commas API base URL."""
     return os.getenv("3COMMAS_API_BASE_URL", "https://api.3commas.io/public/api")
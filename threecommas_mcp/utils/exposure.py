@@ -0,0 +1,228 @@
+"""Coin and quote exposure engine for 3Commas MCP
+
+This module folds active deals into a sparse pair x account matrix (COO
+layout: one entry per pair/account combination that actually has deals) of
+bought volume, bought amount and unrealized profit. Exposure by pair, base
+coin, quote currency or account and concentration metrics are derived from
+that matrix with NumPy grouping, without touching the raw deals again.
+
+Bought volume is denominated in each pair's quote currency, so rankings and
+concentration shares are computed within a quote currency.
+"""
+
+from typing import Any, Dict, NamedTuple
+
+import numpy as np
+
+from .portfolio import to_float
+
+# Dimensions exposure can be grouped by
+EXPOSURE_DIMENSIONS = ("pair", "base", "quote", "account")
+
+
+class ExposureMatrix(NamedTuple):
+    """Sparse pair x account exposure matrix in coordinate (COO) form."""
+
+    pairs: np.ndarray
+    accounts: np.ndarray
+    row: np.ndarray
+    col: np.ndarray
+    deals: np.ndarray
+    bought_volume: np.ndarray
+    bought_amount: np.ndarray
+    unrealized_profit: np.ndarray
+    unrealized_usd: np.ndarray
+
+
+def _split_pair(pair: str) -> tuple[str, str]:
+    """Split a ver1 QUOTE_BASE pair into (quote, base)."""
+    quote, _, base = pair.partition("_")
+    return (quote, base) if base else ("unknown", pair)
+
+
+def _deal_pair(deal: Dict[str, Any]) -> str:
+    """Get a deal's pair in QUOTE_BASE format."""
+    pair = deal.get("pair")
+    if isinstance(pair, str) and "_" in pair:
+        return pair
+    quote, base = deal.get("from_currency"), deal.get("to_currency")
+    return f"{quote}_{base}" if quote and base else "unknown"
+
+
+def build_exposure_matrix(deals: list[Dict[str, Any]]) -> ExposureMatrix:
+    """Fold active deals into a sparse pair x account matrix.
+
+    Args:
+        deals: Raw active deal dicts (with account_id/account_name)
+
+    Returns:
+        ExposureMatrix with one entry per non-empty (pair, account) cell.
+    """
+    pair_labels = np.array([_deal_pair(d) for d in deals], dtype=object).astype(str)
+    account_labels = np.array(
+        [str(d.get("account_name") or d.get("account_id") or "unknown") for d in deals],
+        dtype=object,
+    ).astype(str)
+
+    pairs, pair_index = np.unique(pair_labels, return_inverse=True)
+    accounts, account_index = np.unique(account_labels, return_inverse=True)
+    cells, cell_index = np.unique(
+        pair_index.astype(np.int64) * max(accounts.size, 1) + account_index,
+        return_inverse=True,
+    )
+
+    def cell_sum(name: str) -> np.ndarray:
+        values = np.array([to_float(d.get(name)) for d in deals], dtype=np.float64)
+        return np.bincount(cell_index, weights=values, minlength=cells.size)
+
+    return ExposureMatrix(
+        pairs=pairs,
+        accounts=accounts,
+        row=cells // max(accounts.size, 1),
+        col=cells % max(accounts.size, 1),
+        deals=np.bincount(cell_index, minlength=cells.size),
+        bought_volume=cell_sum("bought_volume"),
+        bought_amount=cell_sum("bought_amount"),
+        unrealized_profit=cell_sum("actual_profit"),
+        unrealized_usd=cell_sum("actual_usd_profit"),
+    )
+
+
+def _hhi(shares: np.ndarray) -> float:
+    """Herfindahl-Hirschman index of shares (1.0 = fully concentrated)."""
+    return round(float(np.square(shares).sum()), 6)
+
+
+def exposure_report(
+    matrix: ExposureMatrix,
+    group_by: str = "base",
+    top_n: int = 10,
+    quote: str | None = None,
+) -> Dict[str, Any]:
+    """Rank exposure groups and measure concentration per quote currency.
+
+    Args:
+        matrix: Exposure matrix from build_exposure_matrix
+        group_by: "pair", "base", "quote" or "account"
+        top_n: Number of groups to return per quote currency
+        quote: Only report this quote currency
+
+    Returns:
+        Per quote currency: totals, top-N groups by bought volume with shares,
+        and concentration (top share, HHI) by group, pair and account.
+    """
+    if group_by not in EXPOSURE_DIMENSIONS:
+        raise ValueError(
+            f"Invalid group_by: {group_by}. "
+            f"Must be one of {', '.join(EXPOSURE_DIMENSIONS)}"
+        )
+
+    split = [_split_pair(p) for p in matrix.pairs.tolist()]
+    pair_quote = np.array([q for q, _ in split], dtype=object).astype(str)
+    pair_base = np.array([b for _, b in split], dtype=object).astype(str)
+    entry_quote = pair_quote[matrix.row]
+    labels = {
+        "pair": matrix.pairs[matrix.row],
+        "base": pair_base[matrix.row],
+        "quote": entry_quote,
+        "account": matrix.accounts[matrix.col],
+    }[group_by]
+
+    quotes = np.unique(entry_quote)
+    if quote is not None:
+        quotes = quotes[quotes == quote]
+
+    report = []
+    for q in quotes.tolist():
+        in_quote = entry_quote == q
+        volume = matrix.bought_volume[in_quote]
+        total_volume = float(volume.sum())
+
+        groups, inverse = np.unique(labels[in_quote], return_inverse=True)
+        sums = {
+            name: np.bincount(
+                inverse, weights=getattr(matrix, name)[in_quote], minlength=groups.size
+            )
+            for name in (
+                "deals",
+                "bought_volume",
+                "bought_amount",
+                "unrealized_profit",
+                "unrealized_usd",
+            )
+        }
+        shares = (
+            sums["bought_volume"] / total_volume
+            if total_volume > 0
+            else np.zeros(groups.size)
+        )
+        order = np.argsort(-sums["bought_volume"], kind="stable")[:top_n]
+
+        pair_volume = np.bincount(
+            matrix.row[in_quote], weights=volume, minlength=matrix.pairs.size
+        )
+        account_volume = np.bincount(
+            matrix.col[in_quote], weights=volume, minlength=matrix.accounts.size
+        )
+        concentration = {}
+        for name, per_key in (("pair", pair_volume), ("account", account_volume)):
+            key_shares = (
+                per_key / total_volume if total_volume > 0 else np.zeros_like(per_key)
+            )
+            concentration[name] = {
+                "count": int(np.count_nonzero(per_key)),
+                "top_share": round(float(key_shares.max(initial=0.0)), 6),
+                "hhi": _hhi(key_shares),
+            }
+        if group_by not in concentration:
+            concentration[group_by] = {
+                "count": int(groups.size),
+                "top_share": round(float(shares.max(initial=0.0)), 6),
+                "hhi": _hhi(shares),
+            }
+
+        report.append(
+            {
+                "quote": q,
+                "deals": int(matrix.deals[in_quote].sum()),
+                "bought_volume": round(total_volume, 8),
+                "unrealized_profit": round(
+                    float(matrix.unrealized_profit[in_quote].sum()), 8
+                ),
+                "unrealized_usd": round(
+                    float(matrix.unrealized_usd[in_quote].sum()), 8
+                ),
+                "concentration": concentration,
+                "top": [
+                    {
+                        group_by: str(groups[g]),
+                        "deals": int(sums["deals"][g]),
+                        "bought_volume": round(float(sums["bought_volume"][g]), 8),
+                        # Base amounts only add up within a single base coin
+                        **(
+                            {"bought_amount": round(float(sums["bought_amount"][g]), 8)}
+                            if group_by in ("pair", "base")
+                            else {}
+                        ),
+                        "unrealized_profit": round(
+                            float(sums["unrealized_profit"][g]), 8
+                        ),
+                        "unrealized_usd": round(float(sums["unrealized_usd"][g]), 8),
+                        "share": round(float(shares[g]), 6),
+                    }
+                    for g in order.tolist()
+                ],
+            }
+        )
+
+    return {
+        "group_by": group_by,
+        "deals": int(matrix.deals.sum()),
+        "matrix": {
+            "pairs": int(matrix.pairs.size),
+            "accounts": int(matrix.accounts.size),
+            "non_empty_cells": int(matrix.row.size),
+        },
+        "unrealized_usd": round(float(matrix.unrealized_usd.sum()), 8),
+        "by_quote": report,
+    }
@@ -0,0 +1,201 @@
+"""Per-session response fingerprints for 3Commas MCP
+
+Clients often poll the same tool (bot details, account info) and receive an
+identical multi-kilobyte payload each time. This module remembers, per MCP
+session, the last payload each tool call returned. A repeated call then gets
+a small "unchanged" marker when nothing changed, or a JSON-patch style list
+of operations (RFC 6902 add/remove/replace with JSON pointer paths) when the
+patch is much smaller than the payload itself.
+
+This is opt-in (3COMMAS_SESSION_DIFFS=true): a stdio server cannot tell a
+new conversation from the old one, and a client that no longer holds the
+earlier payload cannot use a marker or patch against it. Remembered
+payloads expire after 3COMMAS_SESSION_DIFF_TTL seconds, after which the
+full payload is returned again.
+"""
+
+import hashlib
+import inspect
+import json
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, NamedTuple
+
+from .env import should_send_session_diffs, get_session_diff_ttl
+from .metrics import _metrics
+
+# Sessions and calls per session remembered (least recently used are dropped)
+MAX_SESSIONS = 64
+MAX_CALLS_PER_SESSION = 128
+
+# A patch is only sent if it is smaller than this fraction of the full payload
+PATCH_RATIO = 0.5
+
+# Session id shared by all calls of a single-client (stdio) server process
+LOCAL_SESSION = "local"
+
+
+def _canonical(payload: Any) -> str:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def fingerprint(payload: Any) -> str:
+    """Stable hash of a JSON-compatible payload."""
+    return hashlib.blake2b(
+        _canonical(payload).encode("utf-8"), digest_size=8
+    ).hexdigest()
+
+
+def _pointer(path: str, token: Any) -> str:
+    """Append a token to a JSON pointer, escaping "~" and "/"."""
+    return f"{path}/{str(token).replace('~', '~0').replace('/', '~1')}"
+
+
+def json_patch(old: Any, new: Any, path: str = "") -> list[Dict[str, Any]]:
+    """JSON-patch operations turning old into new.
+
+    Dicts are diffed by key and lists element by element, with trailing
+    elements added or removed; anything else that differs is replaced.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: list[Dict[str, Any]] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": _pointer(path, key)})
+        for key, value in new.items():
+            if key not in old:
+                ops.append({"op": "add", "path": _pointer(path, key), "value": value})
+            elif old[key] != value:
+                ops.extend(json_patch(old[key], value, _pointer(path, key)))
+        return ops
+    if isinstance(old, list) and isinstance(new, list):
+        ops = []
+        for index, (before, after) in enumerate(zip(old, new)):
+            if before != after:
+                ops.extend(json_patch(before, after, _pointer(path, index)))
+        # Remove from the end so earlier indexes stay valid while applying
+        for index in range(len(old) - 1, len(new) - 1, -1):
+            ops.append({"op": "remove", "path": _pointer(path, index)})
+        for value in new[len(old) :]:
+            ops.append({"op": "add", "path": _pointer(path, "-"), "value": value})
+        return ops
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+class _Received(NamedTuple):
+    """A payload a session has already received."""
+
+    fingerprint: str
+    payload: Dict[str, Any]
+    received_at: float
+
+
+class SessionResponses:
+    """Last payload per tool call, kept separately for each MCP session."""
+
+    def __init__(self) -> None:
+        self._sessions: OrderedDict[str, OrderedDict[str, _Received]] = OrderedDict()
+
+    def respond(
+        self, session_id: str, call_key: str, payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Remember a payload and return what the session should receive.
+
+        Returns:
+            An "unchanged" marker, a patch against the previous payload, or
+            the payload itself for first calls and large changes.
+        """
+        calls = self._sessions.setdefault(session_id, OrderedDict())
+        self._sessions.move_to_end(session_id)
+        while len(self._sessions) > MAX_SESSIONS:
+            self._sessions.popitem(last=False)
+
+        digest = fingerprint(payload)
+        now = time.time()
+        previous = calls.pop(call_key, None)
+        calls[call_key] = _Received(digest, payload, now)
+        while len(calls) > MAX_CALLS_PER_SESSION:
+            calls.popitem(last=False)
+
+        # A hit is a response the session gets as a marker or patch; an
+        # expired base may no longer be in the client's context
+        if previous is None or now - previous.received_at > get_session_diff_ttl():
+            _metrics.cache_lookup("session_responses", False)
+            return payload
+        age = round(now - previous.received_at, 1)
+        if previous.fingerprint == digest:
+            _metrics.cache_lookup("session_responses", True)
+            return {
+                "unchanged": True,
+                "fingerprint": digest,
+                "seconds_since_previous": age,
+            }
+        patch = json_patch(previous.payload, payload)
+        if len(_canonical(patch)) >= PATCH_RATIO * len(_canonical(payload)):
+            _metrics.cache_lookup("session_responses", False)
+            return payload
+        _metrics.cache_lookup("session_responses", True)
+        return {
+            "unchanged": False,
+            "fingerprint": digest,
+            "base_fingerprint": previous.fingerprint,
+            "seconds_since_previous": age,
+            "patch": patch,
+        }
+
+    def forget(self, session_id: str) -> int:
+        """Drop everything a session has received; returns the number of calls."""
+        return len(self._sessions.pop(session_id, {}))
+
+
+def current_session_id() -> str | None:
+    """Id of the MCP session of the running tool call, if there is one.
+
+    A stdio server process serves a single client, so all stdio calls share
+    one local session. HTTP and SSE sessions are told apart by the session id
+    the transport negotiated (mcp-session-id header or SSE session_id query
+    parameter); sessionless HTTP requests have no stable id and get None, so
+    one client never receives a marker against another client's payload.
+    """
+    try:
+        from fastmcp.server.dependencies import get_context
+
+        request_context = get_context().request_context
+    except RuntimeError:
+        return None
+    if request_context is None or request_context.request is None:
+        return LOCAL_SESSION
+    request = request_context.request
+    return request.headers.get("mcp-session-id") or request.query_params.get(
+        "session_id"
+    )
+
+
+def dedupe_session_responses(
+    func: Callable[..., Awaitable[Dict[str, Any]]],
+) -> Callable[..., Awaitable[Dict[str, Any]]]:
+    """Decorator returning unchanged markers or patches for repeated tool calls.
+
+    Calls are matched by tool name and bound arguments. Errors, calls outside
+    an MCP session and calls without 3COMMAS_SESSION_DIFFS=true pass results
+    through as-is.
+    """
+    signature = inspect.signature(func)
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs) -> Dict[str, Any]:
+        result = await func(*args, **kwargs)
+        session_id = current_session_id()
+        if session_id is None or "error" in result or not should_send_session_diffs():
+            return result
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        call_key = f"{func.__name__}:{_canonical(bound.arguments)}"
+        return _session_responses.respond(session_id, call_key, result)
+
+    return wrapper
+
+
+# Global per-session response memory used by tools with repeated polling
+_session_responses = SessionResponses()
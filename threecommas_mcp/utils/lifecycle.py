@@ -0,0 +1,29 @@
+"""Shutdown hooks for 3Commas MCP
+
+Background tasks and pooled clients are created lazily, on first use, so the
+server does not import them at startup. Each registers its cleanup here when
+it starts, and the server lifespan runs the registered hooks on shutdown.
+"""
+
+import logging
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+_shutdown_hooks: list[Callable[[], Awaitable[None]]] = []
+
+
+def on_shutdown(hook: Callable[[], Awaitable[None]]) -> None:
+    """Run hook when the server shuts down (registering twice is a no-op)."""
+    if hook not in _shutdown_hooks:
+        _shutdown_hooks.append(hook)
+
+
+async def run_shutdown_hooks() -> None:
+    """Run registered hooks, most recently registered first."""
+    while _shutdown_hooks:
+        hook = _shutdown_hooks.pop()
+        try:
+            await hook()
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"Shutdown hook {hook!r} failed: {e}")
@@ -0,0 +1,146 @@
+"""Event loop health monitoring for 3Commas MCP
+
+Every tool call runs on one asyncio event loop, so synchronous CPU work in
+any of them (filtering a large response, decoding JSON, signing) delays all
+other calls in flight. With 3COMMAS_LOOP_MONITOR on, the monitor measures
+this in two ways while the server runs and records into the metrics
+registry:
+
+- Scheduling lag: a task asks to wake every 3COMMAS_LOOP_LAG_INTERVAL
+  seconds and records how late it actually wakes (event_loop_lag_ms).
+- Slow callbacks: each callback the loop runs is timed, and one taking at
+  least 3COMMAS_SLOW_CALLBACK_MS is counted (slow_callbacks_total,
+  slow_callback_ms) under the tool and API path it ran for, logged, and
+  kept among the most recent slow callbacks.
+
+Callbacks are timed by replacing asyncio.Handle._run, which the standard
+event loop calls for every callback. This is a process-wide patch: every
+event loop in the process, including ones started by libraries or tests,
+runs its callbacks through the wrapper until the monitor stops and restores
+the original. Alternative loops such as uvloop only get the lag measurement.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from collections import deque
+from typing import Any, Callable, Dict
+
+from .lifecycle import on_shutdown
+from .metrics import _metrics, current_endpoint, current_tool
+
+logger = logging.getLogger(__name__)
+
+# Recent slow callbacks kept for get_server_metrics
+RECENT_SLOW_CALLBACKS = 20
+
+
+def _endpoint_label(path: str | None) -> str:
+    # Numeric IDs would make a label value per bot or deal
+    return re.sub(r"/\d+(?=/|$)", "/{id}", path.lstrip("/")) if path else "none"
+
+
+def _describe(handle: asyncio.Handle) -> str:
+    """Name the coroutine a task step resumed, or the plain callback."""
+    task = getattr(getattr(handle, "_callback", None), "__self__", None)
+    if isinstance(task, asyncio.Task):
+        coro = task.get_coro()
+        name = getattr(coro, "__qualname__", None) or repr(coro)
+        return f"{task.get_name()} ({name})"
+    return repr(handle)[:200]
+
+
+class LoopMonitor:
+    """Measures event loop lag and reports callbacks that block the loop."""
+
+    def __init__(self) -> None:
+        self._task: asyncio.Task[None] | None = None
+        self._original_run: Callable[[asyncio.Handle], None] | None = None
+        self.threshold_ms = 0.0
+        self.recent: deque[Dict[str, Any]] = deque(maxlen=RECENT_SLOW_CALLBACKS)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None or self._original_run is not None
+
+    async def _probe(self, interval: float) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + interval
+            await asyncio.sleep(interval)
+            _metrics.observe("event_loop_lag_ms", (loop.time() - expected) * 1000)
+
+    def _slow_callback(
+        self, handle: asyncio.Handle, elapsed_ms: float, tool: Any, endpoint: Any
+    ) -> None:
+        tool = tool or "none"
+        endpoint = _endpoint_label(endpoint)
+        _metrics.inc("slow_callbacks_total", tool=tool, endpoint=endpoint)
+        _metrics.observe("slow_callback_ms", elapsed_ms, tool=tool, endpoint=endpoint)
+        callback = _describe(handle)
+        self.recent.append(
+            {
+                "at": round(time.time(), 3),
+                "duration_ms": round(elapsed_ms, 3),
+                "tool": tool,
+                "endpoint": endpoint,
+                "callback": callback,
+            }
+        )
+        logger.warning(
+            f"Event loop blocked for {elapsed_ms:.0f} ms by {callback} "
+            f"(tool: {tool}, endpoint: {endpoint})"
+        )
+
+    def _install(self) -> None:
+        original = self._original_run = asyncio.Handle._run
+        threshold = self.threshold_ms / 1000
+        monitor = self
+
+        def timed_run(handle: asyncio.Handle) -> None:
+            # Read before running: the call may reset them before returning
+            context = handle._context  # type: ignore[attr-defined]
+            tool = context.get(current_tool)
+            endpoint = context.get(current_endpoint)
+            start = time.perf_counter()
+            original(handle)
+            elapsed = time.perf_counter() - start
+            if elapsed >= threshold:
+                monitor._slow_callback(
+                    handle,
+                    elapsed * 1000,
+                    tool or context.get(current_tool),
+                    endpoint or context.get(current_endpoint),
+                )
+
+        asyncio.Handle._run = timed_run  # type: ignore[method-assign,assignment]
+
+    def start(self, lag_interval: float, threshold_ms: float) -> None:
+        """Start the lag probe and slow callback timing (each off at 0)."""
+        if self.running:
+            return
+        if lag_interval > 0:
+            self._task = asyncio.create_task(self._probe(lag_interval))
+        if threshold_ms > 0:
+            self.threshold_ms = threshold_ms
+            self._install()
+        if self.running:
+            on_shutdown(self.stop)
+
+    async def stop(self) -> None:
+        """Cancel the lag probe and stop timing callbacks."""
+        if self._original_run is not None:
+            asyncio.Handle._run = self._original_run  # type: ignore[method-assign,assignment]
+            self._original_run = None
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Global event loop monitor started with the server
+_loop_monitor = LoopMonitor()
@@ -0,0 +1,209 @@
+"""In-process metrics for 3Commas MCP
+
+A small registry of counters and latency/size histograms, labelled by tool,
+endpoint type or cache. The API client, rate limiter, caches and the tool
+middleware record into the global registry; the get_server_metrics tool and
+the optional Prometheus endpoint read it.
+
+Histograms use HDR-style log-linear buckets: values are exact below
+SUB_BUCKETS units and otherwise fall into one of SUB_BUCKETS buckets per
+power of two, so percentiles stay within about 3% of the recorded values at
+any magnitude while memory stays bounded.
+"""
+
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict
+
+# Buckets per power of two (relative precision 1/SUB_BUCKETS)
+SUB_BUCKETS = 32
+
+# Recorded units per metric unit, by the metric name's suffix: "_ms"
+# histograms keep microsecond resolution, others count whole units
+_SCALES = {"ms": 1000}
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class Histogram:
+    """Log-linear histogram of non-negative values."""
+
+    def __init__(self, scale: int = 1) -> None:
+        self._scale = scale
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @staticmethod
+    def _index(units: int) -> int:
+        if units < SUB_BUCKETS:
+            return units
+        shift = units.bit_length() - SUB_BUCKETS.bit_length()
+        return SUB_BUCKETS * (shift + 1) + (units >> shift) - SUB_BUCKETS
+
+    @staticmethod
+    def _upper(index: int) -> int:
+        """Highest value (in units) falling into a bucket."""
+        if index < SUB_BUCKETS:
+            return index
+        shift = index // SUB_BUCKETS - 1
+        top = index % SUB_BUCKETS + SUB_BUCKETS
+        return ((top + 1) << shift) - 1
+
+    def record(self, value: float) -> None:
+        value = max(0.0, value)
+        index = self._index(int(value * self._scale))
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, q: float) -> float:
+        """Value at or below which q percent of recorded values fall."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, round(self.count * q / 100))
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return min(self._upper(index) / self._scale, self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 3) if self.count else 0.0,
+            "p50": round(self.percentile(50), 3),
+            "p90": round(self.percentile(90), 3),
+            "p99": round(self.percentile(99), 3),
+            "max": round(self.max, 3),
+            "sum": round(self.total, 3),
+        }
+
+
+def _labels(labels: Dict[str, Any]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    """Counters and histograms keyed by metric name and labels."""
+
+    def __init__(self) -> None:
+        self._counters: Dict[tuple[str, Labels], float] = {}
+        self._histograms: Dict[tuple[str, Labels], Histogram] = {}
+        # Metrics may be recorded from worker threads
+        self._lock = threading.Lock()
+        self.started = time.time()
+
+    def inc(self, name: str, value: float = 1, **labels: Any) -> None:
+        """Add to a counter."""
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """Record a value in a histogram."""
+        key = (name, _labels(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                scale = _SCALES.get(name.rsplit("_", 1)[-1], 1)
+                histogram = self._histograms[key] = Histogram(scale)
+            histogram.record(value)
+
+    def cache_lookup(self, cache: str, hit: bool) -> None:
+        """Count a cache hit or miss."""
+        self.inc("cache_hits_total" if hit else "cache_misses_total", cache=cache)
+
+    def group(self, label: str) -> Dict[str, Dict[str, Any]]:
+        """Metrics carrying a label, grouped by its value.
+
+        Counters appear as numbers and histograms as summaries, keyed by
+        metric name; counters with further labels are summed over them.
+        """
+        grouped: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for (name, labels), value in self._counters.items():
+                label_value = dict(labels).get(label)
+                if label_value is not None:
+                    metrics = grouped.setdefault(label_value, {})
+                    metrics[name] = metrics.get(name, 0) + value
+            for (name, labels), histogram in self._histograms.items():
+                label_value = dict(labels).get(label)
+                if label_value is not None:
+                    grouped.setdefault(label_value, {})[name] = histogram.summary()
+        return grouped
+
+    def summary(self, name: str) -> Dict[str, float] | None:
+        """Summary of an unlabelled histogram, or None if nothing was recorded."""
+        with self._lock:
+            histogram = self._histograms.get((name, ()))
+            return histogram.summary() if histogram is not None else None
+
+    def counter(self, name: str) -> float:
+        """Total of a counter over all labels."""
+        with self._lock:
+            return sum(v for (n, _), v in self._counters.items() if n == name)
+
+    def prometheus(self, prefix: str = "threecommas_mcp") -> str:
+        """All metrics in the Prometheus text exposition format.
+
+        Histograms are exposed as summaries (quantiles, _sum and _count).
+        """
+
+        def series(name: str, labels: Labels, extra: Labels = ()) -> str:
+            pairs = labels + extra
+            if not pairs:
+                return name
+            body = ",".join(f'{key}="{_escape(value)}"' for key, value in pairs)
+            return f"{name}{{{body}}}"
+
+        lines: list[str] = []
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items(), key=lambda item: item[0])
+            typed: set[str] = set()
+            for (name, labels), value in counters:
+                metric = f"{prefix}_{name}"
+                if metric not in typed:
+                    lines.append(f"# TYPE {metric} counter")
+                    typed.add(metric)
+                lines.append(f"{series(metric, labels)} {value:g}")
+            for (name, labels), histogram in histograms:
+                metric = f"{prefix}_{name}"
+                if metric not in typed:
+                    lines.append(f"# TYPE {metric} summary")
+                    typed.add(metric)
+                for q in (0.5, 0.9, 0.99):
+                    quantile = histogram.percentile(q * 100)
+                    line = series(metric, labels, (("quantile", str(q)),))
+                    lines.append(f"{line} {quantile:g}")
+                lines.append(f"{series(metric + '_sum', labels)} {histogram.total:g}")
+                lines.append(f"{series(metric + '_count', labels)} {histogram.count}")
+        uptime = f"{prefix}_uptime_seconds"
+        lines += [f"# TYPE {uptime} gauge", f"{uptime} {time.time() - self.started:g}"]
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drop all recorded metrics."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self.started = time.time()
+
+
+# Tool whose call is being handled, for attributing API traffic to tools
+current_tool: ContextVar[str | None] = ContextVar("current_tool", default=None)
+
+# API path last requested by the current call, for attributing loop stalls
+current_endpoint: ContextVar[str | None] = ContextVar("current_endpoint", default=None)
+
+# Global metrics registry shared by the whole server
+_metrics = MetricsRegistry()
@@ -0,0 +1,168 @@
+"""Size-adaptive execution of response decoding and filtering for 3Commas MCP
+
+Decoding a large API response (market_pairs runs to megabytes) and passing
+it through filter_response takes long enough to stall every other call on
+the event loop. Responses of at least 3COMMAS_OFFLOAD_BYTES are therefore
+decoded and filtered in a worker pool; smaller ones stay on the loop, where
+the hop to a worker would cost more than it saves.
+
+3COMMAS_OFFLOAD_POOL selects the pool:
+
+- thread (default): nothing is copied. The work still holds the GIL, but
+  the interpreter switches back to the loop every few milliseconds, so
+  other calls see short delays instead of the whole decode.
+- process: runs in parallel on other cores. Only the raw body and the
+  result cross processes: a response is decoded again in the worker for
+  filtering instead of being pickled there.
+
+Decoded responses carry their raw body (DecodedResponse), so the filter
+step follows the same policy for copies of a response too. Copies (results
+shared by request coalescing, prefetched responses) are made with
+copy_response, which decodes large bodies again in the pool rather than
+deep-copying them on the loop.
+"""
+
+import asyncio
+import contextvars
+import copy
+import functools
+import json
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, TypeVar
+
+import httpx
+
+from .env import get_offload_threshold, get_offload_pool, get_offload_workers
+from .lifecycle import on_shutdown
+from .metrics import _metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _init_process_worker() -> None:
+    # Spans from worker processes would be written as separate traces
+    os.environ["3COMMAS_TRACE"] = ""
+
+
+def decode_response(content: bytes) -> Dict[str, Any]:
+    """Decode a JSON body; other values than objects come back as {"data": ...}."""
+    data = json.loads(content)
+    return data if isinstance(data, dict) else {"data": data}
+
+
+class DecodedResponse(Dict[str, Any]):
+    """A decoded API response that keeps the body it was decoded from.
+
+    The body is an attribute rather than a key, so it never reaches tool
+    output, and deep copies keep it (bytes are copied by reference).
+    """
+
+    body: bytes = b""
+
+
+class ExecutionPolicy:
+    """Runs CPU-heavy steps inline or in a worker pool by payload size."""
+
+    def __init__(self) -> None:
+        self._configured = False
+        self.threshold = 0
+        self.pool = "thread"
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+
+    def configure(self) -> None:
+        """Read the threshold and pool type from environment (done on first use)."""
+        self.threshold = get_offload_threshold()
+        self.pool = get_offload_pool()
+        if self.pool not in ("thread", "process"):
+            logger.warning(f"Unknown 3COMMAS_OFFLOAD_POOL {self.pool!r}, using thread")
+            self.pool = "thread"
+        self._configured = True
+
+    def offloads(self, size: int) -> bool:
+        """Whether work on a payload of this many bytes goes to the pool."""
+        if not self._configured:
+            self.configure()
+        return 0 < self.threshold <= size
+
+    def _start(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                workers = get_offload_workers()
+                if self.pool == "process":
+                    executor: Executor = ProcessPoolExecutor(
+                        workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_init_process_worker,
+                    )
+                    # Workers spawn on the first submit; wait for them here
+                    executor.submit(os.getpid).result()
+                else:
+                    executor = ThreadPoolExecutor(
+                        workers, thread_name_prefix="threecommas-offload"
+                    )
+                self._executor = executor
+                on_shutdown(self.shutdown)
+            return self._executor
+
+    async def run(
+        self, size: int, operation: str, func: Callable[..., T], *args: Any
+    ) -> T:
+        """Call func(*args) on the loop, or in the pool for large payloads."""
+        if not self.offloads(size):
+            return func(*args)
+        _metrics.inc("offloaded_total", operation=operation, pool=self.pool)
+        executor = self._executor
+        if executor is None:
+            # Spawning worker processes takes a while; keep it off the loop
+            executor = await asyncio.to_thread(self._start)
+        loop = asyncio.get_running_loop()
+        if self.pool == "process":
+            call = functools.partial(func, *args)
+        else:
+            # Keep tracing spans nested under the calling tool
+            call = functools.partial(contextvars.copy_context().run, func, *args)
+        return await loop.run_in_executor(executor, call)
+
+    async def decode(self, response: httpx.Response) -> Dict[str, Any]:
+        """Decode a JSON response body (see decode_response)."""
+        content = response.content
+        if self.offloads(len(content)):
+            data = await self.run(len(content), "decode", decode_response, content)
+        else:
+            data = decode_response(content)
+        decoded = DecodedResponse(data)
+        decoded.body = content
+        return decoded
+
+    async def copy_response(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Deep copy of a decoded response; large ones are decoded again instead."""
+        body = response_body(data)
+        if body is None or not self.offloads(len(body)):
+            return copy.deepcopy(data)
+        decoded = DecodedResponse(
+            await self.run(len(body), "copy", decode_response, body)
+        )
+        decoded.body = body
+        return decoded
+
+    async def shutdown(self) -> None:
+        """Stop the worker pool (called on server shutdown)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+def response_body(data: Dict[str, Any]) -> bytes | None:
+    """Raw body an API response (or a copy of one) was decoded from."""
+    return data.body if isinstance(data, DecodedResponse) else None
+
+
+# Global execution policy used by the API client and response filters
+_execution_policy = ExecutionPolicy()
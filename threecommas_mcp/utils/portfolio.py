@@ -0,0 +1,144 @@
+"""Vectorized portfolio aggregation for 3Commas MCP
+
+This module loads numeric DCA bot fields into NumPy arrays and computes
+grouped aggregates (by account, strategy, quote currency) in a single pass
+per group instead of summing bot by bot.
+"""
+
+import math
+from typing import Any, Dict
+
+import numpy as np
+
+# Numeric bot-level metrics summed per group
+BOT_METRICS = (
+    "finished_deals_profit_usd",
+    "finished_deals_count",
+    "active_deals_count",
+    "active_deals_usd_profit",
+    "bought_volume",
+    "enabled_bots",
+)
+
+# Grouping dimensions supported by group_aggregates
+GROUP_KEYS = ("account", "strategy", "quote")
+
+# Metrics that are counts and should be reported as integers
+COUNT_METRICS = {"finished_deals_count", "active_deals_count", "enabled_bots"}
+
+
+def to_float(value: Any) -> float:
+    """Convert an API numeric value (often a string) to float, NaN-safe."""
+    try:
+        result = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return result if math.isfinite(result) else 0.0
+
+
+def bot_quote(bot: Dict[str, Any]) -> str:
+    """Get the quote currency of a bot from its pairs (ver1 QUOTE_BASE format)."""
+    pairs = bot.get("pairs") or []
+    if pairs and isinstance(pairs[0], str) and "_" in pairs[0]:
+        return pairs[0].split("_", 1)[0]
+    for deal in bot.get("active_deals") or []:
+        if isinstance(deal, dict) and deal.get("from_currency"):
+            return str(deal["from_currency"])
+    return "unknown"
+
+
+def _metric_value(name: str, value: float) -> float | int:
+    """Round a summed metric for output, keeping counts as integers."""
+    return round(value) if name in COUNT_METRICS else round(float(value), 8)
+
+
+def load_bot_arrays(bots: list[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Load bot metrics and grouping labels into column arrays.
+
+    Args:
+        bots: Raw (unfiltered) bot dicts from ver1/bots
+
+    Returns:
+        Dict of float64 metric columns plus object arrays for each group key.
+    """
+    count = len(bots)
+    columns = {name: np.zeros(count, dtype=np.float64) for name in BOT_METRICS}
+    labels = {name: np.empty(count, dtype=object) for name in GROUP_KEYS}
+
+    for i, bot in enumerate(bots):
+        deals = [d for d in bot.get("active_deals") or [] if isinstance(d, dict)]
+        columns["finished_deals_profit_usd"][i] = to_float(
+            bot.get("finished_deals_profit_usd")
+        )
+        columns["finished_deals_count"][i] = to_float(bot.get("finished_deals_count"))
+        columns["active_deals_count"][i] = to_float(
+            bot.get("active_deals_count", len(deals))
+        )
+        columns["active_deals_usd_profit"][i] = to_float(
+            bot.get("active_deals_usd_profit")
+        )
+        columns["bought_volume"][i] = sum(
+            to_float(d.get("bought_volume")) for d in deals
+        )
+        columns["enabled_bots"][i] = 1.0 if bot.get("is_enabled") else 0.0
+
+        labels["account"][i] = str(
+            bot.get("account_name") or bot.get("account_id") or "unknown"
+        )
+        labels["strategy"][i] = str(bot.get("strategy") or "unknown")
+        labels["quote"][i] = bot_quote(bot)
+
+    return {**columns, **labels}
+
+
+def group_aggregates(
+    keys: np.ndarray, columns: Dict[str, np.ndarray]
+) -> list[Dict[str, Any]]:
+    """Sum every metric column per distinct key.
+
+    Uses np.unique with return_inverse and np.bincount, so each column is
+    aggregated in one vectorized pass regardless of the number of groups.
+    """
+    if keys.size == 0:
+        return []
+    groups, inverse = np.unique(keys.astype(str), return_inverse=True)
+    bot_counts = np.bincount(inverse, minlength=groups.size)
+    sums = {
+        name: np.bincount(inverse, weights=values, minlength=groups.size)
+        for name, values in columns.items()
+    }
+    return [
+        {
+            "key": str(group),
+            "bots": int(bot_counts[g]),
+            **{name: _metric_value(name, sums[name][g]) for name in columns},
+        }
+        for g, group in enumerate(groups)
+    ]
+
+
+def summarize_portfolio(
+    bots: list[Dict[str, Any]], group_by: tuple[str, ...] = GROUP_KEYS
+) -> Dict[str, Any]:
+    """Build a compact portfolio summary with totals and grouped aggregates.
+
+    Bought volume is denominated in each bot's quote currency, so it is only
+    reported per quote rather than summed into the USD totals.
+    """
+    arrays = load_bot_arrays(bots)
+    metrics = {name: arrays[name] for name in BOT_METRICS}
+    usd_metrics = {k: v for k, v in metrics.items() if k != "bought_volume"}
+
+    totals: Dict[str, Any] = {"bots": len(bots)}
+    totals.update(
+        {name: _metric_value(name, v.sum()) for name, v in usd_metrics.items()}
+    )
+    totals["total_profit_usd"] = round(
+        totals["finished_deals_profit_usd"] + totals["active_deals_usd_profit"], 8
+    )
+
+    summary: Dict[str, Any] = {"totals": totals, "groups": {}}
+    for key in group_by:
+        columns = metrics if key == "quote" else usd_metrics
+        summary["groups"][key] = group_aggregates(arrays[key], columns)
+    return summary
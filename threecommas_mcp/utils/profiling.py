@@ -0,0 +1,232 @@
+"""On-demand profiling of tool calls for 3Commas MCP
+
+Set 3COMMAS_PROFILE_RATE to a percentage (0-100) to profile that share of
+registered tool calls. Each sampled call runs under one of two profilers,
+chosen with 3COMMAS_PROFILER:
+
+- cprofile (default): deterministic cProfile. Aggregated stats per tool are
+  written to <tool>.prof in 3COMMAS_PROFILE_DIR (pstats format, readable
+  with `python -m pstats` or snakeviz).
+- sampling: a statistical stack sampler on a background thread (CPython's
+  sys._current_frames), with lower overhead on hot code. Aggregated sample
+  counts per tool are written to <tool>.samples.json.
+
+Stats found in the directory at start are loaded and added to, so they
+accumulate across restarts. One call is profiled at a time (cProfile allows
+a single active profiler per thread); calls arriving meanwhile run normally.
+Both profilers see everything the event loop runs while the call is in
+flight, including other tasks, so profile under representative load.
+"""
+
+import cProfile
+import json
+import logging
+import os
+import pstats
+import random
+import re
+import sys
+import threading
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict
+
+from .env import get_profile_dir, get_profile_rate, get_profiler_type
+
+logger = logging.getLogger(__name__)
+
+# Seconds between stack samples of the sampling profiler
+SAMPLE_INTERVAL = 0.001
+
+
+def _label(filename: str, line: int, function: str) -> str:
+    return f"{filename}:{line}({function})"
+
+
+class StackSampler:
+    """Counts the functions on one thread's stack at a fixed interval."""
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL) -> None:
+        self._thread_id = thread_id
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        # Function label -> [samples on top of the stack, samples anywhere]
+        self.samples: Dict[str, list[int]] = {}
+        self.total = 0
+
+    def _sample(self) -> None:
+        frame = sys._current_frames().get(self._thread_id)
+        if frame is None:
+            return
+        self.total += 1
+        seen: set[str] = set()
+        top = True
+        while frame is not None:
+            code = frame.f_code
+            label = _label(code.co_filename, code.co_firstlineno, code.co_name)
+            counts = self.samples.setdefault(label, [0, 0])
+            if top:
+                counts[0] += 1
+                top = False
+            # Recursive functions count once per sample
+            if label not in seen:
+                counts[1] += 1
+                seen.add(label)
+            frame = frame.f_back
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+
+class ToolProfiles:
+    """Aggregated profiles per tool, mirrored to files in the profile dir."""
+
+    def __init__(self) -> None:
+        self._cprofile: Dict[str, pstats.Stats] = {}
+        self._sampled: Dict[str, Dict[str, Any]] = {}
+        self._active = False
+        self.profiled_calls: Dict[str, int] = {}
+
+    @staticmethod
+    def _path(tool: str, suffix: str) -> str:
+        safe = re.sub(r"[^A-Za-z0-9_.-]", "_", tool)
+        return os.path.join(get_profile_dir(), f"{safe}{suffix}")
+
+    def _save_cprofile(self, tool: str, profile: cProfile.Profile) -> None:
+        path = self._path(tool, ".prof")
+        stats = self._cprofile.get(tool)
+        if stats is None:
+            stats = pstats.Stats(profile)
+            if os.path.exists(path):
+                try:
+                    stats.add(path)
+                except (OSError, EOFError, TypeError, ValueError) as e:
+                    logger.warning(f"Ignoring unreadable profile {path}: {e}")
+            self._cprofile[tool] = stats
+        else:
+            stats.add(profile)
+        stats.dump_stats(path)
+
+    def _save_samples(self, tool: str, sampler: StackSampler) -> None:
+        path = self._path(tool, ".samples.json")
+        aggregate = self._sampled.get(tool)
+        if aggregate is None:
+            aggregate = {"interval": sampler.interval, "total": 0, "functions": {}}
+            try:
+                with open(path, encoding="utf-8") as f:
+                    aggregate = json.load(f)
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable profile {path}: {e}")
+            self._sampled[tool] = aggregate
+        aggregate["total"] += sampler.total
+        functions = aggregate["functions"]
+        for label, (own, total) in sampler.samples.items():
+            counts = functions.setdefault(label, [0, 0])
+            counts[0] += own
+            counts[1] += total
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(aggregate, f)
+        os.replace(path + ".tmp", path)
+
+    async def profile(
+        self, tool: str, call: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Run a tool call, profiling it if it is sampled."""
+        rate = get_profile_rate()
+        if self._active or rate <= 0 or random.random() * 100 >= rate:
+            return await call()
+
+        self._active = True
+        sampling = get_profiler_type() == "sampling" and hasattr(sys, "_current_frames")
+        profile = cProfile.Profile() if not sampling else None
+        sampler = StackSampler(threading.get_ident()) if sampling else None
+        try:
+            if sampler is not None:
+                sampler.start()
+            elif profile is not None:
+                profile.enable()
+            return await call()
+        finally:
+            if sampler is not None:
+                sampler.stop()
+            elif profile is not None:
+                profile.disable()
+            self._active = False
+            self.profiled_calls[tool] = self.profiled_calls.get(tool, 0) + 1
+            try:
+                os.makedirs(get_profile_dir(), exist_ok=True)
+                if sampler is not None:
+                    self._save_samples(tool, sampler)
+                elif profile is not None:
+                    self._save_cprofile(tool, profile)
+            except OSError as e:
+                logger.warning(f"Could not save profile of {tool}: {e}")
+
+    def hotspots(
+        self, tool: str | None = None, limit: int = 20, sort: str = "self"
+    ) -> list[Dict[str, Any]]:
+        """Hottest functions of one tool (or all) by self or cumulative time."""
+        rows: Dict[str, Dict[str, Any]] = {}
+
+        def add(label: str, calls: int | None, own: float, cumulative: float) -> None:
+            row = rows.setdefault(
+                label,
+                {
+                    "function": label,
+                    "calls": None,
+                    "self_ms": 0.0,
+                    "cumulative_ms": 0.0,
+                },
+            )
+            if calls is not None:
+                row["calls"] = (row["calls"] or 0) + calls
+            row["self_ms"] += own * 1000
+            row["cumulative_ms"] += cumulative * 1000
+
+        for name, stats in self._cprofile.items():
+            if tool is None or name == tool:
+                for (filename, line, function), entry in stats.stats.items():  # type: ignore[attr-defined]
+                    _, calls, own, cumulative, _ = entry
+                    add(_label(filename, line, function), calls, own, cumulative)
+        for name, aggregate in self._sampled.items():
+            if tool is None or name == tool:
+                interval = aggregate.get("interval", SAMPLE_INTERVAL)
+                for label, (own, total) in aggregate["functions"].items():
+                    add(label, None, own * interval, total * interval)
+
+        key = "cumulative_ms" if sort == "cumulative" else "self_ms"
+        ranked = sorted(rows.values(), key=lambda row: -row[key])[:limit]
+        for row in ranked:
+            row["self_ms"] = round(row["self_ms"], 3)
+            row["cumulative_ms"] = round(row["cumulative_ms"], 3)
+        return ranked
+
+
+# Global tool profiles shared by all registered tools
+_tool_profiles = ToolProfiles()
+
+
+def profile_sampled_calls(
+    func: Callable[..., Awaitable[Dict[str, Any]]],
+) -> Callable[..., Awaitable[Dict[str, Any]]]:
+    """Decorator profiling a share of a tool's calls (see 3COMMAS_PROFILE_RATE)."""
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs) -> Dict[str, Any]:
+        return await _tool_profiles.profile(
+            func.__name__, lambda: func(*args, **kwargs)
+        )
+
+    return wrapper
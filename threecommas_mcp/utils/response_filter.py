@@ -7,8 +7,14 @@ while maintaining necessary context for different use cases.
 from typing import Any, Dict, Union
 import logging
 
+from .offload import _execution_policy, decode_response, response_body
+from .tracing import span
+
 logger = logging.getLogger(__name__)
 
+# Fields whose empty value is the answer (no violations) and is kept in display mode
+KEEP_EMPTY_FIELDS = frozenset({"violations"})
+
 
 def filter_response(data: Dict[str, Any], filter_type: str) -> Dict[str, Any]:
     """Filter API response based on use case requirements.
@@ -28,19 +34,46 @@ def filter_response(data: Dict[str, Any], filter_type: str) -> Dict[str, Any]:
             f"Invalid filter_type: {filter_type}. Must be 'full' or 'display'"
         )
 
-    # Always apply security filtering
-    filtered_data = _apply_security_filter(data.copy())
+    with span("filter", filter_type=filter_type):
+        # Always apply security filtering
+        with span("filter.security"):
+            filtered_data = _apply_security_filter(data.copy())
 
-    # Always apply redundant field removal for token efficiency
-    filtered_data = _remove_redundant_fields(filtered_data)
+        # Always apply redundant field removal for token efficiency
+        with span("filter.redundant_fields"):
+            filtered_data = _remove_redundant_fields(filtered_data)
 
-    # Apply additional filtering for display mode
-    if filter_type == "display":
-        filtered_data = _apply_display_filter(filtered_data)
+        # Apply additional filtering for display mode
+        if filter_type == "display":
+            with span("filter.display"):
+                filtered_data = _apply_display_filter(filtered_data)
 
     return filtered_data
 
 
+async def filter_api_response(data: Dict[str, Any], filter_type: str) -> Dict[str, Any]:
+    """Filter a response just received from the API (see filter_response).
+
+    Large responses are filtered in the worker pool instead of on the event
+    loop, by the size of the response body (see utils.offload).
+    """
+    body = response_body(data)
+    if body is None or not _execution_policy.offloads(len(body)):
+        return filter_response(data, filter_type)
+    if _execution_policy.pool == "process":
+        return await _execution_policy.run(
+            len(body), "filter", _decode_and_filter, body, filter_type
+        )
+    return await _execution_policy.run(
+        len(body), "filter", filter_response, data, filter_type
+    )
+
+
+def _decode_and_filter(body: bytes, filter_type: str) -> Dict[str, Any]:
+    # Runs in worker processes, which get the body rather than the decoded data
+    return filter_response(decode_response(body), filter_type)
+
+
 def _apply_security_filter(data: Dict[str, Any]) -> Dict[str, Any]:
     """Remove security-sensitive fields from response recursively.
 
@@ -105,6 +138,9 @@ def _remove_null_empty_fields(
     removed_count = 0
 
     for key, value in data.items():
+        if value == [] and key in KEEP_EMPTY_FIELDS:
+            cleaned_data[key] = value
+            continue
         if value is None or value == [] or value == {}:
             removed_count += 1
             continue
@@ -0,0 +1,91 @@
+"""Resource update notifications for 3Commas MCP
+
+FastMCP serves resources but does not route resource subscriptions, so this
+module installs the handlers on its low-level server:
+
+- 2026-07-28 clients open a `subscriptions/listen` stream; updates are
+  published on an in-process subscription bus and delivered on that stream.
+- Earlier clients call `resources/subscribe`; their connections are kept per
+  URI and sent `notifications/resources/updated` directly.
+"""
+
+import logging
+from typing import Any, Dict
+
+import anyio
+from mcp import types
+from mcp.server.subscriptions import (
+    InMemorySubscriptionBus,
+    ListenHandler,
+    ResourceUpdated,
+)
+
+from .lifecycle import on_shutdown
+
+logger = logging.getLogger(__name__)
+
+
+class ResourceSubscriptions:
+    """Subscribers to resource URIs and the fan-out of update notifications."""
+
+    def __init__(self) -> None:
+        self.bus = InMemorySubscriptionBus()
+        self._listen = ListenHandler(self.bus)
+        # Legacy subscribers per URI, keyed by id() of their connection
+        self._connections: Dict[str, Dict[int, Any]] = {}
+
+    def install(self, server: Any) -> None:
+        """Register subscription handlers on a low-level MCP server."""
+        server.add_request_handler(
+            "subscriptions/listen", types.SubscriptionsListenRequestParams, self._listen
+        )
+        server.add_request_handler(
+            "resources/subscribe", types.SubscribeRequestParams, self._subscribe
+        )
+        server.add_request_handler(
+            "resources/unsubscribe", types.UnsubscribeRequestParams, self._unsubscribe
+        )
+        on_shutdown(self.close)
+
+    @staticmethod
+    def _connection(ctx: Any) -> Any:
+        # Sessions are created per request; the connection lives as long as the client
+        return getattr(ctx.session, "_connection", None) or ctx.session
+
+    async def _subscribe(
+        self, ctx: Any, params: types.SubscribeRequestParams
+    ) -> types.EmptyResult:
+        connection = self._connection(ctx)
+        self._connections.setdefault(str(params.uri), {})[id(connection)] = connection
+        return types.EmptyResult()
+
+    async def _unsubscribe(
+        self, ctx: Any, params: types.UnsubscribeRequestParams
+    ) -> types.EmptyResult:
+        connection = self._connection(ctx)
+        self._connections.get(str(params.uri), {}).pop(id(connection), None)
+        return types.EmptyResult()
+
+    def subscribers(self, uri: str) -> int:
+        """Number of legacy subscriptions to a URI (listen streams not counted)."""
+        return len(self._connections.get(uri, {}))
+
+    async def resource_updated(self, uri: str) -> None:
+        """Notify listen streams and subscribed connections that a resource changed."""
+        await self.bus.publish(ResourceUpdated(uri=uri))
+        connections = self._connections.get(uri, {})
+        for key, connection in list(connections.items()):
+            try:
+                await connection.send_resource_updated(uri)
+            except (anyio.BrokenResourceError, anyio.ClosedResourceError) as e:
+                # The client went away; stop notifying it
+                logger.debug(f"Dropping subscriber of {uri}: {e}")
+                connections.pop(key, None)
+
+    async def close(self) -> None:
+        """End open listen streams (called on server shutdown)."""
+        self._listen.close()
+
+
+# Global resource subscriptions shared by all sessions
+_resource_subscriptions = ResourceSubscriptions()
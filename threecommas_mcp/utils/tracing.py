@@ -0,0 +1,208 @@
+"""Lightweight tracing for 3Commas MCP
+
+Nested spans with monotonic timings around the stages of a tool call:
+request validation, rate limiter admission, signing, the HTTP exchange,
+JSON decode and each response filter stage. Tracing is off by default, and
+while off a span is a shared no-op context manager. 3COMMAS_TRACE turns on
+one or both sinks (comma separated):
+
+- jsonl: one JSON object per finished span, appended to
+  3COMMAS_TRACE_FILE (default: traces.jsonl in the data directory)
+- otel: every span is also started as an OpenTelemetry span, nested under
+  the spans FastMCP opens for MCP requests, and exported by whatever
+  OpenTelemetry SDK the process is configured with (for example through
+  opentelemetry-instrument); without an SDK these spans are no-ops
+"""
+
+import inspect
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from contextlib import AbstractContextManager, ExitStack, contextmanager, nullcontext
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Iterator, TypeVar
+
+from .env import get_trace_file, get_trace_sinks
+from .lifecycle import on_shutdown
+
+logger = logging.getLogger(__name__)
+
+# Finished spans buffered before the JSONL file is appended to
+FLUSH_EVERY = 256
+
+
+class Span:
+    """One timed stage; attributes may be added until it ends."""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "attributes", "_otel")
+
+    def __init__(
+        self, name: str, parent: "Span | None", attributes: Dict[str, Any]
+    ) -> None:
+        self.name = name
+        self.trace_id: str = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id: str = secrets.token_hex(8)
+        self.parent_id: str | None = parent.span_id if parent else None
+        self.attributes = attributes
+        self._otel: Any = None
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+        if self._otel is not None:
+            for key, value in attributes.items():
+                self._otel.set_attribute(key, _otel_value(value))
+
+
+def _otel_value(value: Any) -> Any:
+    return value if isinstance(value, (str, bool, int, float)) else str(value)
+
+
+class JsonlSink:
+    """Appends finished spans to a JSONL file in batches."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lines: list[str] = []
+        self._lock = threading.Lock()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._lines.append(json.dumps(record, default=str))
+            full = len(self._lines) >= FLUSH_EVERY
+        # Flush whole traces, or when the buffer fills up
+        if full or record["parent_id"] is None:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            lines, self._lines = self._lines, []
+        if not lines:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+        except OSError as e:
+            logger.warning(f"Could not write traces to {self.path}: {e}")
+
+
+class Tracer:
+    """Creates spans and hands finished ones to the configured sinks."""
+
+    def __init__(self) -> None:
+        self._configured = False
+        self.enabled = False
+        self._jsonl: JsonlSink | None = None
+        self._otel: Any = None
+
+    def configure(self) -> None:
+        """Read the sinks from environment (done on first use)."""
+        sinks = get_trace_sinks()
+        self._jsonl = JsonlSink(get_trace_file()) if "jsonl" in sinks else None
+        self._otel = None
+        if "otel" in sinks:
+            try:
+                from opentelemetry import trace
+            except ImportError:
+                logger.warning("3COMMAS_TRACE=otel needs the opentelemetry-api package")
+            else:
+                self._otel = trace.get_tracer("threecommas_mcp")
+        self.enabled = self._jsonl is not None or self._otel is not None
+        if self._jsonl is not None:
+            on_shutdown(self.flush)
+        self._configured = True
+
+    def active(self) -> bool:
+        if not self._configured:
+            self.configure()
+        return self.enabled
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        parent = _current_span.get()
+        current = Span(name, parent, attributes)
+        with ExitStack() as stack:
+            if self._otel is not None:
+                current._otel = stack.enter_context(
+                    self._otel.start_as_current_span(
+                        name,
+                        attributes={k: _otel_value(v) for k, v in attributes.items()},
+                    )
+                )
+            token = _current_span.set(current)
+            start_wall = time.time()
+            start = time.perf_counter_ns()
+            try:
+                yield current
+            except BaseException as e:
+                current.set(error=type(e).__name__)
+                raise
+            finally:
+                duration_ns = time.perf_counter_ns() - start
+                _current_span.reset(token)
+                if self._jsonl is not None:
+                    self._jsonl.write(
+                        {
+                            "trace_id": current.trace_id,
+                            "span_id": current.span_id,
+                            "parent_id": current.parent_id,
+                            "name": name,
+                            "start": start_wall,
+                            "duration_ms": round(duration_ns / 1e6, 3),
+                            "attributes": current.attributes,
+                        }
+                    )
+
+    async def flush(self) -> None:
+        """Write buffered spans (called on server shutdown)."""
+        if self._jsonl is not None:
+            self._jsonl.flush()
+
+
+_current_span: ContextVar[Span | None] = ContextVar("_current_span", default=None)
+
+# Global tracer used by the instrumented stages
+_tracer = Tracer()
+
+# Returned for every span while tracing is off
+_NO_SPAN: AbstractContextManager[None] = nullcontext()
+
+
+def span(name: str, **attributes: Any) -> AbstractContextManager[Span | None]:
+    """Time a block as a span nested in the current one (no-op when off)."""
+    if not _tracer.active():
+        return _NO_SPAN
+    return _tracer.span(name, **attributes)
+
+
+T = TypeVar("T")
+
+
+def traced(
+    name: str, *arguments: str
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Decorator timing each call of an async function as a span.
+
+    The named arguments of the call are recorded as span attributes.
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            if not _tracer.active():
+                return await func(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            attributes = {arg: bound.arguments[arg] for arg in arguments}
+            with _tracer.span(name, **attributes):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator